@@ -8,7 +8,7 @@ from datetime import datetime
 from flask import Blueprint, request, jsonify, current_app, g
 from functools import wraps
 
-from modules.auth.auth_manager import create_auth_manager, UserRole
+from modules.auth.auth_manager import create_auth_manager, UserRole, BCRYPT_ROUNDS
 
 # Initialize Blueprint
 auth_bp = Blueprint('auth', __name__)
@@ -28,7 +28,8 @@ def init_auth_manager(app):
         'create_default_admin': app.config.get('CREATE_DEFAULT_ADMIN', False),
         'default_admin_username': app.config.get('DEFAULT_ADMIN_USERNAME'),
         'default_admin_password': app.config.get('DEFAULT_ADMIN_PASSWORD'),
-        'default_admin_email': app.config.get('DEFAULT_ADMIN_EMAIL')
+        'default_admin_email': app.config.get('DEFAULT_ADMIN_EMAIL'),
+        'bcrypt_rounds': app.config.get('BCRYPT_ROUNDS', BCRYPT_ROUNDS)
     }
     
     auth_manager = create_auth_manager(config)
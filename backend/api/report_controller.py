@@ -3,14 +3,35 @@
 
 import os
 import json
+import time
+import uuid
 import logging
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app, send_file
+from flask import Blueprint, request, jsonify, current_app, send_file, url_for
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize Blueprint
 report_bp = Blueprint('report', __name__)
 logger = logging.getLogger(__name__)
 
+# Reports are written off the request thread and polled via /status/<job_id>
+REPORT_WORKERS = 2
+report_executor = ThreadPoolExecutor(max_workers=REPORT_WORKERS)
+
+# Finished jobs are dropped once their status is reported, or after
+# REPORT_JOB_TTL seconds if nobody polls them
+REPORT_JOB_TTL = 3600
+MAX_REPORT_JOBS = 1000
+report_jobs = OrderedDict()  # Maps job_id to {'future', 'completed_at'}, oldest first
+report_jobs_lock = threading.Lock()
+
 @report_bp.route('/generate/<scan_id>', methods=['POST'])
 def generate_report(scan_id):
     """
@@ -28,46 +49,104 @@ def generate_report(scan_id):
     if scan_info['status'] not in ['completed', 'stopped']:
         return jsonify({'error': 'Cannot generate report for an incomplete scan'}), 400
     
-    try:
-        # Create report filename with timestamp
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        report_filename = f"securescout_report_{scan_id}_{timestamp}.json"
-        report_path = os.path.join(current_app.config['REPORTS_DIR'], report_filename)
-        
-        # Ensure reports directory exists
-        os.makedirs(current_app.config['REPORTS_DIR'], exist_ok=True)
-        
-        # Generate report data
-        report_data = {
-            'report_id': f"report_{scan_id}_{timestamp}",
-            'scan_id': scan_id,
-            'target_url': scan_info['target_url'],
-            'scan_type': scan_info['scan_type'],
-            'scan_modules': scan_info['modules'],
-            'start_time': scan_info['start_time'],
-            'end_time': datetime.utcnow().isoformat(),
-            'duration': get_elapsed_time(scan_info['start_time']),
-            'findings': scan_info['findings'],
-            'summary': generate_findings_summary(scan_info['findings']),
-            'generated_at': datetime.utcnow().isoformat()
-        }
-        
-        # Write report to file
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        
-        logger.info(f"Report generated for scan {scan_id}: {report_path}")
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Report generated successfully',
-            'report_id': report_data['report_id'],
-            'report_path': report_path
-        })
+    with report_jobs_lock:
+        prune_report_jobs()
+        if len(report_jobs) >= MAX_REPORT_JOBS:
+            return jsonify({'error': 'Too many report jobs in progress'}), 503
         
+        job_id = str(uuid.uuid4())
+        job = {'future': None, 'completed_at': None}
+        report_jobs[job_id] = job
+    
+    job['future'] = report_executor.submit(
+        write_report, scan_id, scan_info, current_app.config['REPORTS_DIR']
+    )
+    job['future'].add_done_callback(lambda _: job.update(completed_at=time.time()))
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Report generation started',
+        'job_id': job_id,
+        'status_url': url_for('report.get_report_status', job_id=job_id)
+    }), 202
+
+
+@report_bp.route('/status/<job_id>', methods=['GET'])
+def get_report_status(job_id):
+    """
+    Get the status of a report generation job
+    """
+    job = report_jobs.get(job_id)
+    if job is None or job['future'] is None:
+        return jsonify({'error': 'Report job not found'}), 404
+    
+    future = job['future']
+    if not future.done():
+        return jsonify({'job_id': job_id, 'status': 'running'})
+    
+    # The outcome is reported once; the job is not kept afterwards
+    with report_jobs_lock:
+        report_jobs.pop(job_id, None)
+    
+    try:
+        report_id, report_path = future.result()
     except Exception as e:
         logger.error(f"Error generating report: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return jsonify({'job_id': job_id, 'status': 'failed', 'error': str(e)}), 500
+    
+    return jsonify({
+        'job_id': job_id,
+        'status': 'completed',
+        'report_id': report_id,
+        'report_path': report_path
+    })
+
+
+def prune_report_jobs(now=None):
+    """Drop finished report jobs that completed more than REPORT_JOB_TTL seconds ago"""
+    now = time.time() if now is None else now
+    expired = [job_id for job_id, job in report_jobs.items()
+               if job['completed_at'] is not None and now - job['completed_at'] > REPORT_JOB_TTL]
+    for job_id in expired:
+        del report_jobs[job_id]
+
+
+def write_report(scan_id, scan_info, reports_dir):
+    """Write the JSON report for a scan and return its report ID and path"""
+    # Create report filename with timestamp
+    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    report_filename = f"securescout_report_{scan_id}_{timestamp}.json"
+    report_path = os.path.join(reports_dir, report_filename)
+    
+    # Ensure reports directory exists
+    os.makedirs(reports_dir, exist_ok=True)
+    
+    # Generate report data
+    report_data = {
+        'report_id': f"report_{scan_id}_{timestamp}",
+        'scan_id': scan_id,
+        'target_url': scan_info['target_url'],
+        'scan_type': scan_info['scan_type'],
+        'scan_modules': scan_info['modules'],
+        'start_time': scan_info['start_time'],
+        'end_time': datetime.utcnow().isoformat(),
+        'duration': get_elapsed_time(scan_info['start_time']),
+        'findings': scan_info['findings'],
+        'summary': generate_findings_summary(scan_info['findings']),
+        'generated_at': datetime.utcnow().isoformat()
+    }
+    
+    # Write report to file
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, 'w') as f:
+            json.dump(report_data, f, indent=2)
+    
+    logger.info(f"Report generated for scan {scan_id}: {report_path}")
+    
+    return report_data['report_id'], report_path
 
 
 @report_bp.route('/list', methods=['GET'])
@@ -167,33 +246,18 @@ def get_elapsed_time(start_time_iso):
 
 def generate_findings_summary(findings):
     """Generate a summary of findings by severity and category"""
+    severities = Counter(finding.get('severity', 'info').lower() for finding in findings)
+    categories = Counter(finding.get('category', 'Other') for finding in findings)
+    
+    # Count by severity, folding unknown severities into info
     severity_counts = {
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0,
-        'info': 0
+        severity: severities.pop(severity, 0)
+        for severity in ('critical', 'high', 'medium', 'low', 'info')
     }
-    
-    category_counts = {}
-    
-    for finding in findings:
-        # Count by severity
-        severity = finding.get('severity', 'info').lower()
-        if severity in severity_counts:
-            severity_counts[severity] += 1
-        else:
-            severity_counts['info'] += 1
-        
-        # Count by category
-        category = finding.get('category', 'Other')
-        if category in category_counts:
-            category_counts[category] += 1
-        else:
-            category_counts[category] = 1
+    severity_counts['info'] += sum(severities.values())
     
     return {
         'total_findings': len(findings),
         'by_severity': severity_counts,
-        'by_category': category_counts
+        'by_category': dict(categories)
     }
\ No newline at end of file
@@ -2,20 +2,20 @@
 # SecureScout - Scan Controller API
 
 import os
-import uuid
 import logging
-from datetime import datetime
 from flask import Blueprint, request, jsonify, current_app, g
 from api.auth_controller import auth_required
+from modules.core.scan_service import ScanService, get_elapsed_time
 
 # Initialize Blueprint
 scan_bp = Blueprint('scan', __name__)
 logger = logging.getLogger(__name__)
 
 # Mock database for development (will be replaced with actual DB)
-active_scans = {}
-scan_history = []
-scan_ownership = {}  # Maps scan_id to user_id
+scan_service = ScanService()
+active_scans = scan_service.active_scans
+scan_history = scan_service.scan_history
+scan_ownership = scan_service.scan_ownership  # Maps scan_id to user_id
 
 @scan_bp.route('/start', methods=['POST'])
 @auth_required('scan:create')
@@ -25,63 +25,15 @@ def start_scan():
     Requires 'scan:create' permission
     """
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'target_url' not in data:
-            return jsonify({'error': 'Target URL is required'}), 400
-        
-        # Generate unique scan ID
-        scan_id = str(uuid.uuid4())
-        
-        # Default scan configuration with overrides from request
-        scan_config = {
-            'id': scan_id,
-            'target_url': data['target_url'],
-            'scan_type': data.get('scan_type', 'comprehensive'),
-            'modules': data.get('modules', ['discovery', 'authentication', 'injection', 'xss', 'csrf']),
-            'max_depth': data.get('max_depth', 3),
-            'max_pages': data.get('max_pages', 100),
-            'threads': min(data.get('threads', current_app.config['DEFAULT_THREAD_COUNT']), 
-                           current_app.config['MAX_THREAD_COUNT']),
-            'request_delay': data.get('request_delay', current_app.config['DEFAULT_REQUEST_DELAY']),
-            'jitter': data.get('jitter', current_app.config['DEFAULT_JITTER']),
-            'user_agent_rotation': data.get('user_agent_rotation', 
-                                           current_app.config['DEFAULT_USER_AGENT_ROTATION']),
-            'ip_rotation': data.get('ip_rotation', current_app.config['DEFAULT_IP_ROTATION']),
-            'custom_headers': data.get('custom_headers', {}),
-            'custom_cookies': data.get('custom_cookies', {}),
-            'authentication': data.get('authentication', None),
-            'start_time': datetime.utcnow().isoformat(),
-            'status': 'initializing',
-            'progress': 0,
-            'findings': []
-        }
-        
-        # Store scan information
-        active_scans[scan_id] = scan_config
-        scan_history.append({
-            'id': scan_id,
-            'target_url': data['target_url'],
-            'scan_type': scan_config['scan_type'],
-            'start_time': scan_config['start_time'],
-            'status': 'initializing',
-            'owner': g.user.username
-        })
-
-        # Store scan ownership
-        scan_ownership[scan_id] = g.user.id
-        
-        # TODO: Queue the actual scan job with Celery
-        # For now, just update the status
-        active_scans[scan_id]['status'] = 'queued'
-        
-        logger.info(f"Scan {scan_id} initialized for target {data['target_url']}")
+        try:
+            scan_config = scan_service.start(g.user, request.get_json(), current_app.config)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         return jsonify({
             'status': 'success',
             'message': 'Scan initiated successfully',
-            'scan_id': scan_id,
+            'scan_id': scan_config['id'],
             'config': scan_config
         }), 201
         
@@ -97,6 +49,26 @@ def get_scan_status(scan_id):
     Get the current status of a running scan
     Requires 'scan:read' permission
     """
+    if scan_id not in active_scans:
+        return jsonify({'error': 'Scan not found'}), 404
+
+    # Check if user has access to this scan
+    if not check_scan_access(scan_id):
+        return jsonify({'error': 'Access denied to this scan'}), 403
+
+    return jsonify(scan_service.status(scan_id))
+
+
+@scan_bp.route('/summary/<scan_id>', methods=['GET'])
+@auth_required('scan:read')
+def get_scan_summary(scan_id):
+    """
+    Get status, findings and modules of a scan in a single call,
+    optionally generating its report with ?generate_report=1
+    Requires 'scan:read' permission
+    """
+    from api.report_controller import generate_findings_summary, write_report
+
     if scan_id not in active_scans:
         return jsonify({'error': 'Scan not found'}), 404
 
@@ -106,15 +78,31 @@ def get_scan_status(scan_id):
 
     scan_info = active_scans[scan_id]
     
-    return jsonify({
+    summary = {
         'scan_id': scan_id,
         'status': scan_info['status'],
         'progress': scan_info['progress'],
         'target_url': scan_info['target_url'],
         'start_time': scan_info['start_time'],
         'elapsed_time': get_elapsed_time(scan_info['start_time']),
-        'findings_count': len(scan_info['findings'])
-    })
+        'modules_executed': scan_info['modules'],
+        'findings': scan_info['findings'],
+        'summary': generate_findings_summary(scan_info['findings'])
+    }
+    
+    if request.args.get('generate_report'):
+        if scan_info['status'] not in ['completed', 'stopped']:
+            return jsonify({'error': 'Cannot generate report for an incomplete scan'}), 400
+        
+        try:
+            summary['report_id'], summary['report_path'] = write_report(
+                scan_id, scan_info, current_app.config['REPORTS_DIR']
+            )
+        except Exception as e:
+            logger.error(f"Error generating report: {str(e)}")
+            return jsonify({'error': str(e)}), 500
+    
+    return jsonify(summary)
 
 
 @scan_bp.route('/list', methods=['GET'])
@@ -207,13 +195,6 @@ def delete_scan(scan_id):
     })
 
 
-def get_elapsed_time(start_time_iso):
-    """Calculate elapsed time from ISO format start time to now"""
-    start_time = datetime.fromisoformat(start_time_iso)
-    elapsed = datetime.utcnow() - start_time
-    return str(elapsed).split('.')[0]  # Remove microseconds
-
-
 def check_scan_access(scan_id):
     """
     Check if the current user has access to the scan
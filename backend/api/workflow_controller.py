@@ -6,11 +6,14 @@ import sys
 import json
 import logging
 import uuid
+from collections import Counter
 from typing import Dict, List, Any, Optional, Union
 from flask import Blueprint, request, jsonify, current_app
 
 # Add parent directory to path to allow importing modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+_PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 
 # Import workflow orchestrator
 from modules.integrations.workflow_orchestrator import (
@@ -560,29 +563,18 @@ def get_workflow_results(workflow_id):
                 "message": f"Workflow not completed: {workflow_id}, current status: {workflow.status}"
             }), 400
         
-        # Get findings count
-        finding_count = 0
-        for task in workflow.tasks:
-            if task.result:
-                finding_count += len(task.result.parsed_findings)
-        
-        # Get severity counts
+        # Get findings count and severity counts in one pass
+        severities = Counter(
+            finding.get("severity", "unknown").lower()
+            for task in workflow.tasks if task.result
+            for finding in task.result.parsed_findings
+        )
+        finding_count = sum(severities.values())
         severity_counts = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0,
-            "unknown": 0
+            severity: severities[severity]
+            for severity in ("critical", "high", "medium", "low", "info", "unknown")
         }
         
-        for task in workflow.tasks:
-            if task.result:
-                for finding in task.result.parsed_findings:
-                    severity = finding.get("severity", "unknown").lower()
-                    if severity in severity_counts:
-                        severity_counts[severity] += 1
-        
         # Get task results
         task_results = []
         for task in workflow.tasks:
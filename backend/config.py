@@ -51,6 +51,7 @@ class Config:
     PASSWORD_REQUIRE_LOWERCASE = os.environ.get('PASSWORD_REQUIRE_LOWERCASE', 'true').lower() == 'true'
     PASSWORD_REQUIRE_NUMBERS = os.environ.get('PASSWORD_REQUIRE_NUMBERS', 'true').lower() == 'true'
     PASSWORD_REQUIRE_SPECIAL = os.environ.get('PASSWORD_REQUIRE_SPECIAL', 'true').lower() == 'true'
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
 
     # Account security
     MAX_LOGIN_ATTEMPTS = int(os.environ.get('MAX_LOGIN_ATTEMPTS', 5))
@@ -68,6 +69,7 @@ class TestingConfig(Config):
     DEBUG = False
     TESTING = True
     DATABASE_URI = 'sqlite:///:memory:'
+    BCRYPT_ROUNDS = 4  # Minimum cost; tests don't need production hardness
 
 
 class ProductionConfig(Config):
@@ -10,6 +10,9 @@ import logging
 import hashlib
 import secrets
 import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union, Tuple
 import bcrypt
 from dataclasses import dataclass, field, asdict
@@ -18,6 +21,13 @@ from enum import Enum, auto
 # Configure logging
 logger = logging.getLogger("securescout.auth")
 
+# Default bcrypt cost factor for password hashes
+BCRYPT_ROUNDS = 12
+
+# Decoded token payloads kept by each TokenManager to skip re-verifying
+# signatures of tokens presented repeatedly within their lifetime
+TOKEN_CACHE_SIZE = 4096
+
 class UserRole(Enum):
     """User role enumeration with associated permissions."""
     ADMIN = auto()        # Full system access
@@ -26,36 +36,46 @@ class UserRole(Enum):
     VIEWER = auto()       # Can only view scan results and reports
     API = auto()          # API access only, limited to specific endpoints
 
-    def get_permissions(self) -> List[str]:
+    def get_permissions(self) -> Tuple[str, ...]:
         """Get permissions associated with this role."""
-        permissions = {
-            UserRole.ADMIN: [
-                'scan:create', 'scan:read', 'scan:update', 'scan:delete',
-                'user:create', 'user:read', 'user:update', 'user:delete',
-                'report:create', 'report:read', 'report:update', 'report:delete',
-                'system:read', 'system:update'
-            ],
-            UserRole.MANAGER: [
-                'scan:create', 'scan:read', 'scan:update', 'scan:delete',
-                'user:create', 'user:read', 'user:update',
-                'report:create', 'report:read', 'report:update', 'report:delete',
-                'system:read'
-            ],
-            UserRole.ANALYST: [
-                'scan:create', 'scan:read', 'scan:update',
-                'report:create', 'report:read', 'report:update',
-                'system:read'
-            ],
-            UserRole.VIEWER: [
-                'scan:read',
-                'report:read'
-            ],
-            UserRole.API: [
-                'scan:create', 'scan:read',
-                'report:read'
-            ]
-        }
-        return permissions.get(self, [])
+        return ROLE_PERMISSIONS.get(self, ())
+
+    def has_permission(self, permission: str) -> bool:
+        """Check whether this role grants a permission."""
+        return permission in _ROLE_PERMISSION_SETS.get(self, ())
+
+# Permissions granted to each role, built once at import and never mutated
+ROLE_PERMISSIONS = {
+    UserRole.ADMIN: (
+        'scan:create', 'scan:read', 'scan:update', 'scan:delete',
+        'user:create', 'user:read', 'user:update', 'user:delete',
+        'report:create', 'report:read', 'report:update', 'report:delete',
+        'system:read', 'system:update'
+    ),
+    UserRole.MANAGER: (
+        'scan:create', 'scan:read', 'scan:update', 'scan:delete',
+        'user:create', 'user:read', 'user:update',
+        'report:create', 'report:read', 'report:update', 'report:delete',
+        'system:read'
+    ),
+    UserRole.ANALYST: (
+        'scan:create', 'scan:read', 'scan:update',
+        'report:create', 'report:read', 'report:update',
+        'system:read'
+    ),
+    UserRole.VIEWER: (
+        'scan:read',
+        'report:read'
+    ),
+    UserRole.API: (
+        'scan:create', 'scan:read',
+        'report:read'
+    )
+}
+
+_ROLE_PERMISSION_SETS = {
+    role: frozenset(permissions) for role, permissions in ROLE_PERMISSIONS.items()
+}
 
 @dataclass
 class User:
@@ -97,7 +117,7 @@ class User:
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission."""
-        return permission in self.role.get_permissions()
+        return self.role.has_permission(permission)
     
     def is_locked(self) -> bool:
         """Check if the user account is locked."""
@@ -203,6 +223,8 @@ class TokenManager:
         self.algorithm = algorithm
         self.issuer = issuer
         self.blacklisted_tokens = set()
+        self.token_cache = OrderedDict()  # Maps token to decoded payload, LRU order
+        self.token_cache_lock = threading.Lock()
     
     def generate_access_token(self, user_id: str, permissions: List[str] = None) -> str:
         """
@@ -270,6 +292,16 @@ class TokenManager:
             if token in self.blacklisted_tokens:
                 return False, {}, "Token has been revoked"
             
+            # Reuse a previously verified payload while it has not expired
+            with self.token_cache_lock:
+                payload = self.token_cache.get(token)
+                if payload is not None:
+                    if payload['exp'] <= time.time():
+                        del self.token_cache[token]
+                        return False, {}, "Token has expired"
+                    self.token_cache.move_to_end(token)
+                    return True, dict(payload), ""
+            
             # Decode and validate token
             payload = jwt.decode(
                 token,
@@ -278,7 +310,12 @@ class TokenManager:
                 options={"verify_signature": True, "verify_exp": True}
             )
             
-            return True, payload, ""
+            with self.token_cache_lock:
+                self.token_cache[token] = payload
+                if len(self.token_cache) > TOKEN_CACHE_SIZE:
+                    self.token_cache.popitem(last=False)
+            
+            return True, dict(payload), ""
             
         except jwt.ExpiredSignatureError:
             return False, {}, "Token has expired"
@@ -293,6 +330,8 @@ class TokenManager:
             token: JWT token to blacklist
         """
         self.blacklisted_tokens.add(token)
+        with self.token_cache_lock:
+            self.token_cache.pop(token, None)
         
         # In a real implementation, you would store this in a database
         # and periodically clean up expired tokens
@@ -336,6 +375,7 @@ class UserManager:
         """
         self.config = config or {}
         self.users = {}  # In-memory user storage (use a database in production)
+        self.api_key_index = {}  # Maps API key hashes to (user, key metadata, expiry epoch seconds)
         self.password_policy = PasswordPolicy(
             min_length=self.config.get('password_min_length', 12),
             require_uppercase=self.config.get('password_require_uppercase', True),
@@ -343,6 +383,7 @@ class UserManager:
             require_numbers=self.config.get('password_require_numbers', True),
             require_special=self.config.get('password_require_special', True)
         )
+        self.bcrypt_rounds = self.config.get('bcrypt_rounds', BCRYPT_ROUNDS)
         
         # Set up default admin user if configured
         self._setup_default_admin()
@@ -379,26 +420,9 @@ class UserManager:
         Returns:
             Tuple of (success, user_object, message)
         """
-        # Validate username
-        if not self._validate_username(username):
-            return False, None, "Invalid username format"
-        
-        # Check if username already exists
-        if username in self.users:
-            return False, None, "Username already exists"
-        
-        # Validate email
-        if not self._validate_email(email):
-            return False, None, "Invalid email format"
-        
-        # Check if email already exists
-        if any(user.email == email for user in self.users.values()):
-            return False, None, "Email already exists"
-        
-        # Validate password against policy
-        valid_password, password_message = self.password_policy.validate(password)
-        if not valid_password:
-            return False, None, password_message
+        error = self._check_new_user(username, email, password)
+        if error:
+            return False, None, error
         
         # Hash password
         password_hash = self._hash_password(password)
@@ -420,6 +444,83 @@ class UserManager:
         
         return True, user, "User created successfully"
     
+    def create_users(self, specs: List[Tuple[str, str, str, UserRole]]) -> Tuple[bool, List[User], str]:
+        """
+        Create several users at once, hashing their passwords in parallel.
+        
+        Either every user is created or, if any spec is rejected, none are.
+        
+        Args:
+            specs: (username, email, password, role) tuples
+            
+        Returns:
+            Tuple of (success, user_objects in spec order, message)
+        """
+        usernames = set()
+        emails = set()
+        for username, email, password, _ in specs:
+            error = self._check_new_user(username, email, password)
+            if not error and username in usernames:
+                error = "Username already exists"
+            if not error and email in emails:
+                error = "Email already exists"
+            if error:
+                return False, [], f"{username}: {error}"
+            usernames.add(username)
+            emails.add(email)
+        
+        # bcrypt releases the GIL, so hashes run concurrently across threads
+        with ThreadPoolExecutor(max_workers=max(1, min(len(specs), os.cpu_count() or 1))) as executor:
+            password_hashes = list(executor.map(self._hash_password,
+                                                [spec[2] for spec in specs]))
+        
+        users = [
+            User(
+                id=str(uuid.uuid4()),
+                username=username,
+                email=email,
+                password_hash=password_hash,
+                role=role
+            )
+            for (username, email, _, role), password_hash in zip(specs, password_hashes)
+        ]
+        
+        # Store users
+        for user in users:
+            self.users[user.username] = user
+        
+        return True, users, f"{len(users)} users created successfully"
+    
+    def _check_new_user(self, username: str, email: str, password: str) -> Optional[str]:
+        """
+        Check the details of a user about to be created.
+        
+        Returns:
+            Error message, or None if the user can be created
+        """
+        # Validate username
+        if not self._validate_username(username):
+            return "Invalid username format"
+        
+        # Check if username already exists
+        if username in self.users:
+            return "Username already exists"
+        
+        # Validate email
+        if not self._validate_email(email):
+            return "Invalid email format"
+        
+        # Check if email already exists
+        if any(user.email == email for user in self.users.values()):
+            return "Email already exists"
+        
+        # Validate password against policy
+        valid_password, password_message = self.password_policy.validate(password)
+        if not valid_password:
+            return password_message
+        
+        return None
+    
     def authenticate_user(self, username: str, password: str) -> Tuple[bool, Optional[User], str]:
         """
         Authenticate a user with username and password.
@@ -481,19 +582,20 @@ class UserManager:
         # Hash the provided API key
         api_key_hash = APIKeyManager.hash_api_key(api_key)
         
-        # Search for matching API key
-        for user in self.users.values():
-            for key in user.api_keys:
-                if key['hash'] == api_key_hash and key['active']:
-                    # Check if API key has expired
-                    if 'expires_at' in key and key['expires_at']:
-                        expiry = datetime.datetime.fromisoformat(key['expires_at'])
-                        if datetime.datetime.utcnow() > expiry:
-                            return False, None, "API key has expired"
-                    
-                    return True, user, "API key authentication successful"
-        
-        return False, None, "Invalid API key"
+        # Look up the matching API key
+        entry = self.api_key_index.get(api_key_hash)
+        if entry is None:
+            return False, None, "Invalid API key"
+        
+        user, key, expires_at = entry
+        if not key['active']:
+            return False, None, "Invalid API key"
+        
+        # Check if API key has expired
+        if expires_at is not None and time.time() > expires_at:
+            return False, None, "API key has expired"
+        
+        return True, user, "API key authentication successful"
     
     def verify_mfa(self, user: User, mfa_code: str) -> bool:
         """
@@ -535,16 +637,17 @@ class UserManager:
         api_key_hash = APIKeyManager.hash_api_key(api_key)
         
         # Calculate expiry date if needed
+        now = datetime.datetime.utcnow()
         expires_at = None
         if expires_in_days is not None:
-            expires_at = datetime.datetime.utcnow() + datetime.timedelta(days=expires_in_days)
+            expires_at = now + datetime.timedelta(days=expires_in_days)
         
         # Create key metadata
         key_metadata = {
             'id': str(uuid.uuid4()),
             'name': name,
             'hash': api_key_hash,
-            'created_at': datetime.datetime.utcnow().isoformat(),
+            'created_at': now.isoformat(),
             'expires_at': expires_at.isoformat() if expires_at else None,
             'active': True,
             'last_used': None
@@ -552,6 +655,11 @@ class UserManager:
         
         # Add to user's API keys
         user.api_keys.append(key_metadata)
+        # Index the expiry as epoch seconds so authentication only compares numbers
+        expiry_epoch = None
+        if expires_at is not None:
+            expiry_epoch = expires_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+        self.api_key_index[api_key_hash] = (user, key_metadata, expiry_epoch)
         
         # Return the API key and metadata
         # Note: This is the only time the full API key will be available
@@ -571,6 +679,7 @@ class UserManager:
         for key in user.api_keys:
             if key['id'] == key_id:
                 key['active'] = False
+                self.api_key_index.pop(key['hash'], None)
                 return True
         
         return False
@@ -755,8 +864,10 @@ class UserManager:
         if username not in self.users:
             return False, "User not found"
         
-        # Remove user
-        del self.users[username]
+        # Remove user and their API keys
+        user = self.users.pop(username)
+        for key in user.api_keys:
+            self.api_key_index.pop(key['hash'], None)
         
         return True, "User deleted successfully"
     
@@ -771,7 +882,7 @@ class UserManager:
             Hashed password
         """
         # Generate a salt and hash the password
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
         hashed_password = bcrypt.hashpw(password.encode(), salt)
         
         return hashed_password.decode()
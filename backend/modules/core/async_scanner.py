@@ -9,6 +9,7 @@ import logging
 import aiohttp
 import uuid
 import ujson as json
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Set, Tuple, Any, Optional, Callable, Union
 from urllib.parse import urlparse, urljoin, urldefrag
@@ -867,20 +868,12 @@ class AsyncScannerEngine:
     
     def _count_findings_by_severity(self) -> Dict[str, int]:
         """Count findings by severity level."""
-        severity_counts = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0,
-            'info': 0
-        }
-        
-        for finding in self.state.findings:
-            severity = finding.get('severity', 'info').lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        counts = Counter(finding.get('severity', 'info').lower() for finding in self.state.findings)
         
-        return severity_counts
+        return {
+            severity: counts[severity]
+            for severity in ('critical', 'high', 'medium', 'low', 'info')
+        }
     
     async def stop(self):
         """Stop the scan."""
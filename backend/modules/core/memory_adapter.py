@@ -6,11 +6,19 @@ import json
 import logging
 import sqlite3
 import datetime
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Callable, Tuple
 
 # Configure logging
 logger = logging.getLogger("securescout.memory")
 
+# Keys per IN (...) query, kept under SQLite's bound parameter limit
+GET_MANY_BATCH_SIZE = 500
+
+# Built-in value (de)serializers by name
+SERIALIZERS = {
+    'json': (json.dumps, json.loads),
+}
+
 class MemoryAdapter:
     """
     Memory adapter for storing and retrieving Claude Taskmaster compatible memory entries.
@@ -18,14 +26,27 @@ class MemoryAdapter:
     and the frontend taskmaster integration.
     """
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, durable: bool = True,
+                 serializer: Union[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = 'json'):
         """
         Initialize the memory adapter.
         
         Args:
             db_path: Path to SQLite database file. If None, uses in-memory database.
+            durable: If False, skip fsyncs and keep the journal in memory. Writes are
+                much faster but may be lost on a crash; intended for tests.
+            serializer: Name of a built-in value serializer, or a (dumps, loads)
+                pair. A database must always be opened with the serializer it
+                was written with.
         """
+        if isinstance(serializer, str):
+            if serializer not in SERIALIZERS:
+                raise ValueError(f"Unknown serializer: {serializer}")
+            serializer = SERIALIZERS[serializer]
+        
         self.db_path = db_path or ':memory:'
+        self.durable = durable
+        self._dumps, self._loads = serializer
         self.conn = None
         self._init_db()
     
@@ -35,6 +56,10 @@ class MemoryAdapter:
             self.conn = sqlite3.connect(self.db_path)
             cursor = self.conn.cursor()
             
+            if not self.durable:
+                cursor.execute('PRAGMA synchronous=OFF')
+                cursor.execute('PRAGMA journal_mode=MEMORY')
+            
             # Create memory table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS memory (
@@ -71,7 +96,7 @@ class MemoryAdapter:
         
         Args:
             key: Memory key
-            value: Memory value (will be serialized to JSON)
+            value: Memory value (will be serialized)
             
         Returns:
             True if successful, False otherwise
@@ -79,8 +104,8 @@ class MemoryAdapter:
         self._ensure_connection()
         
         try:
-            # Serialize value to JSON
-            json_value = json.dumps(value)
+            # Serialize value
+            serialized_value = self._dumps(value)
             
             now = datetime.datetime.utcnow().isoformat()
             
@@ -90,7 +115,7 @@ class MemoryAdapter:
                 INSERT OR REPLACE INTO memory (key, value, created_at, updated_at)
                 VALUES (?, ?, ?, ?)
                 ''',
-                (key, json_value, now, now)
+                (key, serialized_value, now, now)
             )
             
             self.conn.commit()
@@ -99,6 +124,35 @@ class MemoryAdapter:
             logger.error(f"Error setting memory key '{key}': {e}")
             return False
     
+    def set_many(self, items: Dict[str, Any]) -> bool:
+        """
+        Set multiple memory values in a single transaction.
+        
+        Args:
+            items: Mapping of memory keys to values (serialized)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        self._ensure_connection()
+        
+        try:
+            now = datetime.datetime.utcnow().isoformat()
+            rows = [(key, self._dumps(value), now, now) for key, value in items.items()]
+            
+            with self.conn:
+                self.conn.executemany(
+                    '''
+                    INSERT OR REPLACE INTO memory (key, value, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ''',
+                    rows
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error setting {len(items)} memory keys: {e}")
+            return False
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Get a memory value.
@@ -119,13 +173,43 @@ class MemoryAdapter:
             if not row:
                 return None
             
-            # Deserialize JSON
-            value = json.loads(row[0])
+            # Deserialize value
+            value = self._loads(row[0])
             return value
         except Exception as e:
             logger.error(f"Error getting memory key '{key}': {e}")
             return None
     
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple memory values.
+        
+        Args:
+            keys: Memory keys
+            
+        Returns:
+            Dictionary of the deserialized values for the keys that exist
+        """
+        self._ensure_connection()
+        
+        try:
+            values = {}
+            cursor = self.conn.cursor()
+            
+            for start in range(0, len(keys), GET_MANY_BATCH_SIZE):
+                batch = keys[start:start + GET_MANY_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                cursor.execute(
+                    f'SELECT key, value FROM memory WHERE key IN ({placeholders})',
+                    batch
+                )
+                values.update((key, self._loads(value)) for key, value in cursor.fetchall())
+            
+            return values
+        except Exception as e:
+            logger.error(f"Error getting {len(keys)} memory keys: {e}")
+            return {}
+    
     def delete(self, key: str) -> bool:
         """
         Delete a memory value.
@@ -148,6 +232,29 @@ class MemoryAdapter:
             logger.error(f"Error deleting memory key '{key}': {e}")
             return False
     
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete multiple memory values in a single transaction.
+        
+        Args:
+            keys: Memory keys
+            
+        Returns:
+            Number of values deleted
+        """
+        self._ensure_connection()
+        
+        try:
+            with self.conn:
+                cursor = self.conn.executemany(
+                    'DELETE FROM memory WHERE key = ?',
+                    [(key,) for key in keys]
+                )
+            return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Error deleting {len(keys)} memory keys: {e}")
+            return 0
+    
     def list_keys(self, prefix: Optional[str] = None) -> List[str]:
         """
         List all memory keys, optionally filtered by prefix.
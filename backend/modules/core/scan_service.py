@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# SecureScout - Scan Service
+
+import uuid
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Mapping
+
+# Configure logging
+logger = logging.getLogger("securescout.scan_service")
+
+# Modules run when a scan request does not name any
+DEFAULT_SCAN_MODULES = ['discovery', 'authentication', 'injection', 'xss', 'csrf']
+
+class ScanService:
+    """
+    In-memory registry of scans and the rules for starting them.
+
+    The scan controller exposes this over HTTP; keeping the logic here lets it
+    be used and tested without a Flask request context.
+    """
+
+    def __init__(self):
+        """Initialize an empty scan registry."""
+        self.active_scans = {}
+        self.scan_history = []
+        self.scan_ownership = {}  # Maps scan_id to user_id
+
+    def start(self, user, data: Dict[str, Any], settings: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Register a new scan.
+
+        Args:
+            user: User starting the scan
+            data: Requested scan parameters; 'target_url' is required
+            settings: Application settings providing the DEFAULT_* and
+                MAX_THREAD_COUNT values
+
+        Returns:
+            The scan configuration
+
+        Raises:
+            ValueError: If the target URL is missing
+        """
+        if not data or 'target_url' not in data:
+            raise ValueError('Target URL is required')
+
+        # Generate unique scan ID
+        scan_id = str(uuid.uuid4())
+
+        # Default scan configuration with overrides from request
+        scan_config = {
+            'id': scan_id,
+            'target_url': data['target_url'],
+            'scan_type': data.get('scan_type', 'comprehensive'),
+            'modules': data.get('modules', list(DEFAULT_SCAN_MODULES)),
+            'max_depth': data.get('max_depth', 3),
+            'max_pages': data.get('max_pages', 100),
+            'threads': min(data.get('threads', settings['DEFAULT_THREAD_COUNT']),
+                           settings['MAX_THREAD_COUNT']),
+            'request_delay': data.get('request_delay', settings['DEFAULT_REQUEST_DELAY']),
+            'jitter': data.get('jitter', settings['DEFAULT_JITTER']),
+            'user_agent_rotation': data.get('user_agent_rotation',
+                                           settings['DEFAULT_USER_AGENT_ROTATION']),
+            'ip_rotation': data.get('ip_rotation', settings['DEFAULT_IP_ROTATION']),
+            'custom_headers': data.get('custom_headers', {}),
+            'custom_cookies': data.get('custom_cookies', {}),
+            'authentication': data.get('authentication', None),
+            'start_time': datetime.utcnow().isoformat(),
+            'status': 'initializing',
+            'progress': 0,
+            'findings': []
+        }
+
+        # Store scan information
+        self.active_scans[scan_id] = scan_config
+        self.scan_history.append({
+            'id': scan_id,
+            'target_url': data['target_url'],
+            'scan_type': scan_config['scan_type'],
+            'start_time': scan_config['start_time'],
+            'status': 'initializing',
+            'owner': user.username
+        })
+
+        # Store scan ownership
+        self.scan_ownership[scan_id] = user.id
+
+        # TODO: Queue the actual scan job with Celery
+        # For now, just update the status
+        scan_config['status'] = 'queued'
+
+        logger.info(f"Scan {scan_id} initialized for target {data['target_url']}")
+
+        return scan_config
+
+    def status(self, scan_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current status of a scan.
+
+        Args:
+            scan_id: Scan ID
+
+        Returns:
+            Status summary, or None if the scan does not exist
+        """
+        scan_info = self.active_scans.get(scan_id)
+        if scan_info is None:
+            return None
+
+        return {
+            'scan_id': scan_id,
+            'status': scan_info['status'],
+            'progress': scan_info['progress'],
+            'target_url': scan_info['target_url'],
+            'start_time': scan_info['start_time'],
+            'elapsed_time': get_elapsed_time(scan_info['start_time']),
+            'findings_count': len(scan_info['findings'])
+        }
+
+
+def get_elapsed_time(start_time_iso: str) -> str:
+    """Calculate elapsed time from ISO format start time to now"""
+    start_time = datetime.fromisoformat(start_time_iso)
+    elapsed = datetime.utcnow() - start_time
+    return str(elapsed).split('.')[0]  # Remove microseconds
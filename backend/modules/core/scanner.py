@@ -8,7 +8,9 @@ import threading
 import queue
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
+from collections import Counter
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Tuple, Any, Optional, Callable, Union
@@ -16,6 +18,15 @@ from typing import Dict, List, Set, Tuple, Any, Optional, Callable, Union
 # Configure logging
 logger = logging.getLogger("securescout.scanner")
 
+# Keep-alive connections kept per host, so concurrent probes reuse open
+# connections instead of repeating the TCP/TLS handshake
+CONNECTION_POOL_SIZE = 64
+
+# Stealth levels at which the request delay spaces out all of the scan's
+# requests, not just those of each thread. Other levels keep the delay per
+# thread, so concurrent crawling and probing still overlap.
+PACED_STEALTH_LEVELS = ("high",)
+
 class ScannerEngine:
     """
     Core scanning engine for SecureScout.
@@ -73,6 +84,10 @@ class ScannerEngine:
         
         # Create session with default configuration
         self.session = self._create_session()
+        
+        # Earliest time the next request may be sent when requests are paced
+        self._next_request_at = time.monotonic()
+        self._request_pacing_lock = threading.Lock()
     
     def _setup_proxies(self) -> Dict[str, str]:
         """Set up proxy configuration if IP rotation is enabled."""
@@ -101,6 +116,13 @@ class ScannerEngine:
         """Create and configure a requests session with default settings."""
         session = requests.Session()
         
+        # Size the connection pools for concurrent module probes; the default
+        # of 10 connections per host discards and reopens connections beyond that
+        pool_size = max(CONNECTION_POOL_SIZE, self.thread_count)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        
         # Set default headers
         headers = {
             "User-Agent": self.current_user_agent,
@@ -138,7 +160,6 @@ class ScannerEngine:
                 new_user_agent = self._get_random_user_agent()
             
             self.current_user_agent = new_user_agent
-            self.session.headers.update({"User-Agent": self.current_user_agent})
     
     def _add_jitter(self, delay: float) -> float:
         """Add random jitter to delay time to avoid pattern detection."""
@@ -152,9 +173,22 @@ class ScannerEngine:
         return max(0.1, new_delay)
     
     def _wait_between_requests(self):
-        """Implement delay between requests with jitter."""
+        """
+        Implement delay between requests with jitter.
+        
+        At paced stealth levels the delay is shared: concurrent probes take
+        turns, so the scan as a whole sends at most one request per delay.
+        """
         delay = self._add_jitter(self.request_delay)
-        time.sleep(delay)
+        if self.stealth_level not in PACED_STEALTH_LEVELS:
+            time.sleep(delay)
+            return
+        
+        with self._request_pacing_lock:
+            now = time.monotonic()
+            self._next_request_at = max(now, self._next_request_at) + delay
+            wait = self._next_request_at - now
+        time.sleep(wait)
     
     def _make_request(self, url: str, method: str = 'GET', 
                      data: Dict = None, json: Dict = None, 
@@ -170,9 +204,11 @@ class ScannerEngine:
         response = None
         
         try:
-            # Rotate user agent if enabled
+            # Rotate user agent if enabled. It is sent as a request header rather
+            # than set on the session, which is shared by concurrent module probes.
             if self.user_agent_rotation:
                 self._rotate_user_agent()
+                headers = {"User-Agent": self.current_user_agent, **(headers or {})}
             
             # Apply request delay
             self._wait_between_requests()
@@ -197,7 +233,7 @@ class ScannerEngine:
             if cookies:
                 request_params['cookies'] = cookies
             
-            logger.debug(f"Making {method} request to {url}")
+            logger.debug("Making %s request to %s", method, url)
             response = self.session.request(**request_params)
             
             # Check for rate limiting or other anomalies
@@ -564,17 +600,9 @@ class ScannerEngine:
     
     def _count_findings_by_severity(self) -> Dict[str, int]:
         """Count findings by severity level."""
-        severity_counts = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0,
-            'info': 0
-        }
+        counts = Counter(finding.get('severity', 'info').lower() for finding in self.findings)
         
-        for finding in self.findings:
-            severity = finding.get('severity', 'info').lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-        
-        return severity_counts
\ No newline at end of file
+        return {
+            severity: counts[severity]
+            for severity in ('critical', 'high', 'medium', 'low', 'info')
+        }
\ No newline at end of file
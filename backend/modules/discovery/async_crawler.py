@@ -598,7 +598,7 @@ class AsyncWebCrawler:
         # Mark as visited to prevent duplicates
         self.visited_urls.add(url)
         
-        logger.debug(f"Crawling {url} at depth {depth}")
+        logger.debug("Crawling %s at depth %s", url, depth)
         
         try:
             # Get the page content
@@ -766,7 +766,7 @@ class AsyncWebCrawler:
                         path = line[9:].strip()
                         if path:
                             full_url = urljoin(self.base_url, path)
-                            logger.debug(f"Found disallowed path: {full_url}")
+                            logger.debug("Found disallowed path: %s", full_url)
             except Exception as e:
                 logger.error(f"Error parsing robots.txt: {str(e)}")
         
@@ -816,7 +816,7 @@ class AsyncWebCrawler:
                                 priority = self.prioritize_url(url, in_links_count=2)  # Higher priority for sitemap URLs
                                 await self.url_queue.put((priority, url, 0))
                                 self.found_urls.add(url)
-                                logger.debug(f"Added URL from sitemap: {url}")
+                                logger.debug("Added URL from sitemap: %s", url)
         
         except Exception as e:
             logger.error(f"Error processing sitemap {sitemap_url}: {str(e)}")
@@ -409,7 +409,7 @@ class WebCrawler:
         # Mark as visited to prevent duplicates
         self.visited_urls.add(url)
         
-        logger.debug(f"Crawling {url} at depth {depth}")
+        logger.debug("Crawling %s at depth %s", url, depth)
         
         try:
             # Get the page content
@@ -531,7 +531,7 @@ class WebCrawler:
                         path = line[9:].strip()
                         if path:
                             full_url = urljoin(self.base_url, path)
-                            logger.debug(f"Found disallowed path: {full_url}")
+                            logger.debug("Found disallowed path: %s", full_url)
             except Exception as e:
                 logger.error(f"Error parsing robots.txt: {str(e)}")
         
@@ -577,7 +577,7 @@ class WebCrawler:
                             if url not in self.visited_urls and url not in self.found_urls:
                                 self.page_queue.put((url, 0))
                                 self.found_urls.add(url)
-                                logger.debug(f"Added URL from sitemap: {url}")
+                                logger.debug("Added URL from sitemap: %s", url)
         
         except Exception as e:
             logger.error(f"Error processing sitemap {sitemap_url}: {str(e)}")
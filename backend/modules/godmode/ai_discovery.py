@@ -10,6 +10,8 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from .http_session import create_session
+
 class AIVulnerabilityDiscovery:
     """
     AI-Powered Vulnerability Discovery using machine learning patterns
@@ -21,6 +23,9 @@ class AIVulnerabilityDiscovery:
         self.description = "AI-powered pattern recognition for novel vulnerability discovery"
         self.risk_level = "EXTREME"
         
+        # Shared session so probes reuse connections to the target
+        self.session = create_session()
+        
         # AI Pattern Detection Models
         self.vulnerability_patterns = {
             'neural_injection': self._neural_injection_patterns,
@@ -92,7 +97,7 @@ class AIVulnerabilityDiscovery:
             
             for test_url in test_urls:
                 try:
-                    response = requests.get(test_url, timeout=5)
+                    response = self.session.get(test_url, timeout=5)
                     if self._detect_neural_response(response):
                         vulnerabilities.append({
                             'type': 'neural_injection',
@@ -128,7 +133,7 @@ class AIVulnerabilityDiscovery:
             }
             
             try:
-                response = requests.get(url, params=test_params, timeout=5)
+                response = self.session.get(url, params=test_params, timeout=5)
                 if self._detect_privilege_escalation(response):
                     vulnerabilities.append({
                         'type': 'semantic_confusion',
@@ -161,7 +166,7 @@ class AIVulnerabilityDiscovery:
             }
             
             try:
-                response = requests.get(url, headers=headers, timeout=5)
+                response = self.session.get(url, headers=headers, timeout=5)
                 if self._detect_context_confusion(response):
                     vulnerabilities.append({
                         'type': 'context_switching',
@@ -188,7 +193,7 @@ class AIVulnerabilityDiscovery:
         vulnerabilities = []
         for pattern in overload_patterns:
             try:
-                response = requests.post(url, data={'input': pattern}, timeout=10)
+                response = self.session.post(url, data={'input': pattern}, timeout=10)
                 if self._detect_overload_effects(response):
                     vulnerabilities.append({
                         'type': 'cognitive_overload',
@@ -232,7 +237,7 @@ class AIVulnerabilityDiscovery:
             }
             
             try:
-                response = requests.post(url, json=test_data, timeout=5)
+                response = self.session.post(url, json=test_data, timeout=5)
                 if self._detect_prompt_injection_success(response):
                     vulnerabilities.append({
                         'type': 'ai_prompt_injection',
@@ -258,7 +263,7 @@ class AIVulnerabilityDiscovery:
         vulnerabilities = []
         for test in neural_tests:
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{url}/api/predict", 
                     json={'input': test['payload']}, 
                     timeout=5
@@ -325,7 +330,7 @@ class AIVulnerabilityDiscovery:
         
         for vector in all_vectors:
             try:
-                response = requests.get(f"{url}?{vector}", timeout=5)
+                response = self.session.get(f"{url}?{vector}", timeout=5)
                 if self._detect_novel_vulnerability(response, vector):
                     novel_vectors.append({
                         'type': 'novel_vector',
@@ -11,6 +11,8 @@ from typing import Dict, List, Any
 from urllib.parse import quote, unquote
 import requests
 
+from .http_session import create_session
+
 class CreativeAttackVectors:
     """
     Creative and unconventional attack vectors that bypass traditional security measures
@@ -22,6 +24,9 @@ class CreativeAttackVectors:
         self.description = "Unconventional attack methods that think outside the box"
         self.risk_level = "EXTREME"
         
+        # Shared session so probes reuse connections to the target
+        self.session = create_session()
+        
         # Time-based attack vectors
         self.temporal_attacks = [
             "2038-01-19T03:14:07Z",  # Unix timestamp overflow
@@ -138,7 +143,7 @@ class CreativeAttackVectors:
         for attack in self.physics_attacks:
             try:
                 # Test the physics-inspired parameter
-                response = requests.get(f"{url}?{attack}", timeout=5)
+                response = self.session.get(f"{url}?{attack}", timeout=5)
                 
                 if self._detect_physics_vulnerability(response, attack):
                     physics_vectors.append({
@@ -161,7 +166,7 @@ class CreativeAttackVectors:
             try:
                 # Craft paradox-based payload
                 payload = self._craft_paradox_payload(paradox)
-                response = requests.post(url, json=payload, timeout=5)
+                response = self.session.post(url, json=payload, timeout=5)
                 
                 if self._detect_paradox_vulnerability(response):
                     paradox_vectors.append({
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# SecureScout GODMODE - Shared HTTP Session Factory
+
+import requests
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive connections kept per host by each engine's session
+POOL_SIZE = 10
+
+# Retries for connections that could not be established. Reads and status
+# codes are never retried: timeouts and 5xx responses are findings here
+CONNECT_RETRIES = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+
+# Accepts no cookies, so each probe starts without state left by earlier ones
+# (a session cookie from a login bypass probe would skew every later probe)
+NO_COOKIES = DefaultCookiePolicy(allowed_domains=[])
+
+
+def create_session() -> requests.Session:
+    """Create a requests session with pooled, keep-alive connections and no cookie jar."""
+    session = requests.Session()
+    session.cookies.set_policy(NO_COOKIES)
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=CONNECT_RETRIES
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
@@ -12,6 +12,8 @@ from collections import defaultdict
 import requests
 from urllib.parse import urljoin, urlparse, parse_qs
 
+from .http_session import create_session
+
 class ZeroDayHunting:
     """
     Advanced zero-day vulnerability hunting using novel discovery techniques,
@@ -23,6 +25,9 @@ class ZeroDayHunting:
         self.description = "Advanced techniques for discovering unknown vulnerabilities"
         self.risk_level = "MAXIMUM"
         
+        # Shared session so probes reuse connections to the target
+        self.session = create_session()
+        
         # Advanced vulnerability patterns
         self.zeroday_patterns = {
             'novel_injections': self._novel_injection_patterns,
@@ -169,7 +174,7 @@ class ZeroDayHunting:
         
         for trigger in all_triggers:
             try:
-                response = requests.get(f"{url}?{trigger}", timeout=5)
+                response = self.session.get(f"{url}?{trigger}", timeout=5)
                 if self._detect_logic_bomb_activation(response, trigger):
                     logic_bombs.append({
                         'type': 'logic_bomb',
@@ -208,7 +213,7 @@ class ZeroDayHunting:
         
         for state in all_states:
             try:
-                response = requests.post(url, json=state, timeout=5)
+                response = self.session.post(url, json=state, timeout=5)
                 if self._detect_state_confusion(response, state):
                     state_confusions.append({
                         'type': 'state_confusion',
@@ -246,7 +251,7 @@ class ZeroDayHunting:
             try:
                 headers = self._craft_deviant_headers(deviation)
                 method = deviation.get('method', 'GET')
-                response = requests.request(method, url, headers=headers, timeout=5)
+                response = self.session.request(method, url, headers=headers, timeout=5)
                 
                 if self._detect_protocol_vulnerability(response, deviation):
                     protocol_deviations.append({
@@ -305,7 +310,7 @@ class ZeroDayHunting:
         for function in all_functions:
             try:
                 full_url = urljoin(url, function)
-                response = requests.get(full_url, timeout=5)
+                response = self.session.get(full_url, timeout=5)
                 
                 if self._detect_hidden_functionality(response, function):
                     hidden_functions.append({
@@ -353,7 +358,7 @@ class ZeroDayHunting:
         
         for test in all_tests:
             try:
-                response = requests.post(f"{url}/crypto/test", json=test, timeout=5)
+                response = self.session.post(f"{url}/crypto/test", json=test, timeout=5)
                 if self._detect_crypto_weakness(response, test):
                     crypto_weaknesses.append({
                         'type': 'cryptographic_weakness',
@@ -399,7 +404,7 @@ class ZeroDayHunting:
         
         for pattern in all_patterns:
             try:
-                response = requests.post(url, data={'input': pattern}, timeout=10)
+                response = self.session.post(url, data={'input': pattern}, timeout=10)
                 if self._detect_memory_corruption(response, pattern):
                     memory_corruptions.append({
                         'type': 'memory_corruption',
@@ -448,7 +453,7 @@ class ZeroDayHunting:
         
         for flaw in all_flaws:
             try:
-                response = requests.post(url, json=flaw, timeout=5)
+                response = self.session.post(url, json=flaw, timeout=5)
                 if self._detect_business_logic_flaw(response, flaw):
                     business_logic_flaws.append({
                         'type': 'business_logic_flaw',
@@ -491,7 +496,7 @@ class ZeroDayHunting:
         # Test each bypass method
         for bypass in sql_bypasses:
             try:
-                response = requests.post(f"{url}/login", data={
+                response = self.session.post(f"{url}/login", data={
                     'username': bypass,
                     'password': 'anything'
                 }, timeout=5)
@@ -540,10 +545,10 @@ class ZeroDayHunting:
             try:
                 if 'X-' in str(escalation):
                     # Header-based test
-                    response = requests.get(url, headers=escalation, timeout=5)
+                    response = self.session.get(url, headers=escalation, timeout=5)
                 else:
                     # Parameter-based test
-                    response = requests.post(url, json=escalation, timeout=5)
+                    response = self.session.post(url, json=escalation, timeout=5)
                 
                 if self._detect_privilege_escalation(response, escalation):
                     privesc_vulnerabilities.append({
@@ -16,6 +16,38 @@ from dataclasses import dataclass, field
 # Configure logging
 logger = logging.getLogger("securescout.integrations")
 
+# Write buffer for result files, so json.dump's many small writes coalesce
+RESULT_WRITE_BUFFER_SIZE = 256 * 1024
+
+# Executables already found, keyed by (name, PATH value)
+_path_lookups: Dict[Tuple[str, str], str] = {}
+
+
+def find_in_path(name: str) -> Optional[str]:
+    """
+    Find an executable in the system PATH.
+    
+    Found executables are cached per PATH value, since adapters are
+    instantiated for every workflow task and would otherwise rescan every
+    PATH directory. Misses are not cached, so a tool installed while the
+    server runs is found on the next lookup.
+    
+    Args:
+        name: Name of the executable
+        
+    Returns:
+        Path to the executable or None if not found
+    """
+    key = (name, os.environ.get("PATH", os.defpath))
+    
+    path = _path_lookups.get(key)
+    if path is None:
+        path = shutil.which(name, path=key[1])
+        if path is not None:
+            _path_lookups[key] = path
+    
+    return path
+
 @dataclass
 class ToolResult:
     """
@@ -121,15 +153,9 @@ class BaseToolAdapter(abc.ABC):
         """
         try:
             # Try to find the executable in the system PATH
-            result = subprocess.run(
-                ["which", self.tool_name], 
-                capture_output=True, 
-                text=True, 
-                check=False
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
+            path = find_in_path(self.tool_name)
+            if path:
+                return path
             
             # Try common installation locations
             common_locations = [
@@ -274,7 +300,7 @@ class BaseToolAdapter(abc.ABC):
             raise ValueError("No results to save")
         
         try:
-            with open(file_path, 'w') as f:
+            with open(file_path, 'w', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
                 json.dump(self.result.to_dict(), f, indent=2)
             
             logger.info(f"Saved {self.tool_name} results to {file_path}")
@@ -307,30 +333,21 @@ class Severity:
         Returns:
             Normalized severity string
         """
-        severity = severity.lower().strip()
-        
-        # Critical severity mapping
-        if severity in ("critical", "crit", "p0", "0", "s0", "severity:critical"):
-            return Severity.CRITICAL
-        
-        # High severity mapping
-        if severity in ("high", "important", "p1", "1", "s1", "severity:high"):
-            return Severity.HIGH
-        
-        # Medium severity mapping
-        if severity in ("medium", "moderate", "warning", "p2", "2", "s2", "severity:medium"):
-            return Severity.MEDIUM
-        
-        # Low severity mapping
-        if severity in ("low", "minor", "p3", "3", "s3", "severity:low"):
-            return Severity.LOW
-        
-        # Info severity mapping
-        if severity in ("info", "informational", "information", "p4", "4", "s4", "severity:info"):
-            return Severity.INFO
-        
-        # If no match, return unknown
-        return Severity.UNKNOWN
+        return SEVERITY_ALIASES.get(severity.lower().strip(), Severity.UNKNOWN)
+
+
+# Tool-specific severity strings mapped to standard severity levels
+SEVERITY_ALIASES = {
+    alias: level
+    for level, aliases in (
+        (Severity.CRITICAL, ("critical", "crit", "p0", "0", "s0", "severity:critical")),
+        (Severity.HIGH, ("high", "important", "p1", "1", "s1", "severity:high")),
+        (Severity.MEDIUM, ("medium", "moderate", "warning", "p2", "2", "s2", "severity:medium")),
+        (Severity.LOW, ("low", "minor", "p3", "3", "s3", "severity:low")),
+        (Severity.INFO, ("info", "informational", "information", "p4", "4", "s4", "severity:info")),
+    )
+    for alias in aliases
+}
 
 
 # Tool execution status tracking
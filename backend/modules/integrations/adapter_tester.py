@@ -18,7 +18,9 @@ from unittest import mock
 import datetime
 
 # Add parent directory to path to allow importing adapter modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+_PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 
 # Import adapters
 from backend.modules.integrations.adapter_base import BaseToolAdapter, ToolResult, Severity
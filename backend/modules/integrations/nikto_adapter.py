@@ -50,6 +50,28 @@ NIKTO_ID_MAPPINGS = {
     "009673": {"category": "8", "severity": Severity.CRITICAL} # Remote command execution
 }
 
+# Regular expressions for key information in Nikto text output
+NIKTO_TARGET_PATTERN = re.compile(r"- Target: (?P<host>[^\s]+)(\s+IP:(?P<ip>[^\s]+))?(\s+Port: (?P<port>\d+))?")
+NIKTO_FINDING_PATTERN = re.compile(r"- (?P<id>\d+)\s+(?P<message>.*?)(?:\s+(?P<url>http[s]?://[^\s]+))?")
+
+# Remediation advice by Nikto finding category
+NIKTO_REMEDIATIONS = {
+    "1": "Disable file uploads if not needed, or implement strict validation of uploaded files.",
+    "2": "Remove default, sample, or test files and directories from the web server.",
+    "3": "Configure the web server to prevent information disclosure. Review server configurations and disable verbose error messages.",
+    "4": "Implement input validation and output encoding to prevent injection attacks.",
+    "5": "Disable directory traversal and ensure proper access controls for files.",
+    "6": "Implement rate limiting and resource constraints to prevent DoS attacks.",
+    "7": "Disable directory traversal and ensure proper access controls for files.",
+    "8": "Validate all user input and avoid passing user-controlled data to system commands.",
+    "9": "Use parameterized queries or prepared statements to prevent SQL injection.",
+    "0": "Configure proper file permissions and ensure sensitive files are not accessible through the web server.",
+    "a": "Implement secure authentication mechanisms and protect credentials in transit and at rest.",
+    "b": "Configure server to minimize information disclosure about software versions in use.",
+    "c": "Validate all input and avoid including remote files based on user input.",
+    "x": "Configure reverse proxy settings to prevent unauthorized access to internal resources."
+}
+
 
 class NiktoAdapter(BaseToolAdapter):
     """
@@ -394,20 +416,16 @@ class NiktoAdapter(BaseToolAdapter):
         """
         findings = []
         
-        # Regular expressions for key information
-        target_regex = r"- Target: (?P<host>[^\s]+)(\s+IP:(?P<ip>[^\s]+))?(\s+Port: (?P<port>\d+))?"
-        finding_regex = r"- (?P<id>\d+)\s+(?P<message>.*?)(?:\s+(?P<url>http[s]?://[^\s]+))?"
-        
         # Extract target information
-        target_match = re.search(target_regex, output)
+        target_match = NIKTO_TARGET_PATTERN.search(output)
         host = target_match.group("host") if target_match and target_match.group("host") else ""
         ip = target_match.group("ip") if target_match and target_match.group("ip") else ""
         port = target_match.group("port") if target_match and target_match.group("port") else ""
         
         # Extract findings
         for line in output.splitlines():
-            if line.startswith("- ") and re.search(r"- \d+\s+", line):
-                finding_match = re.search(finding_regex, line)
+            if line.startswith("- "):
+                finding_match = NIKTO_FINDING_PATTERN.search(line)
                 
                 if finding_match:
                     test_id = finding_match.group("id").zfill(6)  # Pad ID to 6 digits
@@ -534,63 +552,27 @@ class NiktoAdapter(BaseToolAdapter):
         
         # If we couldn't determine a specific category, try to guess from the message
         if not category:
-            if "default" in message.lower() or "sample" in message.lower():
+            message = message.lower()
+            if "default" in message or "sample" in message:
                 category = "2"  # Default files
-            elif "directory" in message.lower() and "listing" in message.lower():
+            elif "directory" in message and "listing" in message:
                 category = "3"  # Information disclosure
-            elif "sql" in message.lower():
+            elif "sql" in message:
                 category = "9"  # SQL injection
-            elif "xss" in message.lower() or "script" in message.lower():
+            elif "xss" in message or "script" in message:
                 category = "4"  # Injection
-            elif "server" in message.lower() and "version" in message.lower():
+            elif "server" in message and "version" in message:
                 category = "b"  # Server information
-            elif "login" in message.lower() or "password" in message.lower():
+            elif "login" in message or "password" in message:
                 category = "a"  # Authentication
             else:
                 category = "2"  # Default to misconfiguration
         
         # Generate remediation based on category
-        if category == "1":  # File Upload
-            return "Disable file uploads if not needed, or implement strict validation of uploaded files."
-        
-        elif category == "2":  # Default files
-            return "Remove default, sample, or test files and directories from the web server."
-        
-        elif category == "3":  # Information disclosure
-            return "Configure the web server to prevent information disclosure. Review server configurations and disable verbose error messages."
-        
-        elif category == "4":  # Injection
-            return "Implement input validation and output encoding to prevent injection attacks."
-        
-        elif category == "5" or category == "7":  # Remote file retrieval
-            return "Disable directory traversal and ensure proper access controls for files."
-        
-        elif category == "6":  # Denial of service
-            return "Implement rate limiting and resource constraints to prevent DoS attacks."
-        
-        elif category == "8":  # Command execution
-            return "Validate all user input and avoid passing user-controlled data to system commands."
-        
-        elif category == "9":  # SQL injection
-            return "Use parameterized queries or prepared statements to prevent SQL injection."
-        
-        elif category == "0":  # File disclosure
-            return "Configure proper file permissions and ensure sensitive files are not accessible through the web server."
-        
-        elif category == "a":  # Authentication
-            return "Implement secure authentication mechanisms and protect credentials in transit and at rest."
-        
-        elif category == "b":  # Software identification
-            return "Configure server to minimize information disclosure about software versions in use."
-        
-        elif category == "c":  # Remote source inclusion
-            return "Validate all input and avoid including remote files based on user input."
-        
-        elif category == "x":  # Reverse proxy
-            return "Configure reverse proxy settings to prevent unauthorized access to internal resources."
-        
-        # Default remediation
-        return "Review server configuration and security settings to address this vulnerability."
+        return NIKTO_REMEDIATIONS.get(
+            category,
+            "Review server configuration and security settings to address this vulnerability."
+        )
     
     def execute(self, options: Dict[str, Any]) -> ToolResult:
         """
@@ -4,8 +4,10 @@
 import os
 import json
 import logging
+import re
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Any, Optional, Union, Tuple
+from collections import Counter
 from datetime import datetime
 
 from .adapter_base import BaseToolAdapter, ToolResult, Severity
@@ -13,6 +15,9 @@ from .adapter_base import BaseToolAdapter, ToolResult, Severity
 # Configure logging
 logger = logging.getLogger("securescout.integrations.nmap")
 
+# CVE identifiers in Nmap script IDs
+CVE_PATTERN = re.compile(r'cve-\d+-\d+', re.IGNORECASE)
+
 class NmapAdapter(BaseToolAdapter):
     """
     Adapter for Nmap network scanner.
@@ -173,10 +178,9 @@ class NmapAdapter(BaseToolAdapter):
                 self.result.result_data["scan_info"] = scan_info
                 
                 # Add summary of findings
-                severity_counts = {}
-                for finding in findings:
-                    severity = finding.get("severity", Severity.UNKNOWN)
-                    severity_counts[severity] = severity_counts.get(severity, 0) + 1
+                severity_counts = dict(Counter(
+                    finding.get("severity", Severity.UNKNOWN) for finding in findings
+                ))
                 
                 self.result.result_data["summary"] = {
                     "total_findings": len(findings),
@@ -425,8 +429,7 @@ class NmapAdapter(BaseToolAdapter):
                 # Make the title more descriptive for vulnerabilities
                 if "cve" in script_id.lower():
                     # Extract the CVE identifier
-                    import re
-                    cve_match = re.search(r'cve-\d+-\d+', script_id, re.IGNORECASE)
+                    cve_match = CVE_PATTERN.search(script_id)
                     if cve_match:
                         cve_id = cve_match.group(0).upper()
                         finding["title"] = f"Vulnerability: {cve_id}"
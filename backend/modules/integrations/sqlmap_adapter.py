@@ -2,6 +2,7 @@
 # SecureScout - SQLMap Integration Adapter
 
 import os
+import importlib.util
 import json
 import logging
 import subprocess
@@ -12,11 +13,16 @@ import requests
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime
 
-from .adapter_base import BaseToolAdapter, Severity, ToolResult
+from .adapter_base import BaseToolAdapter, Severity, ToolResult, find_in_path
 
 # Configure logging
 logger = logging.getLogger("securescout.integrations.sqlmap")
 
+# Status polling backs off while the API task reports no change
+POLL_INTERVAL_MIN = 1.0
+POLL_INTERVAL_MAX = 10.0
+POLL_BACKOFF = 1.5
+
 class SQLMapAPI:
     """
     Client for SQLMap API server.
@@ -111,20 +117,8 @@ class SQLMapAPI:
             if os.path.exists(location):
                 return location
         
-        # Try to find via which command
-        try:
-            result = subprocess.run(
-                ["which", "sqlmapapi.py"], 
-                capture_output=True, 
-                text=True, 
-                check=False
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        
-        return None
+        # Try to find it in the system PATH
+        return find_in_path("sqlmapapi.py")
     
     def new_task(self) -> Optional[str]:
         """
@@ -326,14 +320,16 @@ class SQLMapAdapter(BaseToolAdapter):
             if os.path.exists(location):
                 return location
         
-        # Check for the parent directory of sqlmap if it's installed as a package
+        # Check for the parent directory of sqlmap if it's installed as a package,
+        # locating it without executing the package
         try:
-            import sqlmap
-            sqlmap_dir = os.path.dirname(sqlmap.__file__)
-            if os.path.exists(os.path.join(sqlmap_dir, "sqlmap.py")):
-                return os.path.join(sqlmap_dir, "sqlmap.py")
-        except ImportError:
-            pass
+            spec = importlib.util.find_spec("sqlmap")
+        except (ImportError, ValueError):
+            spec = None
+        if spec and spec.origin:
+            sqlmap_script = os.path.join(os.path.dirname(spec.origin), "sqlmap.py")
+            if os.path.exists(sqlmap_script):
+                return sqlmap_script
         
         return None
     
@@ -539,7 +535,9 @@ class SQLMapAdapter(BaseToolAdapter):
             
             self.result.status = "running"
             
-            # Poll for results
+            # Poll for results, backing off until the status changes
+            delay = POLL_INTERVAL_MIN
+            last_status = None
             while True:
                 status = self.api_client.get_status()
                 
@@ -548,7 +546,13 @@ class SQLMapAdapter(BaseToolAdapter):
                 elif status == "error":
                     raise RuntimeError("Scan encountered an error")
                 
-                time.sleep(2)  # Wait before polling again
+                if status == last_status:
+                    delay = min(delay * POLL_BACKOFF, POLL_INTERVAL_MAX)
+                else:
+                    delay = POLL_INTERVAL_MIN
+                last_status = status
+                
+                time.sleep(delay)
             
             # Get the scan data
             scan_data = self.api_client.get_data()
@@ -9,7 +9,9 @@ import logging
 from unittest.mock import patch, MagicMock
 
 # Add parent directory to path to allow importing modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+_PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 
 # Import modules to test
 from modules.integrations.nuclei_adapter import NucleiAdapter, NucleiTemplateManager
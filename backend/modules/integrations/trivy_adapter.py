@@ -4,11 +4,18 @@
 import os
 import json
 import logging
+import subprocess
 from typing import Dict, List, Any, Optional, Union, Tuple
+from collections import Counter
 from datetime import datetime
 
 from .adapter_base import BaseToolAdapter, ToolResult, Severity
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configure logging
 logger = logging.getLogger("securescout.integrations.trivy")
 
@@ -119,20 +126,27 @@ class TrivyAdapter(BaseToolAdapter):
             return findings
         
         try:
-            # Read the JSON file
-            with open(json_file, "r") as f:
-                data = json.load(f)
-            
             # Add the JSON file to result files
             self.result.add_result_file(json_file)
             
-            # Extract scan information
-            if "Metadata" in data:
-                self.result.result_data["metadata"] = data["Metadata"]
-            
-            # Process vulnerabilities
-            if "Results" in data:
-                for result in data["Results"]:
+            with open(json_file, "rb") as f:
+                if ijson is not None:
+                    # Stream one target at a time instead of loading the whole
+                    # report; Trivy writes Metadata before Results
+                    metadata = next(ijson.items(f, "Metadata", use_float=True), None)
+                    f.seek(0)
+                    results = ijson.items(f, "Results.item", use_float=True)
+                else:
+                    data = json.load(f)
+                    metadata = data.get("Metadata")
+                    results = data.get("Results") or []
+                
+                # Extract scan information
+                if metadata is not None:
+                    self.result.result_data["metadata"] = metadata
+                
+                # Process vulnerabilities
+                for result in results:
                     # Get target info
                     target_name = result.get("Target", "Unknown")
                     target_type = result.get("Type", "Unknown")
@@ -158,10 +172,9 @@ class TrivyAdapter(BaseToolAdapter):
             # Add summary of findings to result data
             if self.result:
                 # Count findings by severity
-                severity_counts = {}
-                for finding in findings:
-                    severity = finding.get("severity", Severity.UNKNOWN)
-                    severity_counts[severity] = severity_counts.get(severity, 0) + 1
+                severity_counts = dict(Counter(
+                    finding.get("severity", Severity.UNKNOWN) for finding in findings
+                ))
                 
                 self.result.result_data["summary"] = {
                     "total_findings": len(findings),
@@ -414,7 +427,6 @@ class TrivyAdapter(BaseToolAdapter):
                 
                 try:
                     # Execute command directly
-                    import subprocess
                     process = subprocess.run(
                         cmd,
                         shell=True,
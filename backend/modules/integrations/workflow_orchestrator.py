@@ -4,6 +4,7 @@
 import os
 import json
 import logging
+import shutil
 import tempfile
 import time
 import uuid
@@ -12,10 +13,10 @@ import queue
 from typing import Dict, List, Any, Optional, Union, Tuple, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
 
 # Import adapters
-from .adapter_base import BaseToolAdapter, ToolResult, Severity
+from .adapter_base import BaseToolAdapter, ToolResult, Severity, RESULT_WRITE_BUFFER_SIZE
 from .zap_adapter import ZAPAdapter
 from .nmap_adapter import NmapAdapter
 from .trivy_adapter import TrivyAdapter
@@ -371,85 +372,101 @@ class WorkflowOrchestrator:
                 if not task.depends_on:
                     ready_queue.append(task.task_id)
             
-            # Execute tasks in dependency order
-            while ready_queue:
-                task_id = ready_queue.pop(0)
-                task = self.get_task(workflow.workflow_id, task_id)
-                
-                if not task:
-                    logger.error(f"Task {task_id} not found in workflow {workflow.workflow_id}")
-                    continue
-                
-                # Skip tasks that are already completed or failed
-                if task.status in ["completed", "failed", "cancelled"]:
-                    continue
-                
-                # Check if dependencies are met
-                deps_met = True
-                for dep_id in task.depends_on:
-                    dep_task = self.get_task(workflow.workflow_id, dep_id)
-                    if not dep_task or dep_task.status != "completed":
-                        deps_met = False
-                        break
-                
-                if not deps_met:
-                    logger.warning(f"Dependencies not met for task {task_id}, skipping")
-                    continue
-                
-                # Execute task
-                logger.info(f"Executing task {task_id} in workflow {workflow.workflow_id}")
-                
-                # Update task status
-                task.status = "running"
-                task.start_time = datetime.now()
-                
-                # Notify callback if provided
-                if callback:
-                    callback(workflow.workflow_id, task_id)
-                
-                # Submit task for execution
-                future = self.executor.submit(
-                    self._execute_task,
-                    workflow.workflow_id,
-                    task_id
-                )
+            # Tasks submitted to the executor and not yet finished
+            pending: Dict[Future, str] = {}
+            
+            # Execute tasks in dependency order, running independent tasks concurrently
+            while ready_queue or pending:
+                while ready_queue:
+                    task_id = ready_queue.pop(0)
+                    task = self.get_task(workflow.workflow_id, task_id)
+                    
+                    if not task:
+                        logger.error(f"Task {task_id} not found in workflow {workflow.workflow_id}")
+                        continue
+                    
+                    # Skip tasks that are already running, completed or failed
+                    if task.status in ["running", "completed", "failed", "cancelled"]:
+                        continue
+                    
+                    # Check if dependencies are met
+                    deps_met = True
+                    for dep_id in task.depends_on:
+                        dep_task = self.get_task(workflow.workflow_id, dep_id)
+                        if not dep_task or dep_task.status != "completed":
+                            deps_met = False
+                            break
+                    
+                    if not deps_met:
+                        logger.warning(f"Dependencies not met for task {task_id}, skipping")
+                        continue
+                    
+                    # Execute task
+                    logger.info(f"Executing task {task_id} in workflow {workflow.workflow_id}")
+                    
+                    # Update task status
+                    task.status = "running"
+                    task.start_time = datetime.now()
+                    
+                    # Notify callback if provided
+                    if callback:
+                        callback(workflow.workflow_id, task_id)
+                    
+                    # Submit task for execution
+                    future = self.executor.submit(
+                        self._execute_task,
+                        workflow.workflow_id,
+                        task_id
+                    )
+                    
+                    # Store future
+                    futures[task_id] = future
+                    pending[future] = task_id
                 
-                # Store future
-                futures[task_id] = future
+                if not pending:
+                    break
                 
-                # Wait for task to complete
-                result = future.result()
+                # Wait for any running task to complete
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
                 
-                # Process result
-                if result:
-                    # Task completed successfully
-                    task.status = "completed"
-                    task.end_time = datetime.now()
+                for future in done:
+                    task_id = pending.pop(future)
+                    task = self.get_task(workflow.workflow_id, task_id)
+                    
+                    # Task was cancelled while running
+                    if task.status == "cancelled":
+                        continue
                     
-                    # Add dependent tasks to ready queue
-                    for dep_task_id in dependents.get(task_id, []):
-                        # Check if all dependencies are met
-                        dep_task = self.get_task(workflow.workflow_id, dep_task_id)
-                        if not dep_task:
-                            continue
+                    # Process result
+                    if not future.cancelled() and future.result():
+                        # Task completed successfully
+                        task.status = "completed"
+                        task.end_time = datetime.now()
+                        
+                        # Add dependent tasks to ready queue
+                        for dep_task_id in dependents.get(task_id, []):
+                            # Check if all dependencies are met
+                            dep_task = self.get_task(workflow.workflow_id, dep_task_id)
+                            if not dep_task:
+                                continue
+                                
+                            all_deps_met = True
+                            for dep_id in dep_task.depends_on:
+                                dep = self.get_task(workflow.workflow_id, dep_id)
+                                if not dep or dep.status != "completed":
+                                    all_deps_met = False
+                                    break
                             
-                        all_deps_met = True
-                        for dep_id in dep_task.depends_on:
-                            dep = self.get_task(workflow.workflow_id, dep_id)
-                            if not dep or dep.status != "completed":
-                                all_deps_met = False
-                                break
+                            if all_deps_met:
+                                ready_queue.append(dep_task_id)
+                    else:
+                        # Task failed
+                        task.status = "failed"
+                        task.end_time = datetime.now()
                         
-                        if all_deps_met:
-                            ready_queue.append(dep_task_id)
-                else:
-                    # Task failed
-                    task.status = "failed"
-                    task.end_time = datetime.now()
-                    
-                    # Notify callback if provided
-                    if callback:
-                        callback(workflow.workflow_id, task_id)
+                        # Notify callback if provided
+                        if callback:
+                            callback(workflow.workflow_id, task_id)
             
             # Check if all tasks are completed
             all_completed = True
@@ -614,7 +631,7 @@ class WorkflowOrchestrator:
             
             # Save workflow summary
             summary_file = os.path.join(workflow_dir, "workflow_summary.json")
-            with open(summary_file, 'w') as f:
+            with open(summary_file, 'w', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
                 json.dump(workflow.to_dict(), f, indent=2)
             
             # Save task results
@@ -625,15 +642,14 @@ class WorkflowOrchestrator:
                     
                     # Save task result
                     result_file = os.path.join(task_dir, "result.json")
-                    with open(result_file, 'w') as f:
+                    with open(result_file, 'w', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
                         json.dump(task.result.to_dict(), f, indent=2)
                     
                     # Copy result files if any
                     for file_path in task.result.result_files:
                         if os.path.exists(file_path):
                             dest_path = os.path.join(task_dir, os.path.basename(file_path))
-                            with open(file_path, 'rb') as src, open(dest_path, 'wb') as dest:
-                                dest.write(src.read())
+                            shutil.copyfile(file_path, dest_path)
             
             logger.info(f"Saved workflow results to {workflow_dir}")
             return workflow_dir
@@ -11,6 +11,7 @@ import socket
 import requests
 import random
 from typing import Dict, List, Any, Optional, Union, Tuple
+from collections import Counter
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
@@ -523,17 +524,7 @@ class ZAPAdapter(BaseToolAdapter):
         md.append("")
         
         # Severity counts
-        severity_counts = {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 0,
-            Severity.MEDIUM: 0,
-            Severity.LOW: 0,
-            Severity.INFO: 0
-        }
-        
-        for finding in findings:
-            severity = finding.get("severity", Severity.UNKNOWN)
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts = Counter(finding.get("severity", Severity.UNKNOWN) for finding in findings)
         
         md.append("## Summary")
         md.append("")
@@ -8,7 +8,16 @@ import logging
 import datetime
 import uuid
 import hashlib
-from typing import Dict, List, Any, Optional, Union
+import html
+import math
+import atexit
+import multiprocessing
+from collections import Counter
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+from urllib.parse import urlsplit
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import jinja2
 import markdown
 import matplotlib
@@ -16,13 +25,19 @@ matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import io
 import base64
-import pandas as pd
-import numpy as np
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger("securescout.reporting")
 
+# Severity levels, most severe first
+SEVERITY_LEVELS = ("critical", "high", "medium", "low", "info")
+
 @dataclass
 class ReportConfig:
     """Configuration for report generation."""
@@ -44,11 +59,15 @@ class ReportConfig:
     report_template: Optional[str] = None
     custom_css: Optional[str] = None
     output_dir: str = ""
-    severity_filter: List[str] = field(default_factory=lambda: ["critical", "high", "medium", "low", "info"])
+    severity_filter: List[str] = field(default_factory=lambda: list(SEVERITY_LEVELS))
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization.
+        
+        All fields are flat values, so a shallow copy is enough and avoids
+        the recursive deep copy performed by ``dataclasses.asdict``.
+        """
+        return dict(self.__dict__)
 
 @dataclass
 class FindingSummary:
@@ -64,8 +83,14 @@ class FindingSummary:
     affected_components: Dict[str, int] = field(default_factory=dict)
     severity_distribution: Dict[str, float] = field(default_factory=dict)
     
-    def calculate_risk_score(self) -> float:
-        """Calculate overall risk score based on findings."""
+    def calculate_risk_score(self, total_findings: Optional[int] = None) -> float:
+        """
+        Calculate overall risk score based on findings.
+        
+        Args:
+            total_findings: Pre-computed total number of findings; summed
+                from the severity counters when omitted
+        """
         # CVSS-based risk calculation (simplified)
         weights = {
             "critical": 10.0,
@@ -83,7 +108,8 @@ class FindingSummary:
             self.info_count * weights["info"]
         )
         
-        total_findings = self.get_total_count()
+        if total_findings is None:
+            total_findings = self.get_total_count()
         
         # Return a risk score on a scale of 0-10
         if total_findings == 0:
@@ -93,7 +119,7 @@ class FindingSummary:
         base_score = weighted_sum / total_findings
         
         # Apply logarithmic scaling for large numbers of findings
-        volume_factor = min(1 + np.log1p(total_findings / 10) / 2, 1.5)
+        volume_factor = min(1 + math.log1p(total_findings / 10) / 2, 1.5)
         
         # Critical findings have a greater impact
         critical_factor = 1 + (self.critical_count / max(total_findings, 1)) * 0.5
@@ -101,11 +127,11 @@ class FindingSummary:
         # Calculate final score (capped at 10)
         risk_score = min(base_score * volume_factor * critical_factor, 10.0)
         
-        return round(risk_score, 2)
+        return round(float(risk_score), 2)
     
-    def get_risk_level(self) -> str:
+    def get_risk_level(self, total_findings: Optional[int] = None) -> str:
         """Get risk level description based on score."""
-        score = self.calculate_risk_score()
+        score = self.calculate_risk_score(total_findings)
         
         if score >= 9.0:
             return "Critical"
@@ -125,7 +151,7 @@ class FindingSummary:
     
     def calculate_severity_distribution(self) -> Dict[str, float]:
         """Calculate severity distribution percentage."""
-        total = self.get_total_count()
+        total = self.total_count
         if total == 0:
             return {
                 "critical": 0,
@@ -152,8 +178,8 @@ class FindingSummary:
         self.medium_count = 0
         self.low_count = 0
         self.info_count = 0
-        self.vuln_types_count = {}
-        self.affected_components = {}
+        vuln_types = Counter()
+        components = Counter()
         
         # Track unique CWEs
         unique_cwes = set()
@@ -175,10 +201,7 @@ class FindingSummary:
             
             # Count by vulnerability type
             vuln_type = finding.get('vulnerability_type') or finding.get('category', 'unknown')
-            if vuln_type in self.vuln_types_count:
-                self.vuln_types_count[vuln_type] += 1
-            else:
-                self.vuln_types_count[vuln_type] = 1
+            vuln_types[vuln_type] += 1
             
             # Track CWEs
             cwe_id = finding.get('cwe_id')
@@ -188,11 +211,10 @@ class FindingSummary:
             # Track affected components/locations
             location = finding.get('location', '')
             if location:
-                component = self._extract_component_from_url(location)
-                if component in self.affected_components:
-                    self.affected_components[component] += 1
-                else:
-                    self.affected_components[component] = 1
+                components[self._extract_component_from_url(location)] += 1
+        
+        self.vuln_types_count = dict(vuln_types)
+        self.affected_components = dict(components)
         
         # Update unique CWE count
         self.unique_cwe_count = len(unique_cwes)
@@ -203,9 +225,7 @@ class FindingSummary:
     def _extract_component_from_url(self, url: str) -> str:
         """Extract component name from URL for categorization."""
         try:
-            from urllib.parse import urlparse
-            
-            parsed_url = urlparse(url)
+            parsed_url = urlsplit(url)
             path = parsed_url.path.strip('/')
             
             # If path is empty, use hostname
@@ -221,6 +241,294 @@ class FindingSummary:
         except Exception:
             return "unknown"
 
+# Chart rendering
+#
+# Each chart is drawn by a top-level function that only takes plain data so
+# it can be shipped to a worker process. Matplotlib is not thread-safe, but
+# separate processes can render the independent charts concurrently. Workers
+# are never forked from the (multi-threaded) server process itself, so they
+# cannot inherit locks held by its other threads.
+
+SEVERITY_CHART_STYLES = {
+    "critical": {"label": "Critical", "color": "#E53935", "explode": 0.1},
+    "high": {"label": "High", "color": "#FF5252", "explode": 0.05},
+    "medium": {"label": "Medium", "color": "#FFB74D", "explode": 0},
+    "low": {"label": "Low", "color": "#4FC3F7", "explode": 0},
+    "info": {"label": "Info", "color": "#78909C", "explode": 0}
+}
+
+CHART_WORKERS = 4
+CHART_DPI = 72
+
+_chart_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_chart_pool() -> ProcessPoolExecutor:
+    """Get the process pool shared by all report generations."""
+    global _chart_pool
+    if _chart_pool is None:
+        start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                        else 'spawn')
+        _chart_pool = ProcessPoolExecutor(
+            max_workers=CHART_WORKERS,
+            mp_context=multiprocessing.get_context(start_method)
+        )
+    return _chart_pool
+
+def _discard_chart_pool() -> None:
+    """Shut down the chart pool; a later report starts a fresh one."""
+    global _chart_pool
+    if _chart_pool is not None:
+        _chart_pool.shutdown(wait=False)
+        _chart_pool = None
+
+atexit.register(_discard_chart_pool)
+
+def _fig_to_base64(fig: plt.Figure) -> str:
+    """Convert matplotlib figure to base64 data URL for HTML embedding."""
+    buf = io.BytesIO()
+    # Charts are embedded at a fixed size, so a low DPI and fast zlib level
+    # keep both encode time and the base64 payload small
+    fig.savefig(
+        buf,
+        format='png',
+        transparent=True,
+        bbox_inches='tight',
+        dpi=CHART_DPI,
+        pil_kwargs={'compress_level': 1, 'optimize': False}
+    )
+    # Encode straight from the buffer's memory instead of reading a copy out
+    img_str = base64.b64encode(buf.getbuffer()).decode('ascii')
+    return f"data:image/png;base64,{img_str}"
+
+def _make_severity_pie(severity_counts: Dict[str, int]) -> str:
+    """Render the severity distribution pie chart."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    
+    # Define data
+    labels = []
+    sizes = []
+    colors = []
+    explode = []
+    
+    # Only include severities with counts > 0
+    for severity, style in SEVERITY_CHART_STYLES.items():
+        count = severity_counts.get(severity, 0)
+        if count > 0:
+            labels.append(style["label"])
+            sizes.append(count)
+            colors.append(style["color"])
+            explode.append(style["explode"])
+    
+    # Create pie chart
+    wedges, texts, autotexts = ax.pie(
+        sizes, 
+        explode=explode,
+        labels=None,  # No labels on the wedges
+        autopct='%1.1f%%',
+        shadow=True,
+        colors=colors,
+        startangle=90,
+        textprops={'color': 'white', 'weight': 'bold'}
+    )
+    
+    # Fix autopct text color
+    for autotext in autotexts:
+        autotext.set_color('white')
+    
+    # Equal aspect ratio ensures that pie is drawn as a circle
+    ax.axis('equal')
+    
+    # Add custom legend
+    ax.legend(
+        wedges, 
+        [f"{label} ({size})" for label, size in zip(labels, sizes)],
+        title="Severity Levels",
+        loc="center left",
+        bbox_to_anchor=(1, 0, 0.5, 1)
+    )
+    
+    plt.title('Vulnerability Severity Distribution', color='white', fontsize=14)
+    plt.tight_layout()
+    
+    try:
+        return _fig_to_base64(fig)
+    finally:
+        plt.close(fig)
+
+def _make_top_counts_bar(counts_by_name: Dict[str, int], color: str, title: str) -> str:
+    """Render a horizontal bar chart of the ten largest counts."""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    # Sort by count, descending, and limit to top 10 for readability
+    sorted_counts = sorted(
+        counts_by_name.items(), 
+        key=lambda x: x[1], 
+        reverse=True
+    )[:10]
+    
+    names = [c[0] for c in sorted_counts]
+    counts = [c[1] for c in sorted_counts]
+    
+    # Create horizontal bar chart
+    bars = ax.barh(names, counts, color=color)
+    
+    # Add count labels
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(
+            width + 0.3, 
+            bar.get_y() + bar.get_height()/2,
+            f'{int(width)}',
+            va='center', 
+            color='white',
+            fontweight='bold'
+        )
+    
+    ax.set_xlabel('Number of Findings', color='white')
+    ax.set_title(title, color='white', fontsize=14)
+    
+    # Make labels readable
+    plt.tight_layout()
+    
+    try:
+        return _fig_to_base64(fig)
+    finally:
+        plt.close(fig)
+
+def _make_vuln_bar(vuln_types_count: Dict[str, int]) -> str:
+    """Render the top vulnerability types bar chart."""
+    return _make_top_counts_bar(vuln_types_count, '#4FC3F7', 'Top Vulnerability Types')
+
+def _make_components_bar(affected_components: Dict[str, int]) -> str:
+    """Render the most affected components bar chart."""
+    return _make_top_counts_bar(affected_components, '#8E86FF', 'Most Affected Components')
+
+def _make_gauge_svg(risk_score: float, risk_level: str) -> str:
+    """
+    Render the overall risk score gauge as an inline SVG.
+    
+    The gauge is only a few vector primitives, so it is written directly as
+    SVG instead of being rasterised through matplotlib.
+    
+    Args:
+        risk_score: Risk score on a scale of 0-10
+        risk_level: Risk level description shown under the score
+        
+    Returns:
+        SVG image encoded as a base64 data URL
+    """
+    cx, cy, radius = 200, 205, 140
+    
+    # Score 0 sits on the left end of the arc and 10 on the right end
+    def point(score: float, length: float) -> Tuple[float, float]:
+        angle = math.pi * (1 - score / 10)
+        return round(cx + length * math.cos(angle), 1), round(cy - length * math.sin(angle), 1)
+    
+    # Colored background arc, green (low risk) to red (high risk)
+    arc = f"M {cx - radius},{cy} A {radius},{radius} 0 0 1 {cx + radius},{cy}"
+    
+    # Tick labels at 0, 2, 4, 6, 8, 10
+    ticks = []
+    for value in range(0, 11, 2):
+        x, y = point(value, radius + 32)
+        ticks.append(f'<text x="{x}" y="{y}" font-size="14">{value}</text>')
+    
+    # Needle, clamped to the gauge range
+    needle_x, needle_y = point(min(max(risk_score, 0.0), 10.0), radius + 20)
+    
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="400" height="260" viewBox="0 0 400 260" '
+        'font-family="sans-serif" fill="white" text-anchor="middle" dominant-baseline="middle">'
+        '<defs><linearGradient id="risk" x1="0" y1="0" x2="1" y2="0">'
+        '<stop offset="0" stop-color="#1A9850"/>'
+        '<stop offset="0.5" stop-color="#FEE08B"/>'
+        '<stop offset="1" stop-color="#D73027"/>'
+        '</linearGradient></defs>'
+        '<text x="200" y="16" font-size="18">Overall Risk Score</text>'
+        f'<path d="{arc}" fill="none" stroke="url(#risk)" stroke-width="40" stroke-opacity="0.6"/>'
+        f'{"".join(ticks)}'
+        f'<line x1="{cx}" y1="{cy}" x2="{needle_x}" y2="{needle_y}" '
+        'stroke="white" stroke-width="4" stroke-linecap="round"/>'
+        f'<circle cx="{cx}" cy="{cy}" r="7"/>'
+        f'<text x="{cx}" y="{cy + 30}" font-size="28" font-weight="bold">{risk_score:.1f}</text>'
+        f'<text x="{cx}" y="{cy - 50}" font-size="18" font-weight="bold">{html.escape(risk_level)}</text>'
+        '</svg>'
+    )
+    
+    img_str = base64.b64encode(svg.encode('utf-8')).decode('utf-8')
+    return f"data:image/svg+xml;base64,{img_str}"
+
+def _render_chart(chart_func: Callable[..., str], *args: Any) -> str:
+    """Render a single chart with the dark style applied."""
+    # Use a style context so global rcParams are left untouched
+    with plt.style.context('dark_background'):
+        return chart_func(*args)
+
+# Report templates
+#
+# The Jinja2 environment and compiled templates are shared by every
+# ReportGenerator so templates are parsed and compiled once per process.
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Number of rendered template chunks collected per write when streaming
+STREAM_BUFFER_SIZE = 64
+
+def _markdown_filter(text: str) -> str:
+    """Convert markdown to HTML."""
+    if not text:
+        return ""
+    return markdown.markdown(text, extensions=['tables', 'fenced_code'])
+
+def _base64_encode_filter(data: bytes) -> str:
+    """Encode binary data to base64 string."""
+    if not data:
+        return ""
+    return base64.b64encode(data).decode('utf-8')
+
+def _to_json_filter(data: Any) -> str:
+    """Convert data to JSON string."""
+    return json.dumps(data, indent=2, default=str)
+
+@jinja2.pass_context
+def _truncate_evidence_filter(context: jinja2.runtime.Context, text: str, max_length: int = None) -> str:
+    """Truncate evidence text to a maximum length."""
+    if not text:
+        return ""
+    
+    # Fall back to the limit of the report being rendered
+    max_len = max_length or context.get('config', {}).get(
+        'max_evidence_length', ReportConfig.max_evidence_length
+    )
+    
+    if len(text) <= max_len:
+        return text
+    
+    return text[:max_len] + "... [truncated]"
+
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+    autoescape=jinja2.select_autoescape(['html', 'xml']),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache()
+)
+_TEMPLATE_ENV.filters['markdown'] = _markdown_filter
+_TEMPLATE_ENV.filters['b64encode'] = _base64_encode_filter
+_TEMPLATE_ENV.filters['to_json'] = _to_json_filter
+_TEMPLATE_ENV.filters['truncate_evidence'] = _truncate_evidence_filter
+
+_TEMPLATES: Dict[str, jinja2.Template] = {}
+
+def _get_template(name: str) -> jinja2.Template:
+    """Get a compiled report template, loading it on first use."""
+    template = _TEMPLATES.get(name)
+    if template is None:
+        template = _TEMPLATE_ENV.get_template(name)
+        _TEMPLATES[name] = template
+    return template
+
 class ReportGenerator:
     """
     Advanced report generator for SecureScout.
@@ -235,7 +543,6 @@ class ReportGenerator:
             config: Report configuration
         """
         self.config = config
-        self.template_env = self._setup_templates()
         self.charts_data = {}
         
         # Set up output directory
@@ -248,55 +555,6 @@ class ReportGenerator:
         # Ensure output directory exists
         os.makedirs(self.config.output_dir, exist_ok=True)
     
-    def _setup_templates(self) -> jinja2.Environment:
-        """Set up Jinja2 template environment."""
-        # Find template directory
-        template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        
-        # Create Jinja2 environment
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=jinja2.select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        env.filters['markdown'] = self._markdown_filter
-        env.filters['b64encode'] = self._base64_encode_filter
-        env.filters['to_json'] = self._to_json_filter
-        env.filters['truncate_evidence'] = self._truncate_evidence_filter
-        
-        return env
-    
-    def _markdown_filter(self, text: str) -> str:
-        """Convert markdown to HTML."""
-        if not text:
-            return ""
-        return markdown.markdown(text, extensions=['tables', 'fenced_code'])
-    
-    def _base64_encode_filter(self, data: bytes) -> str:
-        """Encode binary data to base64 string."""
-        if not data:
-            return ""
-        return base64.b64encode(data).decode('utf-8')
-    
-    def _to_json_filter(self, data: Any) -> str:
-        """Convert data to JSON string."""
-        return json.dumps(data, indent=2, default=str)
-    
-    def _truncate_evidence_filter(self, text: str, max_length: int = None) -> str:
-        """Truncate evidence text to a maximum length."""
-        if not text:
-            return ""
-        
-        max_len = max_length or self.config.max_evidence_length
-        
-        if len(text) <= max_len:
-            return text
-        
-        return text[:max_len] + "... [truncated]"
-    
     def generate_report(self, scan_results: Dict[str, Any]) -> str:
         """
         Generate a report based on scan results.
@@ -307,12 +565,17 @@ class ReportGenerator:
         Returns:
             Path to the generated report file
         """
+        # Take a single timestamp for the report time and the output filename
+        generated_at = datetime.datetime.now(datetime.timezone.utc)
+        timestamp = generated_at.strftime('%Y%m%d_%H%M%S')
+        
         # Extract findings
         findings = scan_results.get('findings', [])
         
         # Filter findings by severity if needed
         if self.config.severity_filter and self.config.severity_filter != ["all"]:
-            findings = [f for f in findings if f.get('severity', '').lower() in self.config.severity_filter]
+            filter_set = frozenset(self.config.severity_filter)
+            findings = [f for f in findings if f.get('severity', '').lower() in filter_set]
         
         # Generate summary statistics
         summary = FindingSummary()
@@ -338,27 +601,27 @@ class ReportGenerator:
                 scan_results.get('start_time'), 
                 scan_results.get('end_time')
             ),
-            'report_time': datetime.datetime.utcnow().isoformat(),
+            'report_time': generated_at.isoformat(),
             'findings': findings,
             'summary': summary,
             'charts': self.charts_data,
             'statistics': scan_results.get('stats', {}),
             'config': self.config.to_dict(),
-            'risk_score': summary.calculate_risk_score(),
-            'risk_level': summary.get_risk_level()
+            'risk_score': summary.calculate_risk_score(summary.total_count),
+            'risk_level': summary.get_risk_level(summary.total_count)
         }
         
         # Generate the report based on the specified format
         if self.config.format == 'html':
-            return self._generate_html_report(report_data)
+            return self._generate_html_report(report_data, timestamp)
         elif self.config.format == 'pdf':
-            return self._generate_pdf_report(report_data)
+            return self._generate_pdf_report(report_data, timestamp)
         elif self.config.format == 'json':
-            return self._generate_json_report(report_data)
+            return self._generate_json_report(report_data, timestamp)
         elif self.config.format == 'csv':
-            return self._generate_csv_report(findings)
+            return self._generate_csv_report(findings, timestamp)
         elif self.config.format == 'md':
-            return self._generate_markdown_report(report_data)
+            return self._generate_markdown_report(report_data, timestamp)
         else:
             raise ValueError(f"Unsupported report format: {self.config.format}")
     
@@ -398,262 +661,60 @@ class ReportGenerator:
         Returns:
             Dictionary of chart images encoded as base64 data URLs
         """
-        charts = {}
+        # Only plain summary fields are sent to the workers
+        jobs = {}
+        if summary.total_count > 0:
+            jobs['severity_pie'] = (_make_severity_pie, {
+                "critical": summary.critical_count,
+                "high": summary.high_count,
+                "medium": summary.medium_count,
+                "low": summary.low_count,
+                "info": summary.info_count
+            })
+        if summary.vuln_types_count:
+            jobs['vuln_types_bar'] = (_make_vuln_bar, summary.vuln_types_count)
+        if summary.affected_components:
+            jobs['components_bar'] = (_make_components_bar, summary.affected_components)
+        
+        # The gauge is plain SVG and cheap enough to build in-process
+        charts = {
+            'risk_gauge': _make_gauge_svg(
+                summary.calculate_risk_score(summary.total_count),
+                summary.get_risk_level(summary.total_count)
+            )
+        }
+        pending = dict(jobs)
         
         try:
-            # Set up Matplotlib with dark style
-            plt.style.use('dark_background')
-            
-            # 1. Severity distribution pie chart
-            if summary.total_count > 0:
-                fig, ax = plt.subplots(figsize=(8, 6))
-                
-                # Define data
-                labels = []
-                sizes = []
-                colors = []
-                explode = []
-                
-                severity_map = {
-                    "critical": {"label": "Critical", "color": "#E53935", "explode": 0.1},
-                    "high": {"label": "High", "color": "#FF5252", "explode": 0.05},
-                    "medium": {"label": "Medium", "color": "#FFB74D", "explode": 0},
-                    "low": {"label": "Low", "color": "#4FC3F7", "explode": 0},
-                    "info": {"label": "Info", "color": "#78909C", "explode": 0}
-                }
-                
-                # Only include severities with counts > 0
-                for severity, count_attr in [
-                    ("critical", "critical_count"),
-                    ("high", "high_count"),
-                    ("medium", "medium_count"),
-                    ("low", "low_count"),
-                    ("info", "info_count")
-                ]:
-                    count = getattr(summary, count_attr)
-                    if count > 0:
-                        labels.append(severity_map[severity]["label"])
-                        sizes.append(count)
-                        colors.append(severity_map[severity]["color"])
-                        explode.append(severity_map[severity]["explode"])
-                
-                # Create pie chart
-                wedges, texts, autotexts = ax.pie(
-                    sizes, 
-                    explode=explode,
-                    labels=None,  # No labels on the wedges
-                    autopct='%1.1f%%',
-                    shadow=True,
-                    colors=colors,
-                    startangle=90,
-                    textprops={'color': 'white', 'weight': 'bold'}
-                )
-                
-                # Fix autopct text color
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                
-                # Equal aspect ratio ensures that pie is drawn as a circle
-                ax.axis('equal')
-                
-                # Add custom legend
-                ax.legend(
-                    wedges, 
-                    [f"{label} ({size})" for label, size in zip(labels, sizes)],
-                    title="Severity Levels",
-                    loc="center left",
-                    bbox_to_anchor=(1, 0, 0.5, 1)
-                )
-                
-                plt.title('Vulnerability Severity Distribution', color='white', fontsize=14)
-                plt.tight_layout()
-                
-                # Convert to base64 image
-                charts['severity_pie'] = self._fig_to_base64(fig)
-                plt.close(fig)
-            
-            # 2. Vulnerability types bar chart
-            if summary.vuln_types_count:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                
-                # Sort by count, descending
-                sorted_types = sorted(
-                    summary.vuln_types_count.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )
-                
-                # Limit to top 10 for readability
-                if len(sorted_types) > 10:
-                    sorted_types = sorted_types[:10]
-                    
-                types = [t[0] for t in sorted_types]
-                counts = [t[1] for t in sorted_types]
-                
-                # Create horizontal bar chart
-                bars = ax.barh(types, counts, color='#4FC3F7')
-                
-                # Add count labels
-                for bar in bars:
-                    width = bar.get_width()
-                    ax.text(
-                        width + 0.3, 
-                        bar.get_y() + bar.get_height()/2,
-                        f'{int(width)}',
-                        va='center', 
-                        color='white',
-                        fontweight='bold'
-                    )
-                
-                ax.set_xlabel('Number of Findings', color='white')
-                ax.set_title('Top Vulnerability Types', color='white', fontsize=14)
-                
-                # Make labels readable
-                plt.tight_layout()
-                
-                # Convert to base64 image
-                charts['vuln_types_bar'] = self._fig_to_base64(fig)
-                plt.close(fig)
-            
-            # 3. Risk score gauge chart
-            fig, ax = plt.subplots(figsize=(8, 4), subplot_kw={'projection': 'polar'})
-            
-            # Calculate risk score (0-10)
-            risk_score = summary.calculate_risk_score()
-            
-            # Convert to angle (0-180 degrees, in radians)
-            theta = np.pi * (risk_score / 10)
-            
-            # Create a colorful gauge background
-            theta_range = np.linspace(0, np.pi, 1000)
-            radius = 0.8
-            width = 0.2
-            
-            # Create gradient colors for the gauge
-            cmap = plt.get_cmap('RdYlGn_r')  # Red -> Yellow -> Green (reversed)
-            colors = cmap(np.linspace(0, 1, len(theta_range)))
-            
-            # Draw gauge background
-            for i in range(len(theta_range) - 1):
-                ax.bar(
-                    (theta_range[i] + theta_range[i+1]) / 2,
-                    radius,
-                    width=width,
-                    bottom=0.7,
-                    color=colors[i],
-                    alpha=0.6,
-                    edgecolor=None
-                )
-            
-            # Add needle
-            ax.plot([0, theta], [0, radius + 0.7], color='white', linewidth=3)
-            
-            # Draw circle at base of needle
-            ax.scatter(0, 0, color='white', s=100, zorder=3)
-            
-            # Set up gauge properties
-            ax.set_rticks([])  # No radial ticks
-            ax.set_xticks(np.linspace(0, np.pi, 6))  # Add ticks at 0, 2, 4, 6, 8, 10
-            ax.set_xticklabels(['0', '2', '4', '6', '8', '10'], fontsize=12, color='white')
-            ax.spines['polar'].set_visible(False)  # Hide the outer circle
-            
-            # Show only the upper half
-            ax.set_thetamin(0)
-            ax.set_thetamax(180)
-            
-            # Add risk score text
-            ax.text(
-                0, 0, 
-                f"{risk_score:.1f}", 
-                ha='center', 
-                va='center', 
-                fontsize=24, 
-                color='white',
-                fontweight='bold'
-            )
-            
-            # Add risk level text
-            risk_level = summary.get_risk_level()
-            ax.text(
-                np.pi/2, 0.3, 
-                risk_level, 
-                ha='center', 
-                va='center', 
-                fontsize=14, 
-                color='white',
-                fontweight='bold'
-            )
-            
-            ax.set_title('Overall Risk Score', color='white', fontsize=14, pad=15)
-            
-            plt.tight_layout()
-            
-            # Convert to base64 image
-            charts['risk_gauge'] = self._fig_to_base64(fig)
-            plt.close(fig)
-            
-            # 4. Affected components chart
-            if summary.affected_components:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                
-                # Sort by count, descending
-                sorted_components = sorted(
-                    summary.affected_components.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )
-                
-                # Limit to top 10 for readability
-                if len(sorted_components) > 10:
-                    sorted_components = sorted_components[:10]
-                    
-                components = [c[0] for c in sorted_components]
-                counts = [c[1] for c in sorted_components]
-                
-                # Create horizontal bar chart
-                bars = ax.barh(components, counts, color='#8E86FF')
-                
-                # Add count labels
-                for bar in bars:
-                    width = bar.get_width()
-                    ax.text(
-                        width + 0.3, 
-                        bar.get_y() + bar.get_height()/2,
-                        f'{int(width)}',
-                        va='center', 
-                        color='white',
-                        fontweight='bold'
-                    )
-                
-                ax.set_xlabel('Number of Findings', color='white')
-                ax.set_title('Most Affected Components', color='white', fontsize=14)
-                
-                # Make labels readable
-                plt.tight_layout()
-                
-                # Convert to base64 image
-                charts['components_bar'] = self._fig_to_base64(fig)
-                plt.close(fig)
-            
-        except Exception as e:
-            logger.error(f"Error generating charts: {e}")
+            pool = _get_chart_pool()
+            futures = {name: pool.submit(_render_chart, *job) for name, job in jobs.items()}
+            for name, future in futures.items():
+                try:
+                    charts[name] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error generating chart {name}: {e}")
+                del pending[name]
+        except (BrokenProcessPool, OSError) as e:
+            # Worker processes unavailable, render the rest in-process
+            logger.warning(f"Chart worker pool unavailable, rendering inline: {e}")
+            _discard_chart_pool()
+            for name, job in pending.items():
+                try:
+                    charts[name] = _render_chart(*job)
+                except Exception as e:
+                    logger.error(f"Error generating chart {name}: {e}")
         
         return charts
     
-    def _fig_to_base64(self, fig: plt.Figure) -> str:
-        """Convert matplotlib figure to base64 data URL for HTML embedding."""
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', transparent=True, bbox_inches='tight')
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_str}"
-    
-    def _generate_html_report(self, report_data: Dict[str, Any]) -> str:
+    def _generate_html_report(self, report_data: Dict[str, Any], timestamp: str) -> str:
         """
         Generate HTML report.
         
         Args:
             report_data: Report data
+            timestamp: Report generation timestamp used in the filename
             
         Returns:
             Path to the generated HTML file
@@ -661,20 +722,18 @@ class ReportGenerator:
         try:
             # Load template
             template_name = self.config.report_template or 'html_report.html'
-            template = self.template_env.get_template(template_name)
-            
-            # Render template
-            html_content = template.render(**report_data)
+            template = _get_template(template_name)
             
             # Define output file path
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             target_domain = self._get_domain(report_data['target_url'])
             filename = f"report_{target_domain}_{timestamp}.html"
             output_path = os.path.join(self.config.output_dir, filename)
             
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Render template straight to file so large reports are never
+            # held in memory as a single string
+            stream = template.stream(**report_data)
+            stream.enable_buffering(size=STREAM_BUFFER_SIZE)
+            stream.dump(output_path, encoding='utf-8')
             
             logger.info(f"HTML report generated: {output_path}")
             return output_path
@@ -683,19 +742,20 @@ class ReportGenerator:
             logger.error(f"Error generating HTML report: {e}")
             raise
     
-    def _generate_pdf_report(self, report_data: Dict[str, Any]) -> str:
+    def _generate_pdf_report(self, report_data: Dict[str, Any], timestamp: str) -> str:
         """
         Generate PDF report.
         
         Args:
             report_data: Report data
+            timestamp: Report generation timestamp used in the filename
             
         Returns:
             Path to the generated PDF file
         """
         try:
             # First generate HTML report
-            html_report_path = self._generate_html_report(report_data)
+            html_report_path = self._generate_html_report(report_data, timestamp)
             
             # Define output file path
             pdf_path = html_report_path.replace('.html', '.pdf')
@@ -720,19 +780,19 @@ class ReportGenerator:
             logger.error(f"Error generating PDF report: {e}")
             raise
     
-    def _generate_json_report(self, report_data: Dict[str, Any]) -> str:
+    def _generate_json_report(self, report_data: Dict[str, Any], timestamp: str) -> str:
         """
         Generate JSON report.
         
         Args:
             report_data: Report data
+            timestamp: Report generation timestamp used in the filename
             
         Returns:
             Path to the generated JSON file
         """
         try:
             # Define output file path
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             target_domain = self._get_domain(report_data['target_url'])
             filename = f"report_{target_domain}_{timestamp}.json"
             output_path = os.path.join(self.config.output_dir, filename)
@@ -743,11 +803,20 @@ class ReportGenerator:
                 del clean_data['charts']
             
             # Convert datetime objects to strings
-            json_content = json.dumps(clean_data, indent=2, default=str)
+            if orjson is not None:
+                # Pass dataclasses and datetimes through to str() so the output
+                # matches the json module fallback
+                json_content = orjson.dumps(
+                    clean_data,
+                    default=str,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY |
+                            orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+                )
+            else:
+                json_content = json.dumps(clean_data, indent=2, default=str).encode('utf-8')
             
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_content)
+            # Write to file in a single binary write
+            Path(output_path).write_bytes(json_content)
             
             logger.info(f"JSON report generated: {output_path}")
             return output_path
@@ -756,23 +825,26 @@ class ReportGenerator:
             logger.error(f"Error generating JSON report: {e}")
             raise
     
-    def _generate_csv_report(self, findings: List[Dict[str, Any]]) -> str:
+    def _generate_csv_report(self, findings: List[Dict[str, Any]], timestamp: str) -> str:
         """
         Generate CSV report of findings.
         
         Args:
             findings: List of vulnerability findings
+            timestamp: Report generation timestamp used in the filename
             
         Returns:
             Path to the generated CSV file
         """
         try:
             # Define output file path
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             target_domain = self._get_domain(self.config.target_url)
             filename = f"findings_{target_domain}_{timestamp}.csv"
             output_path = os.path.join(self.config.output_dir, filename)
             
+            # pandas is only needed here, so import it on first CSV export
+            import pandas as pd
+            
             # Create a DataFrame from findings
             df = pd.DataFrame(findings)
             
@@ -799,12 +871,13 @@ class ReportGenerator:
             logger.error(f"Error generating CSV report: {e}")
             raise
     
-    def _generate_markdown_report(self, report_data: Dict[str, Any]) -> str:
+    def _generate_markdown_report(self, report_data: Dict[str, Any], timestamp: str) -> str:
         """
         Generate Markdown report.
         
         Args:
             report_data: Report data
+            timestamp: Report generation timestamp used in the filename
             
         Returns:
             Path to the generated Markdown file
@@ -812,20 +885,17 @@ class ReportGenerator:
         try:
             # Load template
             template_name = 'markdown_report.md'
-            template = self.template_env.get_template(template_name)
-            
-            # Render template
-            md_content = template.render(**report_data)
+            template = _get_template(template_name)
             
             # Define output file path
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             target_domain = self._get_domain(report_data['target_url'])
             filename = f"report_{target_domain}_{timestamp}.md"
             output_path = os.path.join(self.config.output_dir, filename)
             
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+            # Render template straight to file in buffered chunks
+            stream = template.stream(**report_data)
+            stream.enable_buffering(size=STREAM_BUFFER_SIZE)
+            stream.dump(output_path, encoding='utf-8')
             
             logger.info(f"Markdown report generated: {output_path}")
             return output_path
@@ -837,13 +907,8 @@ class ReportGenerator:
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL for use in filenames."""
         try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            # Remove port if present
-            if ':' in domain:
-                domain = domain.split(':')[0]
-            # Replace dots with underscores for filename
-            return domain.replace('.', '_')
+            # Remove port if present and replace dots with underscores for filename
+            return urlsplit(url).netloc.partition(':')[0].replace('.', '_') or 'target'
         except Exception:
             # If URL parsing fails, return a safe default
             return 'target'
@@ -886,8 +951,8 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Load scan results from JSON file
-    with open(sys.argv[1], 'r') as f:
-        scan_results = json.load(f)
+    with open(sys.argv[1], 'rb') as f:
+        scan_results = orjson.loads(f.read()) if orjson is not None else json.load(f)
     
     # Get optional arguments
     output_format = sys.argv[2] if len(sys.argv) > 2 else 'html'
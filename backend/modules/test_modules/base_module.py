@@ -3,10 +3,19 @@
 
 import logging
 import abc
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit, quote_plus, SplitResult
 
 logger = logging.getLogger("securescout.test_module")
 
+# Concurrent payload requests allowed per stealth level
+PROBE_WORKERS = {
+    "low": 8,
+    "medium": 4,
+    "high": 1
+}
+
 class BaseTestModule(abc.ABC):
     """
     Base class for all security test modules.
@@ -26,6 +35,7 @@ class BaseTestModule(abc.ABC):
         self.category = "general"
         self.findings = []
         self.severity_levels = ["info", "low", "medium", "high", "critical"]
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
         
     @abc.abstractmethod
     def run(self) -> List[Dict[str, Any]]:
@@ -38,6 +48,85 @@ class BaseTestModule(abc.ABC):
         """
         pass
     
+    def _probe_workers(self) -> int:
+        """Get the number of payloads that may be in flight at once."""
+        workers = PROBE_WORKERS.get(self.scanner.stealth_level, PROBE_WORKERS["medium"])
+        return max(1, min(workers, getattr(self.scanner, 'thread_count', workers)))
+    
+    def _get_probe_executor(self) -> ThreadPoolExecutor:
+        """Get the executor this module sends concurrent payloads with."""
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(max_workers=self._probe_workers())
+        return self._probe_executor
+    
+    def _shutdown_probe_executor(self) -> None:
+        """Shut down the payload executor, cancelling requests still queued."""
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+            self._probe_executor = None
+    
+    def _get_url_template(self, parsed_url: SplitResult, query_params: Dict[str, List[str]],
+                          param: str) -> Tuple[str, str]:
+        """
+        Split a URL around the value of one query parameter.
+        
+        The other parameters are encoded once, so a test URL for any payload
+        is just prefix + encoded payload + suffix.
+        
+        Returns:
+            Tuple of (prefix, suffix)
+        """
+        names = list(query_params)
+        index = names.index(param)
+        before = urlencode([(name, query_params[name]) for name in names[:index]], doseq=True)
+        after = urlencode([(name, query_params[name]) for name in names[index + 1:]], doseq=True)
+        
+        prefix = urlunsplit(parsed_url._replace(query='', fragment='')) + '?'
+        if before:
+            prefix += before + '&'
+        prefix += quote_plus(param) + '='
+        
+        suffix = '&' + after if after else ''
+        if parsed_url.fragment:
+            suffix += '#' + parsed_url.fragment
+        
+        return prefix, suffix
+    
+    def _get_form_url_template(self, form_url: str, form_data: Dict[str, str],
+                               input_name: str) -> Tuple[str, str]:
+        """
+        Split a GET form submission URL around the value of one input.
+        
+        Query parameters already in the action URL are kept unless a form
+        field has the same name, so no parameter is sent twice.
+        
+        Returns:
+            Tuple of (prefix, suffix)
+        """
+        action = urlsplit(form_url)
+        action_params = [
+            (name, value) for name, value in parse_qsl(action.query, keep_blank_values=True)
+            if name not in form_data
+        ]
+        
+        names = list(form_data)
+        index = names.index(input_name)
+        before = urlencode(action_params + [(name, form_data[name]) for name in names[:index]])
+        after = urlencode([(name, form_data[name]) for name in names[index + 1:]])
+        
+        prefix = urlunsplit(action._replace(query='', fragment='')) + '?'
+        if before:
+            prefix += before + '&'
+        prefix += quote_plus(input_name) + '='
+        
+        return prefix, '&' + after if after else ''
+    
+    def _get_form_url(self, form_url: str, form_data: Dict[str, str]) -> str:
+        """Build the URL a GET form submits its data to."""
+        input_name = next(iter(form_data))
+        prefix, suffix = self._get_form_url_template(form_url, form_data, input_name)
+        return prefix + quote_plus(form_data[input_name]) + suffix
+    
     def add_finding(self, title: str, description: str, severity: str, 
                    location: str, evidence: str = None, remediation: str = None,
                    references: List[str] = None, cwe_id: str = None,
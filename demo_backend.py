@@ -2,20 +2,45 @@
 # SecureScout - Demo Backend Server
 
 import os
+import hashlib
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import time
 import random
-import json
 from datetime import datetime, timedelta
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
 
 # Sample data
-scan_history = []
+scan_history = {}
 active_scans = {}
+# Monotonic start times of active scans, keyed by scan id
+scan_clocks = {}
+# Seconds between pushed status events
+STATUS_STREAM_INTERVAL = 0.5
+# Seconds clients may cache the static config endpoints
+CONFIG_MAX_AGE = 3600
 test_findings = [
     {
         "id": "vuln1",
@@ -107,13 +132,14 @@ def start_scan():
     }
     
     active_scans[scan_id] = scan_config
-    scan_history.append({
+    scan_clocks[scan_id] = time.monotonic()
+    scan_history[scan_id] = {
         'id': scan_id,
         'target_url': data.get('target_url'),
         'scan_type': data.get('scan_type', 'comprehensive'),
         'start_time': scan_config['start_time'],
         'status': 'running'
-    })
+    }
     
     # Start progress simulation
     return jsonify({
@@ -125,50 +151,49 @@ def start_scan():
 
 @app.route('/api/scan/status/<scan_id>', methods=['GET'])
 def get_scan_status(scan_id):
-    if scan_id not in active_scans:
+    snapshot = get_scan_snapshot(scan_id)
+    if snapshot is None:
         return jsonify({'error': 'Scan not found'}), 404
     
-    scan_info = active_scans[scan_id]
+    return jsonify(snapshot)
+
+@app.route('/api/scan/stream/<scan_id>', methods=['GET'])
+def stream_scan_status(scan_id):
+    """Push scan status as server-sent events until the scan stops running"""
+    if scan_id not in active_scans:
+        return jsonify({'error': 'Scan not found'}), 404
     
-    # Simulate progress
-    if scan_info['status'] == 'running':
-        elapsed = (datetime.utcnow() - datetime.fromisoformat(scan_info['start_time'])).total_seconds()
-        progress = min(int(elapsed * 5), 100)
-        
-        if progress >= 100:
-            scan_info['status'] = 'completed'
-            scan_info['progress'] = 100
-            scan_info['end_time'] = datetime.utcnow().isoformat()
+    def generate():
+        last_state = None
+        while True:
+            snapshot = get_scan_snapshot(scan_id)
             
-            # Add random findings
-            for finding in test_findings:
-                # Deep copy finding and add it to the results
-                scan_info['findings'].append(json.loads(json.dumps(finding)))
-                
-            # Update scan in history
-            for scan in scan_history:
-                if scan['id'] == scan_id:
-                    scan['status'] = 'completed'
-                    scan['end_time'] = scan_info['end_time']
-                    break
-        else:
-            scan_info['progress'] = progress
+            # The scan was deleted while streaming; tell the client and stop
+            if snapshot is None:
+                yield f"data: {app.json.dumps({'scan_id': scan_id, 'status': 'deleted'})}\n\n"
+                break
+            
+            # Only push an event when something other than the clock changed
+            state = (snapshot['status'], snapshot['progress'], snapshot['findings_count'])
+            if state != last_state:
+                yield f"data: {app.json.dumps(snapshot)}\n\n"
+                last_state = state
+            
+            if snapshot['status'] != 'running':
+                break
+            time.sleep(STATUS_STREAM_INTERVAL)
     
-    return jsonify({
-        'scan_id': scan_id,
-        'status': scan_info['status'],
-        'progress': scan_info['progress'],
-        'target_url': scan_info['target_url'],
-        'start_time': scan_info['start_time'],
-        'elapsed_time': get_elapsed_time(scan_info['start_time']),
-        'findings_count': len(scan_info['findings'])
-    })
+    return app.response_class(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache'}
+    )
 
 @app.route('/api/scan/list', methods=['GET'])
 def list_scans():
     return jsonify({
         'active_scans': list(active_scans.values()),
-        'scan_history': scan_history
+        'scan_history': list(scan_history.values())
     })
 
 @app.route('/api/scan/stop/<scan_id>', methods=['POST'])
@@ -179,10 +204,8 @@ def stop_scan(scan_id):
     active_scans[scan_id]['status'] = 'stopped'
     
     # Update scan in history
-    for scan in scan_history:
-        if scan['id'] == scan_id:
-            scan['status'] = 'stopped'
-            break
+    if scan_id in scan_history:
+        scan_history[scan_id]['status'] = 'stopped'
     
     return jsonify({
         'status': 'success',
@@ -191,16 +214,14 @@ def stop_scan(scan_id):
 
 @app.route('/api/scan/delete/<scan_id>', methods=['DELETE'])
 def delete_scan(scan_id):
-    if scan_id not in active_scans and not any(s['id'] == scan_id for s in scan_history):
+    if scan_id not in active_scans and scan_id not in scan_history:
         return jsonify({'error': 'Scan not found'}), 404
     
-    if scan_id in active_scans:
-        del active_scans[scan_id]
+    active_scans.pop(scan_id, None)
+    scan_clocks.pop(scan_id, None)
     
     # Remove from history
-    updated_history = [s for s in scan_history if s['id'] != scan_id]
-    scan_history.clear()
-    scan_history.extend(updated_history)
+    scan_history.pop(scan_id, None)
     
     return jsonify({
         'status': 'success',
@@ -208,124 +229,171 @@ def delete_scan(scan_id):
     })
 
 # Helper functions
-def get_elapsed_time(start_time_iso):
-    """Calculate elapsed time from ISO format start time to now"""
-    start_time = datetime.fromisoformat(start_time_iso)
-    elapsed = datetime.utcnow() - start_time
-    return str(elapsed).split('.')[0]  # Remove microseconds
+def get_scan_snapshot(scan_id):
+    """Advance the simulated progress of a scan and return its status, or None if it is gone"""
+    scan_info = active_scans.get(scan_id)
+    started = scan_clocks.get(scan_id)
+    if scan_info is None or started is None:
+        return None
+    elapsed = time.monotonic() - started
+    
+    # Simulate progress
+    if scan_info['status'] == 'running':
+        progress = min(int(elapsed * 5), 100)
+        
+        if progress >= 100:
+            scan_info['status'] = 'completed'
+            scan_info['progress'] = 100
+            scan_info['end_time'] = datetime.utcnow().isoformat()
+            
+            # Add the sample findings; they are never mutated, so share them
+            scan_info['findings'].extend(test_findings)
+                
+            # Update scan in history
+            scan = scan_history.get(scan_id)
+            if scan:
+                scan['status'] = 'completed'
+                scan['end_time'] = scan_info['end_time']
+        else:
+            scan_info['progress'] = progress
+    
+    return {
+        'scan_id': scan_id,
+        'status': scan_info['status'],
+        'progress': scan_info['progress'],
+        'target_url': scan_info['target_url'],
+        'start_time': scan_info['start_time'],
+        'elapsed_time': get_elapsed_time(elapsed),
+        'findings_count': len(scan_info['findings'])
+    }
+
+def get_elapsed_time(elapsed_seconds):
+    """Format elapsed seconds as H:MM:SS"""
+    return str(timedelta(seconds=int(elapsed_seconds)))
+
+def serialize_config(payload):
+    """Serialize an immutable config payload once, returning its body and ETag"""
+    body = app.json.dumps(payload)
+    return body, hashlib.sha1(body.encode()).hexdigest()
+
+def config_response(body, etag):
+    """Serve a pre-serialized config body with caching headers"""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = CONFIG_MAX_AGE
+    return response.make_conditional(request)
 
 # Mock profiles
+scan_profiles = {
+    'passive': {
+        'name': 'Passive Scan',
+        'description': 'Non-intrusive information gathering only',
+        'modules': ['discovery', 'ssl_tls', 'headers', 'cookies'],
+        'max_depth': 2,
+        'max_pages': 100,
+        'threads': 5,
+        'request_delay': 1.0,
+        'user_agent_rotation': True,
+        'ip_rotation': False,
+        'stealth_level': 'high'
+    },
+    'standard': {
+        'name': 'Standard Scan',
+        'description': 'Balanced security testing with moderate intrusiveness',
+        'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
+                  'headers', 'cookies', 'sensitive_data'],
+        'max_depth': 3,
+        'max_pages': 200,
+        'threads': 10,
+        'request_delay': 0.5,
+        'user_agent_rotation': True,
+        'ip_rotation': False,
+        'stealth_level': 'medium'
+    },
+    'aggressive': {
+        'name': 'Aggressive Scan',
+        'description': 'Comprehensive security testing with high intrusiveness',
+        'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
+                  'headers', 'cookies', 'sensitive_data', 'brute_force', 'dos_simulation', 
+                  'file_inclusion', 'command_injection', 'deserialization'],
+        'max_depth': 5,
+        'max_pages': 500,
+        'threads': 20,
+        'request_delay': 0.1,
+        'user_agent_rotation': True,
+        'ip_rotation': True,
+        'stealth_level': 'low'
+    },
+    'stealth': {
+        'name': 'Stealth Scan',
+        'description': 'Maximum evasion techniques with balanced testing',
+        'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
+                  'headers', 'cookies', 'sensitive_data'],
+        'max_depth': 3,
+        'max_pages': 200,
+        'threads': 3,
+        'request_delay': 3.0,
+        'user_agent_rotation': True,
+        'ip_rotation': True,
+        'stealth_level': 'maximum'
+    }
+}
+
+_PROFILES_BODY, _PROFILES_ETAG = serialize_config({'status': 'success', 'profiles': scan_profiles})
+
 @app.route('/api/config/profiles', methods=['GET'])
 def get_profiles():
-    profiles = {
-        'passive': {
-            'name': 'Passive Scan',
-            'description': 'Non-intrusive information gathering only',
-            'modules': ['discovery', 'ssl_tls', 'headers', 'cookies'],
-            'max_depth': 2,
-            'max_pages': 100,
-            'threads': 5,
-            'request_delay': 1.0,
-            'user_agent_rotation': True,
-            'ip_rotation': False,
-            'stealth_level': 'high'
-        },
-        'standard': {
-            'name': 'Standard Scan',
-            'description': 'Balanced security testing with moderate intrusiveness',
-            'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
-                      'headers', 'cookies', 'sensitive_data'],
-            'max_depth': 3,
-            'max_pages': 200,
-            'threads': 10,
-            'request_delay': 0.5,
-            'user_agent_rotation': True,
-            'ip_rotation': False,
-            'stealth_level': 'medium'
-        },
-        'aggressive': {
-            'name': 'Aggressive Scan',
-            'description': 'Comprehensive security testing with high intrusiveness',
-            'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
-                      'headers', 'cookies', 'sensitive_data', 'brute_force', 'dos_simulation', 
-                      'file_inclusion', 'command_injection', 'deserialization'],
-            'max_depth': 5,
-            'max_pages': 500,
-            'threads': 20,
-            'request_delay': 0.1,
-            'user_agent_rotation': True,
-            'ip_rotation': True,
-            'stealth_level': 'low'
-        },
-        'stealth': {
-            'name': 'Stealth Scan',
-            'description': 'Maximum evasion techniques with balanced testing',
-            'modules': ['discovery', 'authentication', 'injection', 'xss', 'csrf', 'ssl_tls', 
-                      'headers', 'cookies', 'sensitive_data'],
-            'max_depth': 3,
-            'max_pages': 200,
-            'threads': 3,
-            'request_delay': 3.0,
-            'user_agent_rotation': True,
-            'ip_rotation': True,
-            'stealth_level': 'maximum'
-        }
+    return config_response(_PROFILES_BODY, _PROFILES_ETAG)
+
+scan_modules = {
+    'discovery': {
+        'name': 'Discovery & Enumeration',
+        'description': 'Identifies application structure, endpoints, and technologies',
+        'passive': True
+    },
+    'authentication': {
+        'name': 'Authentication Testing',
+        'description': 'Tests for authentication vulnerabilities like weak passwords',
+        'passive': False
+    },
+    'injection': {
+        'name': 'Injection Vulnerabilities',
+        'description': 'Tests for SQL, NoSQL, and other injection attacks',
+        'passive': False
+    },
+    'xss': {
+        'name': 'Cross-Site Scripting (XSS)',
+        'description': 'Tests for XSS vulnerabilities',
+        'passive': False
+    },
+    'csrf': {
+        'name': 'Cross-Site Request Forgery',
+        'description': 'Tests for CSRF vulnerabilities',
+        'passive': False
+    },
+    'ssl_tls': {
+        'name': 'SSL/TLS Analysis',
+        'description': 'Analyzes SSL/TLS configuration',
+        'passive': True
+    },
+    'headers': {
+        'name': 'HTTP Headers Analysis',
+        'description': 'Tests for missing security headers',
+        'passive': True
+    },
+    'cookies': {
+        'name': 'Cookie Analysis',
+        'description': 'Tests for insecure cookie configurations',
+        'passive': True
     }
-    
-    return jsonify({
-        'status': 'success',
-        'profiles': profiles
-    })
+}
+
+_MODULES_BODY, _MODULES_ETAG = serialize_config({'status': 'success', 'modules': scan_modules})
 
 @app.route('/api/config/modules', methods=['GET'])
 def get_modules():
-    modules = {
-        'discovery': {
-            'name': 'Discovery & Enumeration',
-            'description': 'Identifies application structure, endpoints, and technologies',
-            'passive': True
-        },
-        'authentication': {
-            'name': 'Authentication Testing',
-            'description': 'Tests for authentication vulnerabilities like weak passwords',
-            'passive': False
-        },
-        'injection': {
-            'name': 'Injection Vulnerabilities',
-            'description': 'Tests for SQL, NoSQL, and other injection attacks',
-            'passive': False
-        },
-        'xss': {
-            'name': 'Cross-Site Scripting (XSS)',
-            'description': 'Tests for XSS vulnerabilities',
-            'passive': False
-        },
-        'csrf': {
-            'name': 'Cross-Site Request Forgery',
-            'description': 'Tests for CSRF vulnerabilities',
-            'passive': False
-        },
-        'ssl_tls': {
-            'name': 'SSL/TLS Analysis',
-            'description': 'Analyzes SSL/TLS configuration',
-            'passive': True
-        },
-        'headers': {
-            'name': 'HTTP Headers Analysis',
-            'description': 'Tests for missing security headers',
-            'passive': True
-        },
-        'cookies': {
-            'name': 'Cookie Analysis',
-            'description': 'Tests for insecure cookie configurations',
-            'passive': True
-        }
-    }
-    
-    return jsonify({
-        'status': 'success',
-        'modules': modules
-    })
+    return config_response(_MODULES_BODY, _MODULES_ETAG)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 8001)), debug=True)
\ No newline at end of file
@@ -26,6 +26,12 @@ if [ -z "$VIRTUAL_ENV" ]; then
     fi
 fi
 
+# Run test modules in parallel when pytest-xdist is installed
+PYTEST_PARALLEL=""
+if python -c "import xdist" &> /dev/null; then
+    PYTEST_PARALLEL="-n auto --dist=loadscope"
+fi
+
 # Create temporary directories for tests
 echo "Creating temporary test directories..."
 mkdir -p test_data test_logs test_reports
@@ -34,13 +40,13 @@ mkdir -p test_data test_logs test_reports
 echo "====================================================="
 echo "Running backend unit tests..."
 echo "====================================================="
-pytest tests/unit -v
+pytest tests/unit -v $PYTEST_PARALLEL
 
 # Run integration tests
 echo "====================================================="
 echo "Running integration tests..."
 echo "====================================================="
-pytest tests/integration -v
+pytest tests/integration -v $PYTEST_PARALLEL
 
 # Setup for frontend tests if needed
 if [ -d "frontend" ]; then
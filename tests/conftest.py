@@ -6,6 +6,10 @@ This module provides pytest fixtures and configuration for testing SecureScout.
 
 import os
 import sys
+import asyncio
+import time
+import shutil
+import jwt
 import pytest
 import tempfile
 import sqlite3
@@ -13,16 +17,64 @@ from flask import Flask
 from datetime import datetime, timedelta
 
 # Add backend directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+_PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 
 from backend.app import app as flask_app
 from backend.modules.auth.auth_manager import create_auth_manager, UserRole
 
-@pytest.fixture
+# Keep the throwaway test database in memory-backed storage when available
+TEST_DB_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Scratch directories created for the test session, one set per xdist worker
+_WORKER_SUFFIX = f"_{os.environ['PYTEST_XDIST_WORKER']}" if 'PYTEST_XDIST_WORKER' in os.environ else ''
+TEST_DIRS = tuple(f'{name}{_WORKER_SUFFIX}' for name in ('test_data', 'test_logs', 'test_reports'))
+
+# Seconds before access token expiry at which cached tokens are refreshed
+TOKEN_REFRESH_MARGIN = 60
+
+# Tokens per username, so each user logs in once per test session
+_token_cache = {}
+
+def _get_tokens(auth_manager, username, password):
+    """Return cached tokens for a user, logging in or refreshing only when needed."""
+    tokens = _token_cache.get(username)
+    
+    if tokens is not None:
+        payload = jwt.decode(tokens['access_token'], options={'verify_signature': False})
+        if payload['exp'] > time.time() + TOKEN_REFRESH_MARGIN:
+            return tokens
+        success, tokens, _ = auth_manager.refresh_token(tokens['refresh_token'])
+    else:
+        success, tokens, _ = auth_manager.login(username, password)
+    
+    if not success:
+        _token_cache.pop(username, None)
+        return None
+    
+    _token_cache[username] = tokens
+    return tokens
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        '--on-disk', action='store_true', default=False,
+        help='Also run MemoryAdapter tests against a file-backed database'
+    )
+
+@pytest.fixture(scope='session')
+def event_loop():
+    """Share one event loop across all async tests in the session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope='session')
 def app():
-    """Create and configure a Flask app for testing."""
+    """Create and configure a Flask app shared by the whole test session."""
     # Create a temporary file to use as the test database
-    db_fd, db_path = tempfile.mkstemp()
+    db_fd, db_path = tempfile.mkstemp(suffix='.db', dir=TEST_DB_DIR)
     
     flask_app.config.update({
         'TESTING': True,
@@ -38,9 +90,8 @@ def app():
     })
     
     # Create required test directories
-    os.makedirs('test_data', exist_ok=True)
-    os.makedirs('test_logs', exist_ok=True)
-    os.makedirs('test_reports', exist_ok=True)
+    for directory in TEST_DIRS:
+        os.makedirs(directory, exist_ok=True)
     
     # Initialize the app for testing
     with flask_app.app_context():
@@ -52,7 +103,8 @@ def app():
     # Clean up temporary dirs and database
     os.close(db_fd)
     os.unlink(db_path)
-    os.system('rm -rf test_data test_logs test_reports')
+    for directory in TEST_DIRS:
+        shutil.rmtree(directory, ignore_errors=True)
 
 @pytest.fixture
 def client(app):
@@ -60,9 +112,9 @@ def client(app):
     with app.test_client() as client:
         yield client
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_auth_manager():
-    """Create an auth manager for testing."""
+    """Create an auth manager shared by the whole test session."""
     config = {
         'jwt_secret_key': 'test-jwt-key',
         'access_token_lifetime_minutes': 30,
@@ -70,66 +122,80 @@ def test_auth_manager():
         'create_default_admin': True,
         'default_admin_username': 'admin',
         'default_admin_password': 'TestPassword123!',
-        'default_admin_email': 'admin@test.com'
+        'default_admin_email': 'admin@test.com',
+        'bcrypt_rounds': 4  # Minimum cost; tests don't need production hardness
     }
     return create_auth_manager(config)
 
-@pytest.fixture
+def _get_or_create_user(auth_manager, username, role):
+    """Return an existing test user, creating it on first use."""
+    user = auth_manager.user_manager.get_user(username)
+    if user is not None:
+        return user
+    
+    success, user, _ = auth_manager.user_manager.create_user(
+        username=username,
+        email=f'{username}@test.com',
+        password='TestPassword123!',
+        role=role
+    )
+    return user if success else None
+
+@pytest.fixture(scope='session')
+def seeded_users(test_auth_manager):
+    """Create one user per role, shared by the whole test session.
+    
+    Returns a dict mapping each UserRole to a (user, password) tuple.
+    """
+    success, users, message = test_auth_manager.user_manager.create_users([
+        (f'seeded_{role.name.lower()}', f'seeded_{role.name.lower()}@test.com',
+         'TestPassword123!', role)
+        for role in UserRole
+    ])
+    assert success, message
+    return {user.role: (user, 'TestPassword123!') for user in users}
+
+@pytest.fixture(scope='session')
 def admin_user(test_auth_manager):
-    """Create an admin user for testing."""
+    """Get the default admin user for testing."""
     return test_auth_manager.user_manager.get_user('admin')
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def analyst_user(test_auth_manager):
-    """Create an analyst user for testing."""
-    success, user, _ = test_auth_manager.user_manager.create_user(
-        username='analyst',
-        email='analyst@test.com',
-        password='TestPassword123!',
-        role=UserRole.ANALYST
-    )
-    return user if success else None
+    """Create an analyst user shared by the whole test session."""
+    return _get_or_create_user(test_auth_manager, 'analyst', UserRole.ANALYST)
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def viewer_user(test_auth_manager):
-    """Create a viewer user for testing."""
-    success, user, _ = test_auth_manager.user_manager.create_user(
-        username='viewer',
-        email='viewer@test.com',
-        password='TestPassword123!',
-        role=UserRole.VIEWER
-    )
-    return user if success else None
+    """Create a viewer user shared by the whole test session."""
+    return _get_or_create_user(test_auth_manager, 'viewer', UserRole.VIEWER)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def admin_tokens(test_auth_manager, admin_user):
     """Get tokens for the admin user."""
-    success, tokens, _ = test_auth_manager.login('admin', 'TestPassword123!')
-    return tokens if success else None
+    return _get_tokens(test_auth_manager, 'admin', 'TestPassword123!')
 
-@pytest.fixture
-def analyst_tokens(test_auth_manager):
+@pytest.fixture(scope='module')
+def analyst_tokens(test_auth_manager, analyst_user):
     """Get tokens for an analyst user."""
-    success, tokens, _ = test_auth_manager.login('analyst', 'TestPassword123!')
-    return tokens if success else None
+    return _get_tokens(test_auth_manager, 'analyst', 'TestPassword123!')
 
-@pytest.fixture
-def viewer_tokens(test_auth_manager):
+@pytest.fixture(scope='module')
+def viewer_tokens(test_auth_manager, viewer_user):
     """Get tokens for a viewer user."""
-    success, tokens, _ = test_auth_manager.login('viewer', 'TestPassword123!')
-    return tokens if success else None
+    return _get_tokens(test_auth_manager, 'viewer', 'TestPassword123!')
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def admin_headers(admin_tokens):
     """Get HTTP headers for the admin user."""
     return {'Authorization': f'Bearer {admin_tokens["access_token"]}'}
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def analyst_headers(analyst_tokens):
     """Get HTTP headers for an analyst user."""
     return {'Authorization': f'Bearer {analyst_tokens["access_token"]}'}
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def viewer_headers(viewer_tokens):
     """Get HTTP headers for a viewer user."""
     return {'Authorization': f'Bearer {viewer_tokens["access_token"]}'}
@@ -2,7 +2,6 @@
 Integration test for the authentication flow.
 """
 
-import json
 import pytest
 
 class TestAuthenticationFlow:
@@ -21,7 +20,7 @@ class TestAuthenticationFlow:
         )
         
         assert register_response.status_code == 201
-        register_data = json.loads(register_response.data)
+        register_data = register_response.get_json()
         assert register_data['user']['username'] == 'integration_user'
         
         # Step 2: Login with the new user
@@ -34,7 +33,7 @@ class TestAuthenticationFlow:
         )
         
         assert login_response.status_code == 200
-        login_data = json.loads(login_response.data)
+        login_data = login_response.get_json()
         assert 'access_token' in login_data
         assert 'refresh_token' in login_data
         
@@ -51,7 +50,7 @@ class TestAuthenticationFlow:
         )
         
         assert profile_response.status_code == 200
-        profile_data = json.loads(profile_response.data)
+        profile_data = profile_response.get_json()
         assert profile_data['username'] == 'integration_user'
         
         # Step 4: Refresh the token
@@ -61,7 +60,7 @@ class TestAuthenticationFlow:
         )
         
         assert refresh_response.status_code == 200
-        refresh_data = json.loads(refresh_response.data)
+        refresh_data = refresh_response.get_json()
         assert 'access_token' in refresh_data
         assert refresh_data['access_token'] != access_token
         
@@ -87,7 +86,7 @@ class TestAuthenticationFlow:
         )
         
         assert api_key_response.status_code == 201
-        api_key_data = json.loads(api_key_response.data)
+        api_key_data = api_key_response.get_json()
         assert 'api_key' in api_key_data
         
         api_key = api_key_data['api_key']
@@ -2,7 +2,6 @@
 Tests for the auth controller API endpoints.
 """
 
-import json
 import pytest
 from flask import url_for
 
@@ -12,7 +11,7 @@ class TestAuthController:
     def test_health_endpoint(self, client):
         """Test the health check endpoint."""
         response = client.get('/api/health')
-        data = json.loads(response.data)
+        data = response.get_json()
         
         assert response.status_code == 200
         assert data['status'] == 'ok'
@@ -33,7 +32,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'access_token' in data
         assert 'refresh_token' in data
         assert 'user' in data
@@ -49,7 +48,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 401
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
     def test_register_endpoint(self, client):
@@ -65,7 +64,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'message' in data
         assert data['user']['username'] == 'newuser'
         
@@ -80,7 +79,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
         assert 'exists' in data['error']
     
@@ -95,7 +94,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'access_token' in data
         assert 'refresh_token' in data
         assert data['access_token'] != admin_tokens['access_token']
@@ -109,7 +108,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 401
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
     def test_logout_endpoint(self, client, admin_tokens):
@@ -122,7 +121,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'message' in data
         
         # After logout, refresh token should no longer work
@@ -143,7 +142,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['username'] == 'admin'
         assert 'email' in data
         assert 'role' in data
@@ -161,7 +160,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert isinstance(data, list)
         assert len(data) > 0
         
@@ -188,7 +187,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['user']['username'] == 'createduser'
         assert data['user']['role'] == 'ANALYST'
         
@@ -217,7 +216,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['user']['email'] == 'updated@example.com'
     
     def test_password_update_endpoint(self, client, admin_headers, admin_user):
@@ -232,7 +231,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'message' in data
         
         # Verify new password works
@@ -259,7 +258,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'api_key' in data
         assert data['metadata']['name'] == 'Test API Key'
         
@@ -273,7 +272,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert isinstance(data, list)
         assert len(data) > 0
         
@@ -284,7 +283,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['username'] == admin_user.username
         
         # Revoke API key
@@ -311,7 +310,7 @@ class TestAuthController:
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert isinstance(data, list)
         assert 'ADMIN' in data
         assert 'ANALYST' in data
@@ -322,6 +321,6 @@ class TestAuthController:
         response = client.get('/api/auth/setup-status')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'setup_complete' in data
         assert data['setup_complete'] is True  # Because we have an admin user
\ No newline at end of file
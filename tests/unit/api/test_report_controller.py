@@ -0,0 +1,60 @@
+"""
+Tests for the report controller's background report jobs.
+"""
+
+import time
+import pytest
+from concurrent.futures import Future
+
+from backend.api import report_controller
+
+def _finished_job(result, completed_at=None):
+    """Build a report job whose future has already completed."""
+    future = Future()
+    future.set_result(result)
+    return {'future': future, 'completed_at': completed_at or time.time()}
+
+@pytest.fixture
+def report_jobs():
+    """Give each test an empty job registry."""
+    report_controller.report_jobs.clear()
+    yield report_controller.report_jobs
+    report_controller.report_jobs.clear()
+
+class TestReportJobs:
+    """Tests for report job bookkeeping."""
+    
+    def test_finished_job_removed_after_status(self, app, report_jobs):
+        """Test that a finished job is dropped once its status is reported."""
+        report_jobs['job-1'] = _finished_job(('report_1', '/tmp/report_1.json'))
+        
+        with app.test_request_context():
+            response = report_controller.get_report_status('job-1')
+            assert response.get_json()['status'] == 'completed'
+            assert 'job-1' not in report_jobs
+            
+            response, status_code = report_controller.get_report_status('job-1')
+            assert status_code == 404
+    
+    def test_running_job_kept(self, app, report_jobs):
+        """Test that a running job stays registered while it is polled."""
+        report_jobs['job-1'] = {'future': Future(), 'completed_at': None}
+        
+        with app.test_request_context():
+            response = report_controller.get_report_status('job-1')
+            assert response.get_json()['status'] == 'running'
+            assert 'job-1' in report_jobs
+    
+    def test_unpolled_jobs_expire(self, report_jobs):
+        """Test that finished jobs nobody polls are pruned after the TTL."""
+        now = time.time()
+        report_jobs['stale'] = _finished_job(
+            ('report_1', '/tmp/report_1.json'),
+            completed_at=now - report_controller.REPORT_JOB_TTL - 1
+        )
+        report_jobs['fresh'] = _finished_job(('report_2', '/tmp/report_2.json'), completed_at=now)
+        report_jobs['running'] = {'future': Future(), 'completed_at': None}
+        
+        report_controller.prune_report_jobs(now)
+        
+        assert list(report_jobs) == ['fresh', 'running']
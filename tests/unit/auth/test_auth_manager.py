@@ -6,7 +6,20 @@ import pytest
 import jwt
 from datetime import datetime, timedelta
 
-from backend.modules.auth.auth_manager import create_auth_manager, UserRole
+from backend.modules.auth.auth_manager import create_auth_manager, UserRole, TokenManager
+
+@pytest.fixture(scope='module')
+def sample_tokens(test_auth_manager, seeded_users):
+    """Generate one access and one refresh token for the analyst user."""
+    user, _ = seeded_users[UserRole.ANALYST]
+    token_manager = test_auth_manager.token_manager
+    return {
+        'access': token_manager.generate_access_token(
+            user_id=user.id,
+            permissions=user.role.get_permissions()
+        ),
+        'refresh': token_manager.generate_refresh_token(user_id=user.id)
+    }
 
 class TestAuthManager:
     """Tests for the AuthManager class."""
@@ -32,56 +45,62 @@ class TestAuthManager:
         assert user.email == "test@example.com"
         assert user.role == UserRole.ANALYST
     
-    def test_user_authentication(self, test_auth_manager):
+    def test_bulk_user_creation(self, test_auth_manager):
+        """Test creating several users at once."""
+        user_manager = test_auth_manager.user_manager
+        success, users, message = user_manager.create_users([
+            ("bulkadmin", "bulkadmin@example.com", "StrongP@ssw0rd123", UserRole.ADMIN),
+            ("bulkanalyst", "bulkanalyst@example.com", "StrongP@ssw0rd123", UserRole.ANALYST),
+            ("bulkviewer", "bulkviewer@example.com", "StrongP@ssw0rd123", UserRole.VIEWER)
+        ])
+        
+        assert success is True
+        admin, analyst, viewer = users
+        assert admin.role == UserRole.ADMIN
+        assert analyst.role == UserRole.ANALYST
+        assert viewer.role == UserRole.VIEWER
+        assert user_manager.get_user("bulkanalyst") is analyst
+        assert user_manager.authenticate_user("bulkviewer", "StrongP@ssw0rd123")[0] is True
+        
+        # One rejected spec means no user is created
+        success, users, message = user_manager.create_users([
+            ("bulkother", "bulkother@example.com", "StrongP@ssw0rd123", UserRole.VIEWER),
+            ("bulkweak", "bulkweak@example.com", "weak", UserRole.VIEWER)
+        ])
+        
+        assert success is False
+        assert users == []
+        assert "bulkweak" in message
+        assert user_manager.get_user("bulkother") is None
+    
+    def test_user_authentication(self, test_auth_manager, seeded_users):
         """Test user authentication."""
-        # First create a user
-        test_auth_manager.user_manager.create_user(
-            username="authtest",
-            email="authtest@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.VIEWER
-        )
+        viewer, password = seeded_users[UserRole.VIEWER]
         
-        # Now authenticate
+        # Authenticate
         success, user, message = test_auth_manager.user_manager.authenticate_user(
-            username="authtest",
-            password="StrongP@ssw0rd123"
+            username=viewer.username,
+            password=password
         )
         
         assert success is True
         assert user is not None
-        assert user.username == "authtest"
+        assert user.username == viewer.username
         
         # Test with wrong password
         success, user, message = test_auth_manager.user_manager.authenticate_user(
-            username="authtest",
+            username=viewer.username,
             password="WrongPassword"
         )
         
         assert success is False
         assert user is None
     
-    def test_token_generation(self, test_auth_manager):
+    def test_token_generation(self, test_auth_manager, seeded_users, sample_tokens):
         """Test token generation and validation."""
-        # Create a user
-        success, user, _ = test_auth_manager.user_manager.create_user(
-            username="tokentest",
-            email="token@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.ANALYST
-        )
-        
-        assert success is True
-        
-        # Generate tokens
-        access_token = test_auth_manager.token_manager.generate_access_token(
-            user_id=user.id,
-            permissions=user.role.get_permissions()
-        )
-        
-        refresh_token = test_auth_manager.token_manager.generate_refresh_token(
-            user_id=user.id
-        )
+        user, _ = seeded_users[UserRole.ANALYST]
+        access_token = sample_tokens['access']
+        refresh_token = sample_tokens['refresh']
         
         assert access_token is not None
         assert refresh_token is not None
@@ -99,20 +118,37 @@ class TestAuthManager:
         assert payload['sub'] == user.id
         assert payload['type'] == 'refresh'
     
-    def test_login_flow(self, test_auth_manager):
+    def test_token_cache(self):
+        """Test that decoded tokens are cached until they expire or are revoked."""
+        token_manager = TokenManager(secret_key="test-cache-key")
+        access_token = token_manager.generate_access_token(user_id="user-1")
+        
+        valid, payload, _ = token_manager.validate_token(access_token)
+        assert valid is True
+        assert access_token in token_manager.token_cache
+        
+        # Cached payloads are re-checked against their expiry
+        token_manager.token_cache[access_token]['exp'] = 0
+        valid, payload, error = token_manager.validate_token(access_token)
+        assert valid is False
+        assert "expired" in error
+        assert access_token not in token_manager.token_cache
+        
+        # Revoking a token evicts it from the cache
+        refresh_token = token_manager.generate_refresh_token(user_id="user-1")
+        assert token_manager.validate_token(refresh_token)[0] is True
+        token_manager.blacklist_token(refresh_token)
+        assert refresh_token not in token_manager.token_cache
+        assert token_manager.validate_token(refresh_token)[0] is False
+    
+    def test_login_flow(self, test_auth_manager, seeded_users):
         """Test the complete login flow."""
-        # Create a user
-        test_auth_manager.user_manager.create_user(
-            username="logintest",
-            email="login@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.MANAGER
-        )
+        manager, password = seeded_users[UserRole.MANAGER]
         
         # Login
         success, tokens, message = test_auth_manager.login(
-            username="logintest",
-            password="StrongP@ssw0rd123"
+            username=manager.username,
+            password=password
         )
         
         assert success is True
@@ -127,22 +163,17 @@ class TestAuthManager:
         
         assert valid is True
         assert user is not None
-        assert user.username == "logintest"
+        assert user.username == manager.username
         assert len(permissions) > 0
     
-    def test_refresh_token_flow(self, test_auth_manager):
+    def test_refresh_token_flow(self, test_auth_manager, seeded_users):
         """Test the token refresh flow."""
-        # Create a user and login
-        test_auth_manager.user_manager.create_user(
-            username="refreshtest",
-            email="refresh@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.VIEWER
-        )
+        viewer, password = seeded_users[UserRole.VIEWER]
         
+        # Login
         success, tokens, _ = test_auth_manager.login(
-            username="refreshtest",
-            password="StrongP@ssw0rd123"
+            username=viewer.username,
+            password=password
         )
         
         assert success is True
@@ -158,19 +189,14 @@ class TestAuthManager:
         assert new_tokens['access_token'] != tokens['access_token']
         assert new_tokens['refresh_token'] != tokens['refresh_token']
     
-    def test_logout(self, test_auth_manager):
+    def test_logout(self, test_auth_manager, seeded_users):
         """Test the logout flow."""
-        # Create a user and login
-        test_auth_manager.user_manager.create_user(
-            username="logouttest",
-            email="logout@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.VIEWER
-        )
+        viewer, password = seeded_users[UserRole.VIEWER]
         
+        # Login
         success, tokens, _ = test_auth_manager.login(
-            username="logouttest",
-            password="StrongP@ssw0rd123"
+            username=viewer.username,
+            password=password
         )
         
         assert success is True
@@ -183,74 +209,28 @@ class TestAuthManager:
         refresh_success, _, _ = test_auth_manager.refresh_token(tokens['refresh_token'])
         assert refresh_success is False
     
-    def test_password_policy(self, test_auth_manager):
+    @pytest.mark.parametrize("username,password,expected", [
+        ("weakpass", "Weak1!", "must be at least"),           # Too short
+        ("noupper", "weakpassword123!", "uppercase"),         # No uppercase
+        ("nolower", "WEAKPASSWORD123!", "lowercase"),         # No lowercase
+        ("nonumber", "WeakPassword!", "number"),              # No numbers
+        ("nospecial", "WeakPassword123", "special"),          # No special characters
+    ])
+    def test_password_policy(self, test_auth_manager, username, password, expected):
         """Test password policy enforcement."""
-        # Test with weak password (too short)
         success, _, message = test_auth_manager.user_manager.create_user(
-            username="weakpass",
-            email="weak@example.com",
-            password="Weak1!",
+            username=username,
+            email=f"{username}@example.com",
+            password=password,
             role=UserRole.VIEWER
         )
         
         assert success is False
-        assert "must be at least" in message
-        
-        # Test without uppercase
-        success, _, message = test_auth_manager.user_manager.create_user(
-            username="noupper",
-            email="noupper@example.com",
-            password="weakpassword123!",
-            role=UserRole.VIEWER
-        )
-        
-        assert success is False
-        assert "uppercase" in message
-        
-        # Test without lowercase
-        success, _, message = test_auth_manager.user_manager.create_user(
-            username="nolower",
-            email="nolower@example.com",
-            password="WEAKPASSWORD123!",
-            role=UserRole.VIEWER
-        )
-        
-        assert success is False
-        assert "lowercase" in message
-        
-        # Test without numbers
-        success, _, message = test_auth_manager.user_manager.create_user(
-            username="nonumber",
-            email="nonumber@example.com",
-            password="WeakPassword!",
-            role=UserRole.VIEWER
-        )
-        
-        assert success is False
-        assert "number" in message
-        
-        # Test without special characters
-        success, _, message = test_auth_manager.user_manager.create_user(
-            username="nospecial",
-            email="nospecial@example.com",
-            password="WeakPassword123",
-            role=UserRole.VIEWER
-        )
-        
-        assert success is False
-        assert "special" in message
+        assert expected in message
     
-    def test_api_key_management(self, test_auth_manager):
+    def test_api_key_management(self, test_auth_manager, seeded_users):
         """Test API key creation and validation."""
-        # Create a user
-        success, user, _ = test_auth_manager.user_manager.create_user(
-            username="apitest",
-            email="api@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.ANALYST
-        )
-        
-        assert success is True
+        user, _ = seeded_users[UserRole.ANALYST]
         
         # Create an API key
         api_key, key_metadata = test_auth_manager.user_manager.create_api_key_for_user(
@@ -279,44 +259,29 @@ class TestAuthManager:
         assert valid is False
         assert auth_user is None
     
-    def test_user_role_permissions(self, test_auth_manager):
-        """Test role-based permissions."""
-        # Create users with different roles
-        _, admin, _ = test_auth_manager.user_manager.create_user(
-            username="permadmin",
-            email="permadmin@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.ADMIN
-        )
-        
-        _, analyst, _ = test_auth_manager.user_manager.create_user(
-            username="permanalyst",
-            email="permanalyst@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.ANALYST
-        )
-        
-        _, viewer, _ = test_auth_manager.user_manager.create_user(
-            username="permviewer",
-            email="permviewer@example.com",
-            password="StrongP@ssw0rd123",
-            role=UserRole.VIEWER
-        )
-        
+    @pytest.mark.parametrize("role,permission,expected", [
         # Admin should have all permissions
-        assert admin.has_permission('user:create') is True
-        assert admin.has_permission('user:delete') is True
-        assert admin.has_permission('scan:create') is True
-        assert admin.has_permission('report:create') is True
-        
+        (UserRole.ADMIN, 'user:create', True),
+        (UserRole.ADMIN, 'user:delete', True),
+        (UserRole.ADMIN, 'scan:create', True),
+        (UserRole.ADMIN, 'report:create', True),
         # Analyst should have scan and report permissions but not user management
-        assert analyst.has_permission('scan:create') is True
-        assert analyst.has_permission('report:create') is True
-        assert analyst.has_permission('user:create') is False
-        assert analyst.has_permission('user:delete') is False
-        
+        (UserRole.ANALYST, 'scan:create', True),
+        (UserRole.ANALYST, 'report:create', True),
+        (UserRole.ANALYST, 'user:create', False),
+        (UserRole.ANALYST, 'user:delete', False),
         # Viewer should only have read permissions
-        assert viewer.has_permission('scan:read') is True
-        assert viewer.has_permission('report:read') is True
-        assert viewer.has_permission('scan:create') is False
-        assert viewer.has_permission('report:create') is False
\ No newline at end of file
+        (UserRole.VIEWER, 'scan:read', True),
+        (UserRole.VIEWER, 'report:read', True),
+        (UserRole.VIEWER, 'scan:create', False),
+        (UserRole.VIEWER, 'report:create', False),
+    ])
+    def test_user_role_permissions(self, test_auth_manager, seeded_users, role, permission, expected):
+        """Test role-based permissions, on the role and on a user holding it."""
+        assert role.has_permission(permission) is expected
+        assert (permission in role.get_permissions()) is expected
+        
+        # Permission checks on users go through User.has_permission
+        user, _ = seeded_users[role]
+        assert user.has_permission(permission) is expected
+        assert test_auth_manager.check_permission(user, permission) is expected
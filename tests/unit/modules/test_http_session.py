@@ -0,0 +1,62 @@
+"""
+Tests for the GODMODE shared HTTP session.
+"""
+
+import importlib.util
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+# Loaded from its file: the godmode package __init__ imports every engine
+HTTP_SESSION_PATH = Path(__file__).parents[3] / 'backend' / 'modules' / 'godmode' / 'http_session.py'
+_spec = importlib.util.spec_from_file_location('godmode_http_session', HTTP_SESSION_PATH)
+http_session = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(http_session)
+
+class CookieHandler(BaseHTTPRequestHandler):
+    """Sets a cookie on /login and echoes the request's Cookie header elsewhere."""
+    
+    def do_GET(self):
+        body = (self.headers.get('Cookie') or '').encode()
+        self.send_response(200)
+        if self.path == '/login':
+            self.send_header('Set-Cookie', 'session=admin; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def cookie_server():
+    """Run a local HTTP server for the duration of a test."""
+    server = HTTPServer(('127.0.0.1', 0), CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+class TestHttpSession:
+    """Tests for create_session."""
+    
+    def test_cookies_not_carried_between_probes(self, cookie_server):
+        """Test that a Set-Cookie from one probe is not sent with the next."""
+        session = http_session.create_session()
+        
+        response = session.get(f'{cookie_server}/login', timeout=5)
+        assert 'session=admin' in response.headers['Set-Cookie']
+        
+        response = session.get(f'{cookie_server}/echo', timeout=5)
+        assert response.text == ''
+        assert len(session.cookies) == 0
+    
+    def test_explicit_cookies_still_sent(self, cookie_server):
+        """Test that cookies passed to a single request are still sent."""
+        session = http_session.create_session()
+        
+        response = session.get(f'{cookie_server}/echo', cookies={'probe': '1'}, timeout=5)
+        assert response.text == 'probe=1'
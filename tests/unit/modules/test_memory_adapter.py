@@ -2,37 +2,54 @@
 Tests for the memory adapter module.
 """
 
-import os
+import pickle
 import pytest
-import tempfile
 from datetime import datetime
+from functools import partial
 
 from backend.modules.core.memory_adapter import MemoryAdapter, TaskMasterMemoryManager
 
+# Faster serializer for test databases, which are always trusted
+PICKLE_SERIALIZER = (partial(pickle.dumps, protocol=5), pickle.loads)
+
+def pytest_generate_tests(metafunc):
+    """Run adapter tests in memory, and also on disk when --on-disk is given."""
+    if 'db_backend' in metafunc.fixturenames:
+        backends = ['memory']
+        if metafunc.config.getoption('--on-disk'):
+            backends.append('disk')
+        metafunc.parametrize('db_backend', backends)
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    """Return a database path in the test's own temporary directory."""
+    return str(tmp_path / 'memory.db')
+
+@pytest.fixture
+def serializer():
+    """Value serializer used by memory_adapter; tests may parametrize it."""
+    return 'json'
+
+@pytest.fixture
+def memory_adapter(db_backend, serializer, tmp_path):
+    """Create a memory adapter instance for the selected database backend."""
+    db_path = str(tmp_path / 'memory.db') if db_backend == 'disk' else ':memory:'
+    adapter = MemoryAdapter(db_path=db_path, durable=False, serializer=serializer)
+    yield adapter
+    adapter.close()
+
+@pytest.fixture
+def in_memory_adapter():
+    """Create an in-memory adapter instance."""
+    adapter = MemoryAdapter(db_path=':memory:')
+    yield adapter
+    adapter.close()
+
+
 class TestMemoryAdapter:
     """Tests for the MemoryAdapter class."""
     
-    @pytest.fixture
-    def temp_db_path(self):
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            yield f.name
-        os.unlink(f.name)
-    
-    @pytest.fixture
-    def memory_adapter(self, temp_db_path):
-        """Create a memory adapter instance with a temporary database."""
-        adapter = MemoryAdapter(db_path=temp_db_path)
-        yield adapter
-        adapter.close()
-    
-    @pytest.fixture
-    def in_memory_adapter(self):
-        """Create an in-memory adapter instance."""
-        adapter = MemoryAdapter(db_path=':memory:')
-        yield adapter
-        adapter.close()
-    
+    @pytest.mark.parametrize("serializer", ["json", PICKLE_SERIALIZER], ids=["json", "pickle"])
     def test_set_and_get(self, memory_adapter):
         """Test setting and getting values."""
         # Set a string value
@@ -147,29 +164,33 @@ class TestMemoryAdapter:
     
     def test_concurrency(self, memory_adapter):
         """Test concurrency with multiple operations."""
-        # Set multiple values in quick succession
-        for i in range(100):
-            memory_adapter.set(f'concurrent_{i}', f'value_{i}')
+        # Set multiple values in one batch
+        assert memory_adapter.set_many(
+            {f'concurrent_{i}': f'value_{i}' for i in range(100)}
+        ) is True
+        
+        keys = [f'concurrent_{i}' for i in range(100)]
         
         # Verify all values were set correctly
-        for i in range(100):
-            assert memory_adapter.get(f'concurrent_{i}') == f'value_{i}'
+        assert memory_adapter.get_many(keys) == {
+            f'concurrent_{i}': f'value_{i}' for i in range(100)
+        }
         
-        # Update values in quick succession
-        for i in range(100):
-            memory_adapter.set(f'concurrent_{i}', f'updated_{i}')
+        # Update values in one batch
+        assert memory_adapter.set_many(
+            {f'concurrent_{i}': f'updated_{i}' for i in range(100)}
+        ) is True
         
         # Verify all values were updated correctly
-        for i in range(100):
-            assert memory_adapter.get(f'concurrent_{i}') == f'updated_{i}'
+        assert memory_adapter.get_many(keys) == {
+            f'concurrent_{i}': f'updated_{i}' for i in range(100)
+        }
         
-        # Delete values in quick succession
-        for i in range(100):
-            memory_adapter.delete(f'concurrent_{i}')
+        # Delete values in one batch
+        assert memory_adapter.delete_many(keys) == 100
         
         # Verify all values were deleted
-        for i in range(100):
-            assert memory_adapter.get(f'concurrent_{i}') is None
+        assert memory_adapter.get_many(keys) == {}
 
 
 class TestTaskMasterMemoryManager:
@@ -180,7 +201,6 @@ class TestTaskMasterMemoryManager:
         """Create a memory manager instance with a memory adapter."""
         return TaskMasterMemoryManager(adapter=memory_adapter)
     
-    @pytest.mark.asyncio
     async def test_async_get_set(self, memory_manager):
         """Test the async get and set methods."""
         # Set a value
@@ -195,7 +215,6 @@ class TestTaskMasterMemoryManager:
         value = await memory_manager.get('non_existent')
         assert value is None
     
-    @pytest.mark.asyncio
     async def test_async_delete(self, memory_manager):
         """Test the async delete method."""
         # Set a value
@@ -209,7 +228,6 @@ class TestTaskMasterMemoryManager:
         value = await memory_manager.get('to_delete_async')
         assert value is None
     
-    @pytest.mark.asyncio
     async def test_async_list(self, memory_manager):
         """Test the async list method."""
         # Set values with different prefixes
@@ -231,7 +249,6 @@ class TestTaskMasterMemoryManager:
         assert 'prefix1_key2' in keys
         assert 'prefix2_key1' not in keys
     
-    @pytest.mark.asyncio
     async def test_async_clear(self, memory_manager):
         """Test the async clear method."""
         # Set multiple values
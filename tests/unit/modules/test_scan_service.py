@@ -0,0 +1,77 @@
+"""
+Tests for the scan service, without the Flask request stack.
+"""
+
+import pytest
+
+from backend.modules.core.scan_service import ScanService
+
+MOCK_TARGET_URL = "https://example.com"
+
+# Scan defaults as configured in backend/config.py
+SETTINGS = {
+    'DEFAULT_THREAD_COUNT': 10,
+    'MAX_THREAD_COUNT': 50,
+    'DEFAULT_REQUEST_DELAY': 0.5,
+    'DEFAULT_JITTER': 0.2,
+    'DEFAULT_USER_AGENT_ROTATION': True,
+    'DEFAULT_IP_ROTATION': False
+}
+
+@pytest.fixture
+def scan_service():
+    """Create an empty scan service."""
+    return ScanService()
+
+class TestScanService:
+    """Tests for ScanService."""
+    
+    def test_start_requires_target_url(self, scan_service, admin_user):
+        """Test that a scan without a target URL is rejected."""
+        with pytest.raises(ValueError, match='required'):
+            scan_service.start(admin_user, {'scan_type': 'standard'}, SETTINGS)
+        
+        with pytest.raises(ValueError, match='required'):
+            scan_service.start(admin_user, None, SETTINGS)
+        
+        assert scan_service.active_scans == {}
+        assert scan_service.scan_history == []
+    
+    def test_start_caps_threads(self, scan_service, admin_user):
+        """Test that extreme thread counts are capped."""
+        scan_config = scan_service.start(
+            admin_user,
+            {'target_url': MOCK_TARGET_URL, 'threads': 1000, 'max_depth': 100},
+            SETTINGS
+        )
+        
+        assert scan_config['threads'] == SETTINGS['MAX_THREAD_COUNT']
+    
+    def test_start_defaults(self, scan_service, admin_user):
+        """Test that a scan is registered with configured defaults."""
+        scan_config = scan_service.start(admin_user, {'target_url': MOCK_TARGET_URL}, SETTINGS)
+        scan_id = scan_config['id']
+        
+        assert scan_config['status'] == 'queued'
+        assert scan_config['threads'] == SETTINGS['DEFAULT_THREAD_COUNT']
+        assert scan_config['request_delay'] == SETTINGS['DEFAULT_REQUEST_DELAY']
+        assert scan_service.active_scans[scan_id] is scan_config
+        assert scan_service.scan_ownership[scan_id] == admin_user.id
+        assert scan_service.scan_history[-1]['owner'] == admin_user.username
+    
+    def test_status(self, scan_service, analyst_user):
+        """Test the status summary of a scan."""
+        scan_id = scan_service.start(
+            analyst_user, {'target_url': MOCK_TARGET_URL, 'scan_type': 'quick'}, SETTINGS
+        )['id']
+        
+        status = scan_service.status(scan_id)
+        
+        assert status['scan_id'] == scan_id
+        assert status['status'] == 'queued'
+        assert status['progress'] == 0
+        assert status['target_url'] == MOCK_TARGET_URL
+        assert status['findings_count'] == 0
+        assert 'elapsed_time' in status
+        
+        assert scan_service.status('nonexistent-scan-id') is None
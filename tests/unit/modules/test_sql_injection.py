@@ -0,0 +1,42 @@
+"""
+Tests for the SQL injection module's page comparison.
+"""
+
+from backend.modules.test_modules.sql_injection import page_fingerprint, pages_differ
+
+SEARCH_PAGE = (
+    '<html><body><form><input type="hidden" name="csrf" value="{token}">'
+    '<p>Search our catalog for products</p><small>Generated at {time}</small>'
+    '</form></body></html>'
+)
+
+RESULTS_PAGE = '<html><table>{rows}</table></html>'.format(rows=''.join(
+    f'<tr><td>Product {i}</td><td>In stock, ships in {i % 5 + 1} days</td></tr>' for i in range(40)
+))
+
+class TestPageComparison:
+    """Tests for page_fingerprint and pages_differ."""
+    
+    def test_small_pages_differing_in_token(self):
+        """Test that small pages differing only in a token and timestamp match."""
+        first = SEARCH_PAGE.format(token='9f86d081884c7d659a2feaa0c55ad015',
+                                   time='2026-10-17 03:14:15').encode()
+        second = SEARCH_PAGE.format(token='ZmFrZUNzcmZUb2tlblZhbHVlRm9yVGVzdA==',
+                                    time='2026-10-17 03:14:16').encode()
+        
+        assert pages_differ(page_fingerprint(first), second) is False
+    
+    def test_long_pages_differing_in_token(self):
+        """Test that long pages differing only in a session token match."""
+        page = RESULTS_PAGE + '<span>Session {token}</span>'
+        first = page.format(token='a3f1c9e07b2d4e6f8a0b1c2d3e4f5a6b').encode()
+        second = page.format(token='QmFzZTY0U2Vzc2lvblRva2VuRXhhbXBsZQ').encode()
+        
+        assert pages_differ(page_fingerprint(first), second) is False
+    
+    def test_different_pages(self):
+        """Test that a page with results differs from one without."""
+        search_page = SEARCH_PAGE.format(token='abc123', time='now').encode()
+        
+        assert pages_differ(page_fingerprint(search_page), RESULTS_PAGE.encode()) is True
+        assert pages_differ(page_fingerprint(RESULTS_PAGE.encode()), search_page) is True
@@ -0,0 +1,26 @@
+"""
+Tests for the XSS scanner module.
+"""
+
+from backend.modules.test_modules.xss_scanner import XSSScanner
+
+class TestXSSScanner:
+    """Tests for XSSScanner."""
+    
+    def test_detector_shared_between_scanners(self):
+        """Test that scanners with different tokens reuse one compiled detector."""
+        first = XSSScanner(None)
+        second = XSSScanner(None)
+        
+        assert first.xss_token != second.xss_token
+        assert first.compiled_detector is second.compiled_detector
+    
+    def test_reflection_tied_to_own_token(self):
+        """Test that the shared detector only reports a scanner's own token."""
+        first = XSSScanner(None)
+        second = XSSScanner(None)
+        payload = f"<img src=x onerror=console.log('{first.xss_token}')>"
+        content = f"<html><body>{payload}</body></html>"
+        
+        assert first.check_for_xss_reflection(content, payload) is True
+        assert second.check_for_xss_reflection(content, payload.replace(first.xss_token, second.xss_token)) is False